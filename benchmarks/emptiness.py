@@ -0,0 +1,91 @@
+"""Microbenchmark: the moleculeType emptiness test of the profiles.
+
+Compares ``not model_dump(exclude_unset=True)``, which the profiles used to
+build a dict tree per record, with `resources.elements.is_empty`, over
+`--records` validated moleculeType CodeableConcepts (a pool of distinct
+instances, cycled through).
+
+Usage:
+    python -m benchmarks.emptiness [--records 1000000]
+"""
+
+import argparse
+import gc
+import itertools
+import time
+import tracemalloc
+
+from benchmarks import generators
+
+POOL = 1000
+
+
+def _by_dump(element) -> bool:
+    return not element.model_dump(exclude_unset=True)
+
+
+def _molecule_types(count: int) -> list:
+    from fhir.resources.codeableconcept import CodeableConcept
+
+    concepts = []
+    for index in range(count):
+        data = generators._molecule_type()
+        data["text"] = f"molecule-type-{index}"
+        concepts.append(CodeableConcept.model_validate(data))
+    return concepts
+
+
+def _run(check, concepts: list, records: int) -> float:
+    elements = itertools.islice(itertools.cycle(concepts), records)
+    started = time.perf_counter()
+    for element in elements:
+        check(element)
+    return time.perf_counter() - started
+
+
+def _allocated(check, element) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        check(element)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def measure(records: int = 1_000_000) -> dict:
+    """Returns the time (s) for `records` checks and the peak bytes of one check, per method."""
+    from resources.elements import is_empty
+
+    concepts = _molecule_types(min(POOL, records))
+    for concept in concepts:
+        assert _by_dump(concept) == is_empty(concept)  # noqa: S101
+    return {
+        name: {
+            "seconds": round(_run(check, concepts, records), 3),
+            "peak_bytes": _allocated(check, concepts[0]),
+        }
+        for name, check in (("model_dump", _by_dump), ("is_empty", is_empty))
+    }
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    results = measure(args.records)
+    for name, result in results.items():
+        print(
+            f"{name:12} {result['seconds']:9.3f} s"
+            f"   {result['seconds'] / args.records * 1e6:8.3f} us/record"
+            f"   peak {result['peak_bytes']:6} B/record"
+        )
+    dump, fast = results["model_dump"]["seconds"], results["is_empty"]["seconds"]
+    print(f"is_empty is {dump / fast:.0f}x faster, {dump - fast:.1f} s saved.")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""Synthetic, deterministic FHIR JSON for the benchmarks.
+
+Every generator returns a fresh dict that validates against its profile, so a
+benchmark can validate it without copying it first.
+"""
+
+import random
+
+FOCUS_SYSTEM = "http://hl7.org/fhir/uv/molecular-definition-data-types/CodeSystem/molecular-definition-focus"
+MOLECULE_TYPE_SYSTEM = (
+    "http://hl7.org/fhir/uv/molecular-definition-data-types/CodeSystem/molecule-type"
+)
+
+UNSLICED_FOCUS = "equivalent-state"
+
+FOCUS_DISPLAY = {
+    "allele-state": "Allele State",
+    "context-state": "Context State",
+    "reference-state": "Reference State",
+    "alternative-state": "Alternative State",
+    UNSLICED_FOCUS: "Equivalent State",
+}
+
+
+def bases(length: int, seed: int = 0) -> str:
+    """Returns `length` random DNA bases, the same for a given `seed`."""
+    return "".join(random.Random(seed).choices("ACGT", k=length))  # noqa: S311
+
+
+def _coordinate_system(code: str = "LA30100-4") -> dict:
+    displays = {
+        "LA30100-4": "0-based interval counting",
+        "LA30102-0": "1-based character counting",
+    }
+    return {
+        "system": {
+            "coding": [
+                {"system": "http://loinc.org", "code": code, "display": displays[code]}
+            ]
+        }
+    }
+
+
+def _molecule_type() -> dict:
+    return {
+        "coding": [
+            {"system": MOLECULE_TYPE_SYSTEM, "code": "dna", "display": "DNA Sequence"}
+        ]
+    }
+
+
+def _focus(code: str) -> dict:
+    return {
+        "coding": [
+            {"system": FOCUS_SYSTEM, "code": code, "display": FOCUS_DISPLAY[code]}
+        ]
+    }
+
+
+def _location(start: int, end: int, context: str = "NC_000019.10") -> dict:
+    return {
+        "sequenceLocation": {
+            "sequenceContext": {
+                "reference": f"MolecularDefinition/{context}",
+                "type": "MolecularDefinition",
+                "display": context,
+            },
+            "coordinateInterval": {
+                "coordinateSystem": _coordinate_system(),
+                "startQuantity": {"value": start},
+                "endQuantity": {"value": end},
+            },
+            "strand": {"coding": [{"code": "forward"}]},
+        }
+    }
+
+
+def sequence(length: int = 1000, seed: int = 0) -> dict:
+    """A Sequence whose literal holds `length` bases."""
+    return {
+        "resourceType": "MolecularDefinition",
+        "id": f"sequence-{length}-{seed}",
+        "moleculeType": _molecule_type(),
+        "representation": [{"literal": {"value": bases(length, seed)}}],
+    }
+
+
+def _representations(slices: list[str], count: int, length: int, seed: int) -> list:
+    # Beyond the profile's slices, focus codes outside the slices are allowed.
+    codes = slices[:count] + [UNSLICED_FOCUS] * (count - len(slices))
+    return [
+        {"focus": _focus(code), "literal": {"value": bases(length, seed + index)}}
+        for index, code in enumerate(codes)
+    ]
+
+
+def allele(representations: int = 1, length: int = 1, seed: int = 0) -> dict:
+    """An Allele of `length` bases with `representations` literals.
+
+    The first is the allele-state, the second the context-state, others are
+    outside the slices.
+    """
+    start = 44908683 + seed
+    return {
+        "resourceType": "MolecularDefinition",
+        "id": f"allele-{representations}-{seed}",
+        "moleculeType": _molecule_type(),
+        "location": [_location(start, start + length)],
+        "representation": _representations(
+            ["allele-state", "context-state"], representations, length, seed
+        ),
+    }
+
+
+def variation(representations: int = 2, length: int = 1, seed: int = 0) -> dict:
+    """A Variation of `length` bases with `representations` literals.
+
+    The first two are the reference-state and the alternative-state, the third
+    the context-state, others are outside the slices.
+    """
+    start = 44908683 + seed
+    return {
+        "resourceType": "MolecularDefinition",
+        "id": f"variation-{representations}-{seed}",
+        "identifier": [{"system": "https://www.ncbi.nlm.nih.gov/snp", "value": "rs1"}],
+        "moleculeType": _molecule_type(),
+        "location": [_location(start, start + length)],
+        "representation": _representations(
+            ["reference-state", "alternative-state", "context-state"],
+            representations,
+            length,
+            seed,
+        ),
+    }
+
+
+def molecular_definition(seed: int = 0) -> dict:
+    """A MolecularDefinition using every kind of location and representation."""
+    reference = {"reference": "MolecularDefinition/NC_000019.10"}
+    interval = {"coordinateSystem": _coordinate_system(), "start": 10, "end": 20}
+    return {
+        "resourceType": "MolecularDefinition",
+        "id": f"molecular-definition-{seed}",
+        "moleculeType": _molecule_type(),
+        "type": ["allele"],
+        "location": [
+            _location(1000 + seed, 1010 + seed),
+            {"featureLocation": [{"geneId": [{"coding": [{"code": "HGNC:613"}]}]}]},
+        ],
+        "memberState": [{"reference": "MolecularDefinition/allele-1"}],
+        "representation": [
+            {"literal": {"value": bases(100, seed)}},
+            {
+                "extracted": {
+                    "startingMolecule": reference,
+                    "coordinateInterval": interval,
+                    "reverseComplement": True,
+                }
+            },
+            {"repeated": {"sequenceMotif": reference, "copyCount": 12}},
+            {
+                "concatenated": {
+                    "sequenceElement": [
+                        {"sequence": reference, "ordinalIndex": index}
+                        for index in range(4)
+                    ]
+                }
+            },
+            {
+                "relative": {
+                    "startingMolecule": reference,
+                    "edit": [
+                        {
+                            "editOrder": 1,
+                            "coordinateInterval": interval,
+                            "replacementMolecule": {"reference": "#alt"},
+                            "replacedMolecule": {"reference": "#ref"},
+                        }
+                    ],
+                }
+            },
+        ],
+    }
+
+
+def components(data: dict) -> dict[str, dict]:
+    """Returns the backbone elements of `molecular_definition()` data, by class name."""
+    sequence_location = data["location"][0]["sequenceLocation"]
+    representations = data["representation"]
+    extracted = representations[1]["extracted"]
+    relative = representations[4]["relative"]
+    edit = relative["edit"][0]
+    concatenated = representations[3]["concatenated"]
+    return {
+        "MolecularDefinitionLocation": data["location"][0],
+        "MolecularDefinitionLocationSequenceLocation": sequence_location,
+        "MolecularDefinitionLocationSequenceLocationCoordinateInterval": sequence_location[
+            "coordinateInterval"
+        ],
+        "MolecularDefinitionLocationSequenceLocationCoordinateIntervalCoordinateSystem": sequence_location[
+            "coordinateInterval"
+        ]["coordinateSystem"],
+        "MolecularDefinitionLocationFeatureLocation": data["location"][1][
+            "featureLocation"
+        ][0],
+        "MolecularDefinitionRepresentation": representations[1],
+        "MolecularDefinitionRepresentationLiteral": representations[0]["literal"],
+        "MolecularDefinitionRepresentationExtracted": extracted,
+        "MolecularDefinitionRepresentationExtractedCoordinateInterval": extracted[
+            "coordinateInterval"
+        ],
+        "MolecularDefinitionRepresentationExtractedCoordinateIntervalCoordinateSystem": extracted[
+            "coordinateInterval"
+        ]["coordinateSystem"],
+        "MolecularDefinitionRepresentationRepeated": representations[2]["repeated"],
+        "MolecularDefinitionRepresentationConcatenated": concatenated,
+        "MolecularDefinitionRepresentationConcatenatedSequenceElement": concatenated[
+            "sequenceElement"
+        ][0],
+        "MolecularDefinitionRepresentationRelative": relative,
+        "MolecularDefinitionRepresentationRelativeEdit": edit,
+        "MolecularDefinitionRepresentationRelativeEditCoordinateInterval": edit[
+            "coordinateInterval"
+        ],
+        "MolecularDefinitionRepresentationRelativeEditCoordinateIntervalCoordinateSystem": edit[
+            "coordinateInterval"
+        ]["coordinateSystem"],
+    }
@@ -0,0 +1,81 @@
+"""Cold start benchmark: import time and first validation, in fresh interpreters.
+
+Every measurement runs in a new Python process, so nothing is cached between
+runs except by the operating system. The median of `--repeat` runs is reported.
+
+Usage:
+    python benchmarks/startup.py [--repeat 15] [--module profiles.allele ...]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+MODULES = (
+    "resources.moleculardefinition",
+    "profiles.allele",
+    "profiles.variation",
+    "profiles.sequence",
+)
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+module = __import__({module!r}, fromlist=["_"])
+imported = time.perf_counter()
+profile = next(
+    value for value in vars(module).values()
+    if isinstance(value, type) and value.__module__ == module.__name__
+    and hasattr(value, "model_validate")
+)
+try:
+    profile.model_validate({{"resourceType": "MolecularDefinition"}})
+except Exception:
+    pass
+validated = time.perf_counter()
+json.dump({{"import": imported - started, "first_validation": validated - imported}}, sys.stdout)
+"""
+
+
+def measure(module: str, repeat: int) -> dict:
+    """Returns the median import and first validation time of `module`, in ms."""
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", _PROBE.format(module=module)],
+            capture_output=True,
+            check=True,
+            cwd=SRC,
+            text=True,
+        ).stdout
+        runs.append(json.loads(output))
+    return {
+        key: round(statistics.median(run[key] for run in runs) * 1000, 1)
+        for key in ("import", "first_validation")
+    }
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=15)
+    parser.add_argument("--module", action="append", dest="modules")
+    args = parser.parse_args(argv)
+
+    results = {
+        module: measure(module, args.repeat) for module in args.modules or MODULES
+    }
+    for module, timings in results.items():
+        print(
+            f"{module:32} import {timings['import']:7.1f} ms"
+            f"   first validation {timings['first_validation']:7.1f} ms"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""Benchmark suite: construction, validation and serialization of every class.
+
+For each case (a class and synthetic data from `benchmarks.generators`) it
+measures, per record:
+
+- ``validate``: `model_validate` of the FHIR JSON-like dict,
+- ``dump``: `model_dump`,
+- ``dump_json``: `model_dump_json`,
+- ``json_round_trip``: `model_dump_json` followed by `model_validate_json`,
+- ``peak_kib``: the peak memory allocated while validating one record,
+
+plus the cold import time of the modules (see `benchmarks.startup`).
+
+Results can be saved as a baseline and later runs compared against it: a
+metric more than `--tolerance` above its baseline is reported as a regression
+and makes the run exit with status 1.
+
+Usage:
+    python -m benchmarks.suite --save benchmarks/baseline.json
+    python -m benchmarks.suite --compare benchmarks/baseline.json
+    python -m benchmarks.suite --case variation --quick
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import NamedTuple
+
+from benchmarks import generators, startup
+
+OPERATIONS = ("validate", "dump", "dump_json", "json_round_trip")
+IMPORT_MODULES = startup.MODULES
+
+
+class Case(NamedTuple):
+    """A class to benchmark and the function building its input data."""
+
+    name: str
+    model_class: type
+    data: Callable[[], dict]
+
+
+def cases() -> list[Case]:
+    """Returns every benchmark case: profiles at several sizes, then each class."""
+    import resources.moleculardefinition as moleculardefinition
+    from profiles.allele import Allele
+    from profiles.sequence import Sequence
+    from profiles.variation import Variation
+
+    found = [
+        Case(
+            f"sequence[{length}]",
+            Sequence,
+            lambda length=length: generators.sequence(length),
+        )
+        for length in (100, 10_000, 1_000_000)
+    ]
+    found += [
+        Case(
+            f"allele[{count}]",
+            Allele,
+            lambda count=count: generators.allele(representations=count),
+        )
+        for count in (1, 2, 16)
+    ]
+    found += [
+        Case(
+            f"variation[{count}]",
+            Variation,
+            lambda count=count: generators.variation(representations=count),
+        )
+        for count in (2, 3, 16, 64)
+    ]
+    found.append(
+        Case(
+            "MolecularDefinition",
+            moleculardefinition.MolecularDefinition,
+            generators.molecular_definition,
+        )
+    )
+    for name in generators.components(generators.molecular_definition()):
+        found.append(
+            Case(
+                name,
+                getattr(moleculardefinition, name),
+                lambda name=name: generators.components(
+                    generators.molecular_definition()
+                )[name],
+            )
+        )
+    return found
+
+
+def _per_call(function: Callable, min_time: float, repeat: int) -> float:
+    """Returns the best time of one call of `function`, in microseconds."""
+    timer = timeit.Timer(function)
+    once = timer.timeit(number=1)
+    number = max(1, int(min_time / max(once, 1e-9)))
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number * 1e6
+
+
+def _peak_kib(function: Callable) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak / 1024
+
+
+def measure(case: Case, min_time: float = 0.2, repeat: int = 5) -> dict:
+    """Returns the metrics of one case, times in microseconds per record."""
+    model_class = case.model_class
+    data = case.data()
+    instance = model_class.model_validate(data)
+    payload = instance.model_dump_json()
+    functions = {
+        "validate": lambda: model_class.model_validate(data),
+        "dump": instance.model_dump,
+        "dump_json": instance.model_dump_json,
+        "json_round_trip": lambda: model_class.model_validate_json(
+            instance.model_dump_json()
+        ),
+    }
+    metrics = {
+        operation: round(_per_call(functions[operation], min_time, repeat), 2)
+        for operation in OPERATIONS
+    }
+    metrics["peak_kib"] = round(_peak_kib(lambda: model_class.model_validate(data)), 1)
+    metrics["json_bytes"] = len(payload)
+    return metrics
+
+
+def run(
+    selected: list[str] | None = None,
+    min_time: float = 0.2,
+    repeat: int = 5,
+    import_repeat: int = 5,
+) -> dict:
+    """Runs the suite.
+
+    Args:
+        selected (list[str] | None): Substrings of the case names to run, all if None.
+        min_time (float): Seconds each timing loop should last.
+        repeat (int): Timing loops per metric, the best is kept.
+        import_repeat (int): Fresh interpreters per import time measurement, 0 to skip.
+
+    Returns:
+        dict: ``{"environment": ..., "results": {case: {metric: value}}}``.
+
+    """
+    results = {}
+    for case in cases():
+        if selected and not any(pattern in case.name for pattern in selected):
+            continue
+        started = time.perf_counter()
+        results[case.name] = measure(case, min_time, repeat)
+        print(
+            f"{case.name:80.80} {time.perf_counter() - started:5.1f} s",
+            file=sys.stderr,
+        )
+    if import_repeat:
+        for module in IMPORT_MODULES:
+            timings = startup.measure(module, import_repeat)
+            results[f"import:{module}"] = {
+                "import_ms": timings["import"],
+                "first_validation_ms": timings["first_validation"],
+            }
+    return {"environment": environment(), "results": results}
+
+
+def environment() -> dict:
+    """Describes where the suite ran; comparisons across machines are unreliable."""
+    from importlib.metadata import version
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "pydantic": version("pydantic"),
+        "fhir.resources": version("fhir.resources"),
+        "fhir-core": version("fhir-core"),
+    }
+
+
+class Change(NamedTuple):
+    """A metric of the current run compared with its baseline."""
+
+    case: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def compare(baseline: dict, current: dict, tolerance: float = 0.2) -> Iterator[Change]:
+    """Yields the metrics of `current` more than `tolerance` above `baseline`.
+
+    Metrics only present on one side are ignored; sizes (``json_bytes``) are
+    compared exactly, since they do not depend on the machine.
+    """
+    for case, metrics in current["results"].items():
+        before = baseline["results"].get(case, {})
+        for metric, value in metrics.items():
+            if metric not in before:
+                continue
+            limit = (
+                before[metric]
+                if metric == "json_bytes"
+                else before[metric] * (1 + tolerance)
+            )
+            if value > limit:
+                yield Change(case, metric, before[metric], value)
+
+
+def report(results: dict) -> str:
+    """Formats the results of `run` as a table."""
+    metrics = []
+    for values in results["results"].values():
+        metrics += [metric for metric in values if metric not in metrics]
+    width = max(len(case) for case in results["results"]) if results["results"] else 4
+    lines = [f"{'case':{width}}" + "".join(f" {metric:>19}" for metric in metrics)]
+    for case, values in results["results"].items():
+        cells = "".join(
+            f" {values[metric]:>19}" if metric in values else f" {'':>19}"
+            for metric in metrics
+        )
+        lines.append(f"{case:{width}}{cells}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--case",
+        action="append",
+        dest="cases",
+        help="Run the cases whose name contains CASE.",
+    )
+    parser.add_argument(
+        "--save", type=Path, help="Write the results to this JSON file."
+    )
+    parser.add_argument(
+        "--compare", type=Path, help="Baseline JSON file to compare against."
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="Allowed slowdown, 0.2 is 20%%."
+    )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Short timing loops and no import benchmark.",
+    )
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        results = run(args.cases, min_time=0.02, repeat=3, import_repeat=0)
+    else:
+        results = run(args.cases)
+    print(report(results))
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2) + "\n")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if baseline.get("environment") != results["environment"]:
+            print("\nwarning: the baseline was recorded in another environment.")
+        regressions = list(compare(baseline, results, args.tolerance))
+        for change in regressions:
+            print(
+                f"regression: {change.case} {change.metric} "
+                f"{change.baseline} -> {change.current} ({change.ratio:.2f}x)"
+            )
+        if regressions:
+            return 1
+        print(f"\nno regression above {args.tolerance:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,115 @@
+import re
+from typing import ClassVar
+
+
 class FHIRException(Exception):
-    """Base exception for FHIR-related errors."""
+    """Base exception for FHIR-related errors.
+
+    Besides a plain message, an error can be built from structured fields; its
+    message is then only rendered from the class `template` when it is
+    displayed, so that callers that only inspect the fields never pay for it.
+
+    Args:
+        message (str | None): The message, rendered from `template` if omitted.
+        profile (str | None): Name of the profile that was validated, e.g. ``"Allele"``.
+        element (str | None): Name of the offending element.
+        index (int | None): Position of the offending representation.
+        code (str | None): `code` of the offending Coding.
+        display (str | None): `display` of the offending Coding.
+        expected (str | None): The value the element was expected to have.
+
+    Attributes:
+        error_code (str): Stable identifier of the error, e.g. ``"missing-focus"``.
+
+    """
+
+    FIELDS: ClassVar[tuple[str, ...]] = (
+        "profile",
+        "element",
+        "index",
+        "code",
+        "display",
+        "expected",
+    )
+    error_code: ClassVar[str] = "fhir-exception"
+    template: ClassVar[str | None] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "error_code" not in cls.__dict__:
+            name = cls.__name__.removesuffix("Error")
+            cls.error_code = re.sub(r"(?<!^)(?=[A-Z])", "-", name).lower()
+
+    def __init__(
+        self,
+        message: str | None = None,
+        *,
+        profile: str | None = None,
+        element: str | None = None,
+        index: int | None = None,
+        code: str | None = None,
+        display: str | None = None,
+        expected: str | None = None,
+    ):
+        super().__init__(*(() if message is None else (message,)))
+        self.profile = profile
+        self.element = element
+        self.index = index
+        self.code = code
+        self.display = display
+        self.expected = expected
+
+    @property
+    def fields(self) -> dict:
+        """The structured fields that are set, e.g. ``{"profile": "Allele", "index": 1}``."""
+        return {
+            name: getattr(self, name)
+            for name in self.FIELDS
+            if getattr(self, name) is not None
+        }
+
+    def to_dict(self) -> dict:
+        """Returns the error, its code, fields and rendered message as a dict."""
+        return {
+            "error": type(self).__name__,
+            "code": self.error_code,
+            **self.fields,
+            "message": str(self),
+        }
+
+    def __str__(self) -> str:
+        if self.args or self.template is None:
+            return super().__str__()
+        return self.template.format_map(
+            {name: getattr(self, name) for name in self.FIELDS}
+        )
+
+    def __reduce__(self):
+        # Keyword-only fields are not part of `args`, which is all Exception pickles.
+        return (_rebuild, (type(self), self.args, self.fields))
+
+
+def _rebuild(cls, args, fields):
+    return cls(*args, **fields)
 
 
 class ElementNotAllowedError(FHIRException):
     """Raised when a certain field is disallowed in a profile."""
 
+    template = "`{element}` is not allowed in {profile}."
+
 
 class MemberStateNotAllowedError(FHIRException):
     """Raised when 'memberState' is set in Allele but should not be."""
 
+    template = "`memberState` is not allowed in {profile}."
+
 
 class InvalidMoleculeTypeError(FHIRException):
     """Raised when 'moleculeType' does not meet its 1..1 cardinality requirement."""
 
+    template = "The `moleculeType` field must contain exactly one item. `moleculeType` has a 1..1 cardinality for {profile}."
+
 
 class InvalidTypeError(FHIRException):
     """Raised when 'type' does not meet its 1..1 cardinality requirement."""
@@ -26,6 +123,8 @@ class LocationError(FHIRException):
 class MultipleLocation(LocationError):
     """Raised when 'location' does not meet its 1..1 cardinality requirement."""
 
+    template = "The `location` field must contain exactly one item. `location` has a 1..1 cardinality for {profile}."
+
 
 ####################### Representation ########################################
 class RepresentationError(FHIRException):
@@ -35,6 +134,8 @@ class RepresentationError(FHIRException):
 class MissingRepresentation(RepresentationError):
     """Raised when 'representation' is missing (cardinality 1..*)."""
 
+    template = "The `representation` field must contain one or more items. `representation` has a 1..* cardinality for {profile}."
+
 
 class MissingAlleleState(RepresentationError):
     """Raised when no 'allele-state' is present in 'representation' (cardinality 1..1)."""
@@ -60,18 +161,28 @@ class FocusError(FHIRException):
 class MissingFocus(FocusError):
     """Raised when 'representation.focus' is missing (cardinality 1..1)."""
 
+    template = "representation[{index}].focus is required when slicing by focus CodeableConcept."
+
 
 class MissingFocusCoding(FocusError):
     """Raised when 'focus.coding' is missing or improperly defined in representation."""
 
+    template = "representation[{index}].focus.coding must contain at least one entry."
+
 
 class MissingFocusCodingCode(FocusError):
     """Raised when 'focus.coding.code' is missing (cardinality 1..1)."""
 
+    template = "representation[{index}].focus.coding is missing a 'code' element."
+
 
 class MissingFocusCodingSystem(FocusError):
     """Raised when 'focus.coding.system' is missing (cardinality 1..1)."""
 
+    template = (
+        "representation[{index}].focus.coding (code='{code}') must define 'system'."
+    )
+
 
 class InvalidFocusCodingSystem(FocusError):
     """Raised when 'focus.coding.system' does not match its fixed value."""
@@ -79,3 +190,47 @@ class InvalidFocusCodingSystem(FocusError):
 
 class InvalidFocusCodingDisplay(FocusError):
     """Raised when 'focus.coding.display' does not match its fixed value."""
+
+    template = "The Coding with code='{code}' must have display='{expected}', found '{display}'."
+
+
+####################### Coordinates ###########################################
+class CoordinateError(FHIRException):
+    """Base class for coordinate interval errors."""
+
+
+class UnsupportedCoordinateSystem(CoordinateError):
+    """Raised when a 'coordinateSystem' (system or origin) cannot be interpreted."""
+
+
+class InvalidCoordinateInterval(CoordinateError):
+    """Raised when a coordinate interval is missing a bound or falls outside of its sequence."""
+
+
+####################### Resolution ############################################
+class ResolutionError(FHIRException):
+    """Base class for errors raised while materializing the sequence of a representation."""
+
+
+class UnresolvableReference(ResolutionError):
+    """Raised when a Reference cannot be resolved to a MolecularDefinition or sequence."""
+
+
+class UnsupportedRepresentation(ResolutionError):
+    """Raised when a MolecularDefinition has no representation that can be materialized."""
+
+
+class DuplicateOrdinalIndex(ResolutionError):
+    """Raised when elements of a concatenated representation share an 'ordinalIndex'."""
+
+
+class InvalidCopyCount(ResolutionError):
+    """Raised when a repeated representation has a negative 'copyCount'."""
+
+
+class OverlappingEdits(ResolutionError):
+    """Raised when two edits of a relative representation change the same bases."""
+
+
+class ReplacedSequenceMismatch(ResolutionError):
+    """Raised when the 'replacedMolecule' of an edit differs from the bases it replaces."""
@@ -0,0 +1,365 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from itertools import count
+
+from representations.references import reference_string
+from resources.coordinates import normalize_interval
+
+# Subtrees of at most 2**(_SCAN_LEVEL + 1) intervals are scanned linearly.
+_SCAN_LEVEL = 3
+# Inserted intervals scanned linearly before they are merged into a run.
+_BUFFER = 32
+
+
+class _Run:
+    """A static block of intervals, sorted by start.
+
+    An implicit augmented interval tree is laid over the sorted intervals (as in
+    cgranges): node ``i`` of level ``k`` holds the largest end of its subtree, so
+    an overlap query visits ``O(log n + k)`` nodes. `end_order` sorts the
+    intervals by end, for nearest queries.
+    """
+
+    __slots__ = (
+        "starts",
+        "ends",
+        "serials",
+        "items",
+        "max_ends",
+        "max_level",
+        "end_order",
+        "sorted_ends",
+    )
+
+    def __init__(self, entries: list[tuple[int, int, int, object]]):
+        entries.sort(key=lambda entry: entry[:3])
+        self.starts = [entry[0] for entry in entries]
+        self.ends = [entry[1] for entry in entries]
+        self.serials = [entry[2] for entry in entries]
+        self.items = [entry[3] for entry in entries]
+        self.end_order = sorted(range(len(entries)), key=self.ends.__getitem__)
+        self.sorted_ends = [self.ends[i] for i in self.end_order]
+        self._index()
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def drain(self, removed: set[int]) -> list[tuple[int, int, int, object]]:
+        """Returns ``(start, end, serial, item)`` of the intervals not in `removed`.
+
+        The serials of this run are taken out of `removed`: the run is dropped.
+        """
+        entries = []
+        for entry in zip(self.starts, self.ends, self.serials, self.items, strict=True):
+            if entry[2] in removed:
+                removed.discard(entry[2])
+            else:
+                entries.append(entry)
+        return entries
+
+    def _index(self) -> None:
+        ends = self.ends
+        n = len(ends)
+        max_ends = self.max_ends = list(ends)
+        if not n:
+            self.max_level = 0
+            return
+
+        # The last leaf (even index) bounds the subtrees that run past the end.
+        last_i = (n - 1) & ~1
+        last = max_ends[last_i]
+        k = 1
+        while 1 << k <= n:
+            x = 1 << (k - 1)
+            for i in range((x << 1) - 1, n, x << 2):
+                right = max_ends[i + x] if i + x < n else last
+                max_ends[i] = max(ends[i], max_ends[i - x], right)
+            last_i = last_i - x if last_i >> k & 1 else last_i + x
+            if last_i < n and max_ends[last_i] > last:
+                last = max_ends[last_i]
+            k += 1
+        self.max_level = k - 1
+
+    def _tree_overlaps(self, start: int, end: int) -> Iterator[int]:
+        starts, ends, max_ends = self.starts, self.ends, self.max_ends
+        n = len(starts)
+        if not n:
+            return
+        stack = [(self.max_level, (1 << self.max_level) - 1, False)]
+        while stack:
+            k, x, visited = stack.pop()
+            if k <= _SCAN_LEVEL:
+                i0 = x >> k << k
+                for i in range(i0, min(i0 + (1 << (k + 1)) - 1, n)):
+                    if starts[i] >= end:
+                        break
+                    if start < ends[i]:
+                        yield i
+            elif not visited:
+                stack.append((k, x, True))
+                left = x - (1 << (k - 1))
+                if left >= n or max_ends[left] > start:
+                    stack.append((k - 1, left, False))
+            elif x < n and starts[x] < end:
+                if start < ends[x]:
+                    yield x
+                stack.append((k - 1, x + (1 << (k - 1)), False))
+
+    def overlapping(
+        self, start: int, end: int, removed: set[int]
+    ) -> list[tuple[int, int, int, object]]:
+        """Returns ``(start, end, serial, item)`` of the intervals overlapping ``[start, end)``."""
+        return [
+            (self.starts[i], self.ends[i], self.serials[i], self.items[i])
+            for i in self._tree_overlaps(start, end)
+            if self.serials[i] not in removed
+        ]
+
+    def nearest(
+        self, position: int, removed: set[int]
+    ) -> list[tuple[int, int, object]]:
+        """Returns the intervals ending last before `position` and starting first after it."""
+        starts, ends, serials = self.starts, self.ends, self.serials
+        candidates = []
+        i = bisect_right(self.sorted_ends, position) - 1
+        best = None
+        while i >= 0:
+            index = self.end_order[i]
+            if best is not None and ends[index] != best:
+                break
+            if serials[index] not in removed:
+                best = ends[index]
+                candidates.append((starts[index], ends[index], self.items[index]))
+            i -= 1
+        i = bisect_left(starts, position + 1)
+        best = None
+        while i < len(starts):
+            if best is not None and starts[i] != best:
+                break
+            if serials[i] not in removed:
+                best = starts[i]
+                candidates.append((starts[i], ends[i], self.items[i]))
+            i += 1
+        return candidates
+
+
+class IntervalSet:
+    """The intervals of one sequence.
+
+    The intervals are stored in a few static, sorted runs, each overlaid with an
+    implicit augmented interval tree (see `_Run`), following the logarithmic
+    method: inserted intervals wait in a buffer, which becomes a run once it
+    holds more than `_BUFFER` intervals at the next query, and the newest runs
+    are merged until every run is at least twice as large as the next one.
+    There are thus ``O(log n)`` runs. Removed intervals are only marked, until
+    an eighth of the set is; the next query then merges everything back into a
+    single run.
+
+    For `n` intervals and `k` results:
+
+    - overlap queries take ``O(log² n + k)``, ``O(log n + k)`` after a bulk load
+      (adds before the first query sort once, into a single run) or `rebuild`;
+      marked intervals that overlap are visited too, then dropped;
+    - nearest queries take ``O(log² n + k)``;
+    - an insertion costs ``O(log² n)`` amortized (an interval is merged into a
+      larger run ``O(log n)`` times) and a removal ``O(log n)`` amortized.
+
+    """
+
+    __slots__ = ("runs", "pending", "removed")
+
+    def __init__(self):
+        self.runs: list[_Run] = []
+        self.pending: dict[int, tuple[int, int, object]] = {}
+        self.removed: set[int] = set()
+
+    def __len__(self) -> int:
+        stored = sum(len(run) for run in self.runs)
+        return stored - len(self.removed) + len(self.pending)
+
+    def add(self, serial: int, start: int, end: int, item) -> None:
+        self.pending[serial] = (start, end, item)
+
+    def discard(self, serial: int) -> None:
+        if self.pending.pop(serial, None) is None:
+            self.removed.add(serial)
+
+    def _refresh(self) -> None:
+        runs, removed = self.runs, self.removed
+        if len(removed) > max(_BUFFER, sum(len(run) for run in runs) >> 3):
+            self.rebuild()
+        elif len(self.pending) > _BUFFER:
+            entries = self._take_pending()
+            while runs and len(runs[-1]) < 2 * len(entries):
+                entries += runs.pop().drain(removed)
+            runs.append(_Run(entries))
+
+    def _take_pending(self) -> list[tuple[int, int, int, object]]:
+        entries = [
+            (start, end, serial, item)
+            for serial, (start, end, item) in self.pending.items()
+        ]
+        self.pending.clear()
+        return entries
+
+    def rebuild(self) -> None:
+        """Merges pending changes and every run into a single run."""
+        entries = self._take_pending()
+        for run in self.runs:
+            entries += run.drain(self.removed)
+        self.runs = [_Run(entries)]
+
+    def overlapping(self, start: int, end: int) -> list[tuple[int, int, object]]:
+        """Returns ``(start, end, item)`` of the intervals overlapping ``[start, end)``."""
+        self._refresh()
+        removed = self.removed
+        found = [
+            entry for run in self.runs for entry in run.overlapping(start, end, removed)
+        ]
+        found += [
+            (s, e, serial, item)
+            for serial, (s, e, item) in self.pending.items()
+            if s < end and start < e
+        ]
+        found.sort(key=lambda entry: entry[:3])
+        return [(s, e, item) for s, e, _, item in found]
+
+    def nearest(self, position: int) -> list[tuple[int, int, object]]:
+        """Returns the intervals closest to `position`, all of them on a tie."""
+        overlapping = self.overlapping(position, position + 1)
+        if overlapping:
+            return overlapping
+
+        candidates = list(self.pending.values())
+        for run in self.runs:
+            candidates += run.nearest(position, self.removed)
+        if not candidates:
+            return []
+        distances = [_distance(entry, position) for entry in candidates]
+        closest = min(distances)
+        return [
+            entry
+            for entry, distance in zip(candidates, distances, strict=True)
+            if distance == closest
+        ]
+
+
+def _distance(entry, position: int) -> int:
+    start, end = entry[0], entry[1]
+    return max(start - position, position - end + 1, 0)
+
+
+class IntervalIndex:
+    """An in-memory index of MolecularDefinitions by the intervals of their locations.
+
+    There is one `IntervalSet` per `sequenceContext` reference. Coordinates are
+    normalized through each interval's `coordinateSystem`, and queries take and
+    return 0-based, half-open ``[start, end)`` coordinates.
+
+    Args:
+        records (Iterable[MolecularDefinition]): Resources to index, e.g. Alleles or Variations.
+
+    """
+
+    def __init__(self, records: Iterable = ()):
+        self._sets: dict[str, IntervalSet] = {}
+        self._entries: dict[int, list[tuple[str, int]]] = {}
+        self._serial = count()
+        for record in records:
+            self.add(record)
+
+    @property
+    def contexts(self) -> list[str]:
+        """The `sequenceContext` references that have intervals."""
+        return [context for context, intervals in self._sets.items() if intervals]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, record) -> bool:
+        return id(record) in self._entries
+
+    def add(self, record) -> bool:
+        """Indexes the sequence locations of `record`.
+
+        Raises:
+            InvalidCoordinateInterval: If an interval is missing a bound.
+            UnsupportedCoordinateSystem: If an interval's coordinate system is not supported.
+
+        Returns:
+            bool: Whether `record` has a sequence location with an interval.
+
+        """
+        if id(record) in self._entries:
+            return True
+        entries = []
+        for location in getattr(record, "location", None) or ():
+            sequence_location = location.sequenceLocation
+            if (
+                sequence_location is None
+                or sequence_location.coordinateInterval is None
+            ):
+                continue
+            context = reference_string(sequence_location.sequenceContext)
+            if context is None:
+                continue
+            start, end = normalize_interval(sequence_location.coordinateInterval)
+            serial = next(self._serial)
+            self._sets.setdefault(context, IntervalSet()).add(
+                serial, start, end, record
+            )
+            entries.append((context, serial))
+        if entries:
+            self._entries[id(record)] = entries
+        return bool(entries)
+
+    def remove(self, record) -> None:
+        """Removes `record` from the index.
+
+        Raises:
+            KeyError: If `record` is not indexed.
+
+        """
+        for context, serial in self._entries.pop(id(record)):
+            self._sets[context].discard(serial)
+
+    def _query(self, context: str, start: int, end: int):
+        intervals = self._sets.get(context)
+        return [] if intervals is None else intervals.overlapping(start, end)
+
+    def overlapping(self, context: str, start: int, end: int) -> list:
+        """Returns the records with an interval overlapping ``[start, end)`` on `context`."""
+        return _unique(item for _, _, item in self._query(context, start, end))
+
+    def containing(self, context: str, start: int, end: int) -> list:
+        """Returns the records with an interval that contains ``[start, end)`` on `context`."""
+        return _unique(
+            item
+            for s, e, item in self._query(context, start, max(end, start + 1))
+            if s <= start and end <= e
+        )
+
+    def within(self, context: str, start: int, end: int) -> list:
+        """Returns the records with an interval inside ``[start, end)`` on `context`."""
+        return _unique(
+            item
+            for s, e, item in self._query(context, start, end)
+            if start <= s and e <= end
+        )
+
+    def nearest(self, context: str, position: int) -> list:
+        """Returns the records with the interval closest to `position` on `context`."""
+        intervals = self._sets.get(context)
+        if intervals is None:
+            return []
+        return _unique(item for _, _, item in intervals.nearest(position))
+
+
+def _unique(items: Iterable) -> list:
+    seen = set()
+    unique = []
+    for item in items:
+        if id(item) not in seen:
+            seen.add(id(item))
+            unique.append(item)
+    return unique
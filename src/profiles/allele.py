@@ -1,21 +1,21 @@
+from functools import cached_property
 from typing import ClassVar
 
 from fhir.resources import fhirtypes
 from pydantic import model_validator
 
 from exceptions.fhir import (
-    InvalidFocusCodingDisplay,
     InvalidMoleculeTypeError,
     MemberStateNotAllowedError,
     MissingAlleleState,
-    MissingFocus,
-    MissingFocusCoding,
-    MissingFocusCodingCode,
-    MissingFocusCodingSystem,
     MissingRepresentation,
     MultipleContextState,
     MultipleLocation,
 )
+from profiles.slicing import FocusSlicer, FocusSlices
+from profiles.violations import report_violation
+from resources.elements import is_empty
+from resources.instrumentation import timed
 from resources.moleculardefinition import MolecularDefinition
 
 
@@ -40,10 +40,20 @@ class Allele(MolecularDefinition):
         "allele-state": "Allele State",
         "context-state": "Context State",
     }
+    # Cardinality of each focus slice, checked in this order: code -> (min, max, error)
+    FOCUS_CARDINALITY: ClassVar[dict[str, tuple[int, int, type[Exception]]]] = {
+        "allele-state": (1, 1, MissingAlleleState),
+        "context-state": (0, 1, MultipleContextState),
+    }
+    DERIVED_PROPERTIES: ClassVar[tuple[str, ...]] = (
+        *MolecularDefinition.DERIVED_PROPERTIES,
+        "slices",
+    )
 
     memberState: ClassVar[fhirtypes.ReferenceType | None]  # type: ignore
 
     @model_validator(mode="before")
+    @timed
     def validate_memberState_exclusion(cls, data):
         """Validates that the 'memberState' field is not present in the input values.
 
@@ -58,10 +68,16 @@ class Allele(MolecularDefinition):
 
         """
         if isinstance(data, dict) and "memberState" in data:
-            raise MemberStateNotAllowedError("`memberState` is not allowed in Allele.")
+            report_violation(
+                MemberStateNotAllowedError(profile="Allele"),
+                "$.memberState",
+            )
+            # Only reached while collecting: drops it so the other rules can be checked.
+            data = {key: value for key, value in data.items() if key != "memberState"}
         return data
 
     @model_validator(mode="after")
+    @timed
     def validate_moleculeType(self):
         """Validates that the 'moleculeType' field is present and contains exactly one item.
 
@@ -78,26 +94,26 @@ class Allele(MolecularDefinition):
         mt = getattr(self, "moleculeType", None)
 
         if not mt:
-            raise InvalidMoleculeTypeError(
-                "The `moleculeType` field must contain exactly one item. `moleculeType` has a 1..1 cardinality for Allele."
+            report_violation(
+                InvalidMoleculeTypeError(profile="Allele"),
+                "$.moleculeType",
             )
-        if isinstance(mt, list):
+        elif isinstance(mt, list):
             if len(mt) != 1:
-                raise InvalidMoleculeTypeError(
-                    "The `moleculeType` field must contain exactly one item. `moleculeType` has a 1..1 cardinality for Allele."
+                report_violation(
+                    InvalidMoleculeTypeError(profile="Allele"),
+                    "$.moleculeType",
                 )
-        else:
-            try:
-                if not mt.model_dump(exclude_unset=True):
-                    raise InvalidMoleculeTypeError(
-                        "The `moleculeType` field must contain exactly one item. `moleculeType` has a 1..1 cardinality for Allele."
-                    )
-            except AttributeError:
-                pass
+        elif is_empty(mt):
+            report_violation(
+                InvalidMoleculeTypeError(profile="Allele"),
+                "$.moleculeType",
+            )
 
         return self
 
     @model_validator(mode="after")
+    @timed
     def validate_location_cardinality(self):
         """Validates that the 'location' field contains exactly one item.
 
@@ -112,12 +128,14 @@ class Allele(MolecularDefinition):
 
         """
         if not self.location or len(self.location) != 1:
-            raise MultipleLocation(
-                "The `location` field must contain exactly one item. `location` has a 1..1 cardinality for Allele."
+            report_violation(
+                MultipleLocation(profile="Allele"),
+                "$.location",
             )
         return self
 
     @model_validator(mode="after")
+    @timed
     def validate_representation_cardinality(self):
         """Validates that the 'representation' field contains at least one item.
 
@@ -132,79 +150,36 @@ class Allele(MolecularDefinition):
 
         """
         if not self.representation:
-            raise MissingRepresentation(
-                "The `representation` field must contain one or more items. `representation` has a 1..* cardinality for Allele."
+            report_violation(
+                MissingRepresentation(profile="Allele"),
+                "$.representation",
             )
         return self
 
     @model_validator(mode="after")
+    @timed
     def validate_focus(self):
-        allele_state_count = 0
-        context_state_count = 0
-
-        for idx, rep in enumerate(self.representation):
-            # Focus has a card. of 1..1, must be present in every representation
-            if getattr(rep, "focus", None) is None:
-                raise MissingFocus(
-                    f"representation[{idx}].focus is required when slicing by focus CodeableConcept."
-                )
-            codings = getattr(rep.focus, "coding", None)
-            # coding has a card. of 1..*, must be present in every focus
-            if not codings:
-                raise MissingFocusCoding(
-                    f"representation[{idx}].focus.coding must contain at least one entry."
-                )
+        """Validates the `focus` slicing of 'representation' in a single pass.
 
-            for coding in codings:
-                # card. of code must be 1..1
-                code = getattr(coding, "code", None)
-                # card. of system must be 1..1
-                system = getattr(coding, "system", None)
-                # card. of display must be 1..1
-                display = getattr(coding, "display", None)
-
-                if not code:
-                    raise MissingFocusCodingCode(
-                        f"representation[{idx}].focus.coding is missing a 'code' element."
-                    )
-
-                if code in {"allele-state", "context-state"}:
-                    if not system:
-                        raise MissingFocusCodingSystem(
-                            f"representation[{idx}].focus.coding (code='{code}') must define 'system'."
-                        )
-                    # NOTE: IN some of the examples the fixed values isn't the same as the FOCUS_SYSTEM.
-                    # NOTE: To avoid changing the examples and this we are just going to # it out.
-                    # if system != self.FOCUS_SYSTEM:
-                    #     raise InvalidFocusCodingSystem(
-                    #         f"The Coding with code='{code}' must define a 'system' value as required by the MolDef focus discriminator."
-                    #     )
-
-                    expected_display = self.EXPECTED_DISPLAY.get(code)
-
-                    if display != expected_display:
-                        raise InvalidFocusCodingDisplay(
-                            f"The Coding with code='{code}' must have display='{expected_display}', "
-                            f"found '{display}'."
-                        )
-
-                    if code == "allele-state":
-                        allele_state_count += 1
-                    elif code == "context-state":
-                        context_state_count += 1
-
-        if allele_state_count != 1:
-            raise MissingAlleleState(
-                "Exactly one 'allele-state' must be present across 'representation' (cardinality 1..1)."
-            )
+        Raises:
+            FocusError: If a representation has a missing or invalid `focus`.
+            RepresentationError: If a slice does not meet its cardinality.
 
-        if context_state_count > 1:
-            raise MultipleContextState(
-                "At most one 'context-state' is allowed across 'representation' (cardinality 0..1)."
-            )
+        Returns:
+            BaseModel: The validated model instance if the check passes.
 
+        """
+        # Seeds the `slices` cache so it does not have to rescan 'representation'.
+        self.__dict__["slices"] = FocusSlicer.for_profile(type(self)).slice(
+            self.representation
+        )
         return self
 
+    @cached_property
+    def slices(self) -> FocusSlices:
+        """The 'representation' slices of this Allele, keyed by focus code."""
+        return FocusSlicer.for_profile(type(self)).slice(self.representation)
+
     @classmethod
     def elements_sequence(cls):
         """Returning all elements names from `MolecularDefinition`,
@@ -5,6 +5,10 @@ from pydantic import model_validator
 
 import resources.fhirtypesextra as fhirtypesextra
 from exceptions.fhir import ElementNotAllowedError, InvalidMoleculeTypeError
+from profiles.violations import report_violation
+from resources.elements import is_empty
+from resources.fasta import open_fasta
+from resources.instrumentation import timed
 from resources.moleculardefinition import MolecularDefinition
 
 
@@ -27,16 +31,24 @@ class Sequence(MolecularDefinition):
 
     # Combined validator to exclude both `memberState` and `location` during validation
     @model_validator(mode="before")
+    @timed
     def validate_exclusions(cls, data):
         if isinstance(data, dict):
-            for field in ["memberState", "location"]:
-                if field in data:
-                    raise ElementNotAllowedError(
-                        f"`{field}` is not allowed in Sequence."
-                    )
+            excluded = [field for field in ["memberState", "location"] if field in data]
+            for field in excluded:
+                report_violation(
+                    ElementNotAllowedError(profile="Sequence", element=field),
+                    f"$.{field}",
+                )
+            if excluded:
+                # Only reached while collecting: drops them so the other rules can be checked.
+                data = {
+                    key: value for key, value in data.items() if key not in excluded
+                }
         return data
 
     @model_validator(mode="after")
+    @timed
     def validate_moleculeType(self):
         """Validates that the 'moleculeType' field is present and contains exactly one item.
 
@@ -53,25 +65,66 @@ class Sequence(MolecularDefinition):
         mt = getattr(self, "moleculeType", None)
 
         if not mt:
-            raise InvalidMoleculeTypeError(
-                "The `moleculeType` field must contain exactly one item. `moleculeType` has a 1..1 cardinality for Allele."
+            report_violation(
+                InvalidMoleculeTypeError(profile="Sequence"),
+                "$.moleculeType",
             )
-        if isinstance(mt, list):
+        elif isinstance(mt, list):
             if len(mt) != 1:
-                raise InvalidMoleculeTypeError(
-                    "The `moleculeType` field must contain exactly one item. `moleculeType` has a 1..1 cardinality for Allele."
+                report_violation(
+                    InvalidMoleculeTypeError(profile="Sequence"),
+                    "$.moleculeType",
                 )
-        else:
-            try:
-                if not mt.model_dump(exclude_unset=True):
-                    raise InvalidMoleculeTypeError(
-                        "The `moleculeType` field must contain exactly one item. `moleculeType` has a 1..1 cardinality for Allele."
-                    )
-            except AttributeError:
-                pass
+        elif is_empty(mt):
+            report_violation(
+                InvalidMoleculeTypeError(profile="Sequence"),
+                "$.moleculeType",
+            )
 
         return self
 
+    @classmethod
+    def from_fasta(cls, path, contig: str, **data):
+        """Creates a Sequence whose literal is backed by a memory-mapped FASTA file.
+
+        Only the `.fai` index is read up front; bases are read from the file when
+        the literal is sliced into a `str` or the Sequence is dumped.
+
+        Args:
+            path (str | os.PathLike): Location of the FASTA file (indexed by ``<path>.fai`` if present).
+            contig (str): Name of the contig to represent.
+            **data: Other Sequence elements, e.g. `id` or `moleculeType` (defaults to DNA).
+
+        Raises:
+            KeyError: If `contig` is not in the FASTA index.
+            ValueError: If `data` holds a `representation`, or the FASTA file is empty.
+
+        Returns:
+            Sequence: The Sequence, with a single literal representation.
+
+        """
+        if "representation" in data:
+            raise ValueError(
+                "`representation` cannot be given: it is the literal read from the FASTA file."
+            )
+        value = open_fasta(path).sequence(contig)
+        data.setdefault(
+            "moleculeType",
+            {
+                "coding": [
+                    {
+                        "system": "http://hl7.org/fhir/sequence-type",
+                        "code": "dna",
+                        "display": "DNA Sequence",
+                    }
+                ]
+            },
+        )
+        sequence = cls(**data, representation=[{"literal": {"value": ""}}])
+        # Bypass assignment validation, which only accepts `str`.
+        sequence.representation[0].literal.__dict__["value"] = value
+        return sequence
+
     @classmethod
     def elements_sequence(cls):
         """Returning all elements names from
@@ -0,0 +1,189 @@
+from collections.abc import Iterator, Mapping
+from functools import cache
+
+from exceptions.fhir import (
+    InvalidFocusCodingDisplay,
+    MissingFocus,
+    MissingFocusCoding,
+    MissingFocusCodingCode,
+    MissingFocusCodingSystem,
+)
+from profiles.violations import report_violation
+
+
+class FocusSlices(Mapping):
+    """The `representation` slices of a profile, keyed by focus code.
+
+    Behaves as a read-only mapping from a slice code (e.g. ``"alternative-state"``)
+    to the representation in that slice.
+
+    Attributes:
+        codes (tuple[str | None, ...]): The slice code of every representation, by position.
+            Representations that do not belong to a slice have ``None``.
+
+    """
+
+    __slots__ = ("_members", "_representation", "codes")
+
+    def __init__(self, representation, codes, members):
+        self._representation = representation
+        self._members = members
+        self.codes = codes
+
+    def __getitem__(self, code):
+        return self._representation[self._members[code]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._members)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def index(self, code: str) -> int:
+        """Returns the position of the `code` slice in `representation`."""
+        return self._members[code]
+
+    def __repr__(self) -> str:
+        return f"FocusSlices({self._members!r})"
+
+
+class FocusSlicer:
+    """Slices `representation` by `focus` in a single pass.
+
+    Built once per profile from its `EXPECTED_DISPLAY` (the fixed display of each
+    slice code) and `FOCUS_CARDINALITY` (code -> ``(min, max, exception)``). The
+    cardinality rules are checked in the order they are declared.
+
+    Args:
+        expected_display (dict[str, str]): The fixed `display` of every sliced focus code.
+        cardinality (dict[str, tuple[int, int, type[Exception]]]): Cardinality of every slice.
+        profile (str | None): Name of the profile, reported with every violation.
+
+    """
+
+    def __init__(self, expected_display, cardinality, profile=None):
+        self.profile = profile
+        self.expected_display = dict(expected_display)
+        self.rules = tuple(
+            (code, min_, max_, exception, self._cardinality_message(code, min_, max_))
+            for code, (min_, max_, exception) in cardinality.items()
+        )
+
+    @staticmethod
+    def _cardinality_message(code: str, min_: int, max_: int) -> str:
+        if min_ == max_ == 1:
+            return f"Exactly one '{code}' must be present across 'representation' (cardinality 1..1)."
+        if min_ == 0 and max_ == 1:
+            return f"At most one '{code}' is allowed across 'representation' (cardinality 0..1)."
+        return f"'{code}' must be present {min_} to {max_} times across 'representation' (cardinality {min_}..{max_})."
+
+    @classmethod
+    @cache
+    def for_profile(cls, profile) -> "FocusSlicer":
+        """Returns the slicer of a profile class, building it on first use.
+
+        Args:
+            profile (type[MolecularDefinition]): A profile defining `EXPECTED_DISPLAY` and `FOCUS_CARDINALITY`.
+
+        Returns:
+            FocusSlicer: The slicer shared by every instance of `profile`.
+
+        """
+        return cls(
+            profile.EXPECTED_DISPLAY, profile.FOCUS_CARDINALITY, profile.__name__
+        )
+
+    def slice(self, representation) -> FocusSlices:
+        """Validates the focus of every representation and groups them into slices.
+
+        Args:
+            representation (list[MolecularDefinitionRepresentation]): The representations to slice.
+
+        Raises:
+            MissingFocus: If a representation has no `focus`.
+            MissingFocusCoding: If a `focus` has no `coding`.
+            MissingFocusCodingCode: If a `focus.coding` has no `code`.
+            MissingFocusCodingSystem: If a sliced `focus.coding` has no `system`.
+            InvalidFocusCodingDisplay: If a sliced `focus.coding` does not have its fixed `display`.
+            RepresentationError: The exception declared in the cardinality rules, if a slice is violated.
+
+        Returns:
+            FocusSlices: The representations grouped by slice code.
+
+        """
+        expected_display = self.expected_display
+        counts = dict.fromkeys(expected_display, 0)
+        members = {}
+        codes = []
+
+        for idx, rep in enumerate(representation or ()):
+            # Focus has a card. of 1..1, must be present in every representation
+            focus = rep.focus
+            if focus is None:
+                report_violation(
+                    MissingFocus(profile=self.profile, index=idx),
+                    f"$.representation[{idx}].focus",
+                )
+                codes.append(None)
+                continue
+            # coding has a card. of 1..*, must be present in every focus
+            codings = focus.coding
+            if not codings:
+                report_violation(
+                    MissingFocusCoding(profile=self.profile, index=idx),
+                    f"$.representation[{idx}].focus.coding",
+                )
+                codes.append(None)
+                continue
+
+            slice_code = None
+            for position, coding in enumerate(codings):
+                path = f"$.representation[{idx}].focus.coding[{position}]"
+                code = coding.code
+                if not code:
+                    report_violation(
+                        MissingFocusCodingCode(profile=self.profile, index=idx),
+                        f"{path}.code",
+                    )
+                    continue
+
+                expected = expected_display.get(code)
+                if expected is None:
+                    continue
+
+                if not coding.system:
+                    report_violation(
+                        MissingFocusCodingSystem(
+                            profile=self.profile, index=idx, code=code
+                        ),
+                        f"{path}.system",
+                    )
+                # NOTE: IN some of the examples the fixed values isn't the same as the FOCUS_SYSTEM.
+                # NOTE: To avoid changing the examples the system value itself is not checked.
+
+                if coding.display != expected:
+                    report_violation(
+                        InvalidFocusCodingDisplay(
+                            profile=self.profile,
+                            index=idx,
+                            code=code,
+                            display=coding.display,
+                            expected=expected,
+                        ),
+                        f"{path}.display",
+                    )
+
+                counts[code] += 1
+                members.setdefault(code, idx)
+                if slice_code is None:
+                    slice_code = code
+            codes.append(slice_code)
+
+        for code, min_, max_, exception, message in self.rules:
+            if not min_ <= counts.get(code, 0) <= max_:
+                report_violation(
+                    exception(message, profile=self.profile, code=code),
+                    "$.representation",
+                )
+
+        return FocusSlices(representation, tuple(codes), members)
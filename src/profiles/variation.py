@@ -1,22 +1,22 @@
+from functools import cached_property
 from typing import ClassVar
 
 from fhir.resources import fhirtypes
 from pydantic import model_validator
 
 from exceptions.fhir import (
-    InvalidFocusCodingDisplay,
     InvalidMoleculeTypeError,
     MemberStateNotAllowedError,
     MissingAlternativeState,
-    MissingFocus,
-    MissingFocusCoding,
-    MissingFocusCodingCode,
-    MissingFocusCodingSystem,
     MissingReferenceState,
     MissingRepresentation,
     MultipleContextState,
     MultipleLocation,
 )
+from profiles.slicing import FocusSlicer, FocusSlices
+from profiles.violations import report_violation
+from resources.elements import is_empty
+from resources.instrumentation import timed
 from resources.moleculardefinition import MolecularDefinition
 
 
@@ -40,10 +40,21 @@ class Variation(MolecularDefinition):
         "reference-state": "Reference State",
         "alternative-state": "Alternative State",
     }
+    # Cardinality of each focus slice, checked in this order: code -> (min, max, error)
+    FOCUS_CARDINALITY: ClassVar[dict[str, tuple[int, int, type[Exception]]]] = {
+        "context-state": (0, 1, MultipleContextState),
+        "reference-state": (1, 1, MissingReferenceState),
+        "alternative-state": (1, 1, MissingAlternativeState),
+    }
+    DERIVED_PROPERTIES: ClassVar[tuple[str, ...]] = (
+        *MolecularDefinition.DERIVED_PROPERTIES,
+        "slices",
+    )
 
     memberState: ClassVar[fhirtypes.ReferenceType | None]  # type: ignore
 
     @model_validator(mode="before")
+    @timed
     def validate_memberState_exclusion(cls, data):
         """Validates that the 'memberState' field is not present in the input values.
 
@@ -58,12 +69,16 @@ class Variation(MolecularDefinition):
 
         """
         if isinstance(data, dict) and "memberState" in data:
-            raise MemberStateNotAllowedError(
-                "`memberState` is not allowed in Variation."
+            report_violation(
+                MemberStateNotAllowedError(profile="Variation"),
+                "$.memberState",
             )
+            # Only reached while collecting: drops it so the other rules can be checked.
+            data = {key: value for key, value in data.items() if key != "memberState"}
         return data
 
     @model_validator(mode="after")
+    @timed
     def validate_moleculeType(self):
         """Validates that the 'moleculeType' field is present and contains exactly one item.
 
@@ -80,26 +95,26 @@ class Variation(MolecularDefinition):
         mt = getattr(self, "moleculeType", None)
 
         if mt is None:
-            raise InvalidMoleculeTypeError(
-                "The `moleculeType` field must contain exactly one item. `moleculeType` has a 1..1 cardinality for Variation."
+            report_violation(
+                InvalidMoleculeTypeError(profile="Variation"),
+                "$.moleculeType",
             )
-        if isinstance(mt, list):
+        elif isinstance(mt, list):
             if len(mt) != 1:
-                raise InvalidMoleculeTypeError(
-                    "The `moleculeType` field must contain exactly one item. `moleculeType` has a 1..1 cardinality for Variation."
+                report_violation(
+                    InvalidMoleculeTypeError(profile="Variation"),
+                    "$.moleculeType",
                 )
-        else:
-            try:
-                if not mt.model_dump(exclude_unset=True):
-                    raise InvalidMoleculeTypeError(
-                        "The `moleculeType` field must contain exactly one item. `moleculeType` has a 1..1 cardinality for Variation."
-                    )
-            except AttributeError:
-                pass
+        elif is_empty(mt):
+            report_violation(
+                InvalidMoleculeTypeError(profile="Variation"),
+                "$.moleculeType",
+            )
 
         return self
 
     @model_validator(mode="after")
+    @timed
     def validate_location_cardinality(self):
         """Validates that the 'location' field contains exactly one item.
 
@@ -114,12 +129,14 @@ class Variation(MolecularDefinition):
 
         """
         if not self.location or len(self.location) != 1:
-            raise MultipleLocation(
-                "The `location` field must contain exactly one item. `location` has a 1..1 cardinality for Variation."
+            report_violation(
+                MultipleLocation(profile="Variation"),
+                "$.location",
             )
         return self
 
     @model_validator(mode="after")
+    @timed
     def validate_representation_cardinality(self):
         """Validates that the 'representation' field contains at least one item.
 
@@ -134,86 +151,36 @@ class Variation(MolecularDefinition):
 
         """
         if not self.representation:
-            raise MissingRepresentation(
-                "The `representation` field must contain one or more items. `representation` has a 1..* cardinality for Variation."
+            report_violation(
+                MissingRepresentation(profile="Variation"),
+                "$.representation",
             )
         return self
 
     @model_validator(mode="after")
+    @timed
     def validate_focus(self):
-        context_state_count = 0
-        reference_state_count = 0
-        alternative_state_count = 0
-
-        for idx, rep in enumerate(self.representation):
-            # check for focus must be present
-            if getattr(rep, "focus", None) is None:
-                raise MissingFocus(
-                    f"representation[{idx}].focus is required when slicing by focus CodeableConcept."
-                )
-            # Check if coding is present
-            codings = getattr(rep.focus, "coding", None)
-            if not codings:
-                raise MissingFocusCoding(
-                    f"representation[{idx}].focus.coding must contain at least one entry."
-                )
+        """Validates the `focus` slicing of 'representation' in a single pass.
 
-            for coding in codings:
-                code = getattr(coding, "code", None)
-                system = getattr(coding, "system", None)
-                display = getattr(coding, "display", None)
-
-                # check if coding is present
-                if code is None:
-                    raise MissingFocusCodingCode(
-                        f"representation[{idx}].focus.coding is missing a 'code' element."
-                    )
-
-                if code in {"context-state", "reference-state", "alternative-state"}:
-                    if not system:
-                        raise MissingFocusCodingSystem(
-                            f"representation[{idx}].focus.coding (code='{code}') must define 'system'."
-                        )
-
-                    # NOTE: IN some of the examples the fixed values isn't the same as the FOCUS_SYSTEM.
-                    # NOTE: To avoid changing the examples and this we are just going to # it out.
-                    # if system != self.FOCUS_SYSTEM:
-                    #     raise InvalidFocusCodingSystem(
-                    #         f"The Coding with code='{code}' must define a 'system' value as required by the MolDef focus discriminator."
-                    #     )
-
-                    expected_display = self.EXPECTED_DISPLAY.get(code)
-
-                    if display != expected_display:
-                        raise InvalidFocusCodingDisplay(
-                            f"The Coding with code='{code}' must have display='{expected_display}', "
-                            f"found '{display}'."
-                        )
-
-                    if code == "context-state":
-                        context_state_count += 1
-                    elif code == "reference-state":
-                        reference_state_count += 1
-                    elif code == "alternative-state":
-                        alternative_state_count += 1
-
-        if context_state_count > 1:
-            raise MultipleContextState(
-                "At most one 'context-state' is allowed across 'representation' (cardinality 0..1)."
-            )
-
-        if reference_state_count != 1:
-            raise MissingReferenceState(
-                "Exactly one 'reference-state' must be present across 'representation' (cardinality 1..1)."
-            )
+        Raises:
+            FocusError: If a representation has a missing or invalid `focus`.
+            RepresentationError: If a slice does not meet its cardinality.
 
-        if alternative_state_count != 1:
-            raise MissingAlternativeState(
-                "Exactly one 'alternative-state' must be present across 'representation' (cardinality 1..1)."
-            )
+        Returns:
+            BaseModel: The validated model instance if the check passes.
 
+        """
+        # Seeds the `slices` cache so it does not have to rescan 'representation'.
+        self.__dict__["slices"] = FocusSlicer.for_profile(type(self)).slice(
+            self.representation
+        )
         return self
 
+    @cached_property
+    def slices(self) -> FocusSlices:
+        """The 'representation' slices of this Variation, keyed by focus code."""
+        return FocusSlicer.for_profile(type(self)).slice(self.representation)
+
     @classmethod
     def elements_sequence(cls):
         """Returning all elements names from `MolecularDefinition`,
@@ -0,0 +1,74 @@
+import dataclasses
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from exceptions.fhir import FHIRException
+
+_collector: ContextVar[list | None] = ContextVar("violations", default=None)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Violation:
+    """A profile rule a record breaks.
+
+    Attributes:
+        path (str): JSON path of the offending element, e.g. ``$.representation[1].focus``.
+        exception (FHIRException): The exception the rule raises outside of `collecting`.
+
+    """
+
+    path: str
+    exception: FHIRException
+
+    @property
+    def error(self) -> str:
+        """Name of the exception class, e.g. ``"MissingFocus"``."""
+        return type(self.exception).__name__
+
+    @property
+    def code(self) -> str:
+        """Stable identifier of the violated rule, e.g. ``"missing-focus"``."""
+        return self.exception.error_code
+
+    @property
+    def message(self) -> str:
+        """Human readable description of the violation."""
+        return str(self.exception)
+
+
+def report_violation(exception: FHIRException, path: str) -> None:
+    """Raises `exception`, or records it while violations are being collected.
+
+    Profile validators call this for every rule a record breaks. When it
+    returns, the validator must skip what depends on the offending element and
+    carry on with its other checks.
+
+    Args:
+        exception (FHIRException): The violation.
+        path (str): JSON path of the offending element.
+
+    Raises:
+        FHIRException: `exception`, unless called inside `collecting()`.
+
+    """
+    violations = _collector.get()
+    if violations is None:
+        raise exception
+    violations.append(Violation(path, exception))
+
+
+@contextmanager
+def collecting() -> Iterator[list[Violation]]:
+    """Collects, instead of raising, the profile violations of the records validated in the block.
+
+    Yields:
+        list[Violation]: The violations, in the order they are found.
+
+    """
+    violations = []
+    token = _collector.set(violations)
+    try:
+        yield violations
+    finally:
+        _collector.reset(token)
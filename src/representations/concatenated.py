@@ -0,0 +1,86 @@
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from itertools import accumulate
+
+from exceptions.fhir import DuplicateOrdinalIndex
+from resources.sequenceview import SequenceView
+
+
+class ConcatenatedSequence(SequenceView):
+    """A rope-like view over the concatenation of several sequences.
+
+    The parts are never joined as a whole: a prefix sum of their lengths locates
+    the part holding any position by binary search, and decoding or slicing only
+    touches the parts that overlap the requested range.
+
+    Args:
+        parts (Iterable[str | SequenceView]): The sequences, in order.
+
+    """
+
+    __slots__ = ("parts", "offsets")
+
+    def __init__(self, parts: Iterable):
+        self.parts = tuple(part for part in parts if len(part))
+        # offsets[i] is the position of the first base of parts[i]; the last is the length.
+        self.offsets = (0, *accumulate(len(part) for part in self.parts))
+
+    def __len__(self) -> int:
+        return self.offsets[-1]
+
+    def locate(self, position: int) -> tuple[int, int]:
+        """Returns ``(part index, offset in that part)`` of the base at `position`."""
+        index = bisect_right(self.offsets, position) - 1
+        return index, position - self.offsets[index]
+
+    def _pieces(self, start: int, stop: int) -> Iterator:
+        if start >= stop:
+            return
+        index, offset = self.locate(start)
+        while start < stop:
+            part = self.parts[index]
+            take = min(len(part) - offset, stop - start)
+            yield part[offset : offset + take]
+            start += take
+            index += 1
+            offset = 0
+
+    def _decode(self, start: int, stop: int) -> str:
+        return "".join(str(piece) for piece in self._pieces(start, stop))
+
+    def _slice(self, start: int, stop: int) -> "ConcatenatedSequence":
+        return ConcatenatedSequence(self._pieces(start, stop))
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            length = len(self)
+            if key < 0:
+                key += length
+            if not 0 <= key < length:
+                raise IndexError(f"{type(self).__name__} index out of range")
+            index, offset = self.locate(key)
+            return self.parts[index][offset]
+        return super().__getitem__(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for part in self.parts:
+            yield from str(part)
+
+    def __repr__(self) -> str:
+        return f"ConcatenatedSequence(parts={len(self.parts)}, length={len(self)})"
+
+
+def ordered_elements(concatenated) -> list:
+    """Returns the `sequenceElement` of a concatenated representation by `ordinalIndex`.
+
+    Raises:
+        DuplicateOrdinalIndex: If two elements share an `ordinalIndex`.
+
+    """
+    elements = sorted(concatenated.sequenceElement or (), key=lambda e: e.ordinalIndex)
+    for previous, element in zip(elements, elements[1:], strict=False):
+        if previous.ordinalIndex == element.ordinalIndex:
+            raise DuplicateOrdinalIndex(
+                f"More than one `sequenceElement` has the ordinalIndex {element.ordinalIndex}."
+            )
+    return elements
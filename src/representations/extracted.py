@@ -0,0 +1,76 @@
+from exceptions.fhir import InvalidCoordinateInterval
+from resources.coordinates import normalize_interval
+from resources.sequenceview import SequenceView
+
+# IUPAC complement of every nucleotide code, upper and lower case.
+COMPLEMENT = str.maketrans(
+    "ACGTURYSWKMBDHVNacgturyswkmbdhvn",
+    "TGCAAYRSWMKVHDBNtgcaayrswmkvhdbn",
+)
+# The same table for ASCII bytes.
+_ASCII_COMPLEMENT = bytes.maketrans(bytes(COMPLEMENT), bytes(COMPLEMENT.values()))
+
+
+def reverse_complement(bases) -> str:
+    """Returns the reverse complement of `bases`, translated through `COMPLEMENT`.
+
+    ASCII bases are complemented and reversed in a single bytearray, rather
+    than through a reversed copy of the string.
+    """
+    bases = str(bases)
+    try:
+        buffer = bytearray(bases, "ascii")
+    except UnicodeEncodeError:
+        return bases[::-1].translate(COMPLEMENT)
+    buffer = buffer.translate(_ASCII_COMPLEMENT)
+    buffer.reverse()
+    return buffer.decode("ascii")
+
+
+def extracted_interval(extracted) -> tuple[int, int] | None:
+    """Returns the 0-based, half-open interval of an extracted representation.
+
+    Args:
+        extracted (MolecularDefinitionRepresentationExtracted): The representation.
+
+    Returns:
+        tuple[int, int] | None: ``(start, end)``, or None when the whole starting
+        molecule is extracted.
+
+    """
+    interval = extracted.coordinateInterval
+    if interval is None:
+        return None
+    return normalize_interval(interval)
+
+
+def extract(
+    bases: str | SequenceView,
+    interval: tuple[int, int] | None,
+    reverse: bool = False,
+) -> str | SequenceView:
+    """Extracts ``[start, end)`` of `bases`, reverse complemented if asked.
+
+    On the forward strand a `SequenceView` is sliced without being decoded; only
+    the extracted bases are ever read from it.
+
+    Args:
+        bases (str | SequenceView): The sequence of the starting molecule.
+        interval (tuple[int, int] | None): 0-based, half-open interval, None for all of `bases`.
+        reverse (bool): Whether to reverse complement the extracted bases.
+
+    Raises:
+        InvalidCoordinateInterval: If the interval does not fit in `bases`.
+
+    Returns:
+        str | SequenceView: The extracted bases.
+
+    """
+    if interval is not None:
+        start, end = interval
+        if start < 0 or end > len(bases):
+            raise InvalidCoordinateInterval(
+                f"The interval [{start}, {end}) is outside of the starting molecule (length {len(bases)})."
+            )
+        bases = bases[start:end]
+    return reverse_complement(bases) if reverse else bases
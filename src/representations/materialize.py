@@ -0,0 +1,216 @@
+from collections.abc import Callable, Mapping
+
+from exceptions.fhir import (
+    InvalidCoordinateInterval,
+    InvalidCopyCount,
+    UnresolvableReference,
+    UnsupportedRepresentation,
+)
+from representations.cache import LRUCache
+from representations.concatenated import ConcatenatedSequence, ordered_elements
+from representations.extracted import extract, extracted_interval
+from representations.references import ReferenceResolver, reference_string
+from representations.relative import Edit, EditResult, apply_edits
+from representations.repeated import PeriodicSequence
+from resources.coordinates import normalize_interval
+from resources.sequenceview import SequenceView
+
+
+class Materializer:
+    """Turns the representations of MolecularDefinitions into their bases.
+
+    Referenced molecules (e.g. `startingMolecule`) are looked up through
+    `resolve`, which may return either a MolecularDefinition, whose own
+    representations are then materialized, or its bases directly.
+
+    A `ReferenceResolver` is given the resource holding a local ``#id``
+    reference (`container`), so one Materializer can serve resources that each
+    contain their own ``#id``. Other callables and mappings only see the
+    reference: a local reference then names the same molecule in every resource.
+
+    Args:
+        resolve (Callable | Mapping): A `ReferenceResolver`, a callable called
+            with a Reference, or a mapping keyed by the `reference` string.
+        cache_size (int): Number of materialized representations kept.
+
+    """
+
+    def __init__(self, resolve: Callable | Mapping, cache_size: int = 1024):
+        self._scoped = isinstance(resolve, ReferenceResolver)
+        if isinstance(resolve, Mapping):
+            mapping = resolve
+            self._resolve = lambda reference, _: mapping[reference_string(reference)]
+        elif self._scoped:
+            self._resolve = resolve.resolve
+        else:
+            self._resolve = lambda reference, _: resolve(reference)
+        self.cache = LRUCache(cache_size)
+
+    def _owner(self, molecule: str | None, container):
+        # The resource a cached result depends on, besides the reference itself.
+        if self._scoped and molecule is not None and molecule.startswith("#"):
+            return container
+        return None
+
+    def resolve(self, reference, container=None) -> str | SequenceView:
+        """Returns the bases of the molecule `reference` points to.
+
+        Args:
+            reference (Reference): The reference.
+            container (Resource | None): The resource holding local ``#id`` references.
+
+        Raises:
+            UnresolvableReference: If `reference` cannot be resolved.
+            UnsupportedRepresentation: If the molecule cannot be materialized.
+
+        """
+        try:
+            target = self._resolve(reference, container)
+        except LookupError:
+            target = None
+        if target is None:
+            raise UnresolvableReference(
+                f"The reference `{reference_string(reference)}` could not be resolved."
+            )
+        if isinstance(target, str | SequenceView):
+            return target
+        return self.sequence(target, container)
+
+    def sequence(self, moldef, container=None) -> str | SequenceView:
+        """Returns the bases of a MolecularDefinition.
+
+        The first representation that can be materialized is used. Local
+        references are resolved in `moldef` when it has `contained` resources,
+        in `container` otherwise.
+
+        Raises:
+            UnsupportedRepresentation: If no representation can be materialized.
+
+        """
+        if getattr(moldef, "contained", None):
+            container = moldef
+        for representation in moldef.representation or ():
+            bases = self.representation(representation, container)
+            if bases is not None:
+                return bases
+        raise UnsupportedRepresentation(
+            f"MolecularDefinition `{moldef.id}` has no representation that can be materialized."
+        )
+
+    def representation(
+        self, representation, container=None
+    ) -> str | SequenceView | None:
+        """Returns the bases of one representation, None if it has no supported form."""
+        literal = representation.literal
+        if literal is not None and literal.value is not None:
+            return literal.value
+        if representation.extracted is not None:
+            return self.extracted(representation.extracted, container)
+        if representation.concatenated is not None:
+            return self.concatenated(representation.concatenated, container)
+        if representation.repeated is not None:
+            return self.repeated(representation.repeated, container)
+        if representation.relative is not None:
+            return self.relative(representation.relative, container).sequence
+        return None
+
+    def extracted(self, extracted, container=None) -> str | SequenceView:
+        """Returns the bases of an extracted representation.
+
+        Results are cached per (startingMolecule, interval, strand), and per
+        `container` for local references resolved by a `ReferenceResolver`.
+
+        Raises:
+            InvalidCoordinateInterval: If the interval does not fit the starting molecule.
+            UnresolvableReference: If `startingMolecule` cannot be resolved.
+            UnsupportedCoordinateSystem: If the interval's coordinate system is not supported.
+
+        """
+        interval = extracted_interval(extracted)
+        reverse = bool(extracted.reverseComplement)
+        molecule = reference_string(extracted.startingMolecule)
+        owner = self._owner(molecule, container)
+        key = (
+            None
+            if molecule is None
+            else ("extracted", id(owner), molecule, interval, reverse)
+        )
+
+        if key is not None:
+            # The entry holds its owner, so that its id() is not reused meanwhile.
+            entry = self.cache.get(key)
+            if entry is not None and entry[0] is owner:
+                return entry[1]
+
+        bases = extract(
+            self.resolve(extracted.startingMolecule, container), interval, reverse
+        )
+        if key is not None:
+            self.cache.put(key, (owner, bases))
+        return bases
+
+    def concatenated(self, concatenated, container=None) -> ConcatenatedSequence:
+        """Returns a lazy view over the elements of a concatenated representation.
+
+        The elements are taken in `ordinalIndex` order and are not joined.
+
+        Raises:
+            DuplicateOrdinalIndex: If two elements share an `ordinalIndex`.
+            UnresolvableReference: If an element's `sequence` cannot be resolved.
+
+        """
+        return ConcatenatedSequence(
+            self.resolve(element.sequence, container)
+            for element in ordered_elements(concatenated)
+        )
+
+    def repeated(self, repeated, container=None) -> PeriodicSequence:
+        """Returns a virtual view of `sequenceMotif` repeated `copyCount` times.
+
+        Raises:
+            InvalidCopyCount: If `copyCount` is negative.
+            UnresolvableReference: If `sequenceMotif` cannot be resolved.
+
+        """
+        if repeated.copyCount < 0:
+            raise InvalidCopyCount(
+                f"The `copyCount` of a repeated representation cannot be negative, got {repeated.copyCount}."
+            )
+        motif = str(self.resolve(repeated.sequenceMotif, container))
+        return PeriodicSequence.repeat(motif, repeated.copyCount)
+
+    def relative(self, relative, container=None) -> EditResult:
+        """Applies the edits of a relative representation to its `startingMolecule`.
+
+        Every `coordinateInterval` refers to the starting molecule; the edits are
+        applied in one pass, in `editOrder` where they share a position.
+
+        Raises:
+            InvalidCoordinateInterval: If an edit has no interval or falls outside of the starting molecule.
+            OverlappingEdits: If two edits change the same bases.
+            ReplacedSequenceMismatch: If a `replacedMolecule` differs from the bases it replaces.
+            UnresolvableReference: If a referenced molecule cannot be resolved.
+
+        Returns:
+            EditResult: The edited sequence and the shift map between both sequences.
+
+        """
+        edits = []
+        for edit in relative.edit or ():
+            interval = edit.coordinateInterval
+            if interval is None:
+                raise InvalidCoordinateInterval(
+                    "Every edit of a relative representation must have a `coordinateInterval`."
+                )
+            start, end = normalize_interval(interval)
+            replaced = edit.replacedMolecule
+            edits.append(
+                Edit(
+                    start,
+                    end,
+                    self.resolve(edit.replacementMolecule, container),
+                    None if replaced is None else self.resolve(replaced, container),
+                    edit.editOrder,
+                )
+            )
+        return apply_edits(self.resolve(relative.startingMolecule, container), edits)
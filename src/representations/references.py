@@ -0,0 +1,166 @@
+from collections.abc import Callable, Iterable, Mapping
+
+from exceptions.fhir import UnresolvableReference
+from representations.cache import LRUCache
+from resources.trusted import resource_class
+
+
+def reference_string(reference) -> str | None:
+    """Returns the `reference` of a Reference, which may also be given as a `str`."""
+    if reference is None or isinstance(reference, str):
+        return reference
+    return reference.reference
+
+
+def _is_absolute(reference: str) -> bool:
+    return ":" in reference.split("/", 1)[0]
+
+
+def _entries(bundle) -> Iterable:
+    if isinstance(bundle, Mapping):
+        return ((e.get("fullUrl"), e.get("resource")) for e in bundle.get("entry", ()))
+    return ((e.fullUrl, e.resource) for e in bundle.entry or ())
+
+
+class ReferenceResolver:
+    """Resolves References to the resources they point to.
+
+    The resources that can be referenced are indexed once: the `contained`
+    resources of `resource` (local ``#id`` references), the entries of `bundle`
+    (by ``fullUrl`` and by relative ``Type/id``) and an external `registry`.
+    Lookups are then hash lookups; resolved objects are kept in an LRU cache so
+    that registry entries are only fetched, or parsed, once. The ``#id``
+    indexes of the containers are kept in an LRU cache of the same size.
+
+    Args:
+        resource (Resource | None): The resource whose `contained` resources are indexed.
+        bundle (Bundle | dict | None): A Bundle whose entries are indexed.
+        registry (Mapping | Callable | None): External resources, keyed by
+            reference, or a function called with the reference string. Values may
+            be models or FHIR JSON-like dicts.
+        base_url (str | None): Base used to resolve relative references against absolute ``fullUrl``.
+        cache_size (int): Number of resolved objects, and of container indexes, kept.
+
+    """
+
+    def __init__(
+        self,
+        resource=None,
+        bundle=None,
+        registry: Mapping | Callable | None = None,
+        base_url: str | None = None,
+        cache_size: int = 1024,
+    ):
+        self.resource = resource
+        self.registry = registry
+        self.base_url = base_url.rstrip("/") if base_url else None
+        self.cache = LRUCache(cache_size)
+        self._index: dict[str, object] = {}
+        # `(container, #id index)` by id() of the container: the entry holds the
+        # container, so that its id() is not reused while the index is cached.
+        self._contained = LRUCache(cache_size)
+
+        if resource is not None:
+            self._index_contained(resource)
+        if bundle is not None:
+            for full_url, entry in _entries(bundle):
+                self.add(entry, full_url)
+
+    def _index_contained(self, container) -> dict[str, object]:
+        entry = self._contained.get(id(container))
+        if entry is not None and entry[0] is container:
+            index = entry[1]
+        else:
+            contained = (
+                container.get("contained")
+                if isinstance(container, Mapping)
+                else getattr(container, "contained", None)
+            )
+            index = {}
+            for resource in contained or ():
+                resource_id = self._field(resource, "id")
+                if resource_id:
+                    index["#" + resource_id] = resource
+            self._contained.put(id(container), (container, index))
+        return index
+
+    @staticmethod
+    def _field(resource, name: str):
+        if isinstance(resource, Mapping):
+            return resource.get(name)
+        return getattr(resource, name, None)
+
+    def add(self, resource, full_url: str | None = None) -> None:
+        """Indexes `resource` by its relative ``Type/id`` and, if given, its `full_url`."""
+        if resource is None:
+            return
+        resource_type = self._field(resource, "resourceType")
+        if resource_type is None:
+            resource_type = resource.get_resource_type()
+        resource_id = self._field(resource, "id")
+        if resource_id:
+            self._index.setdefault(f"{resource_type}/{resource_id}", resource)
+        if full_url:
+            self._index[full_url] = resource
+
+    def _lookup(self, reference: str):
+        resource = self._index.get(reference)
+        if resource is None and self.base_url and not _is_absolute(reference):
+            resource = self._index.get(f"{self.base_url}/{reference}")
+        if resource is None and self.registry is not None:
+            if isinstance(self.registry, Mapping):
+                resource = self.registry.get(reference)
+            else:
+                resource = self.registry(reference)
+        return resource
+
+    def get(self, reference, container=None):
+        """Returns the resource `reference` points to, None if it cannot be resolved.
+
+        Args:
+            reference (Reference | str): The reference.
+            container (Resource | None): The resource holding local ``#id``
+                references, `resource` by default.
+
+        """
+        reference = reference_string(reference)
+        if not reference:
+            return None
+        if container is None:
+            container = self.resource
+        if reference.startswith("#"):
+            if container is None:
+                return None
+            # Parsed in place, so the resource lives as long as the container's index.
+            index = self._index_contained(container)
+            resource = index.get(reference)
+            if isinstance(resource, Mapping):
+                resource = resource_class(resource)(**resource)
+                index[reference] = resource
+            return resource
+
+        resource = self.cache.get(reference)
+        if resource is None:
+            resource = self._lookup(reference)
+            if resource is None:
+                return None
+            if isinstance(resource, Mapping):
+                resource = resource_class(resource)(**resource)
+            self.cache.put(reference, resource)
+        return resource
+
+    def resolve(self, reference, container=None):
+        """Returns the resource `reference` points to.
+
+        Raises:
+            UnresolvableReference: If `reference` cannot be resolved.
+
+        """
+        resource = self.get(reference, container)
+        if resource is None:
+            raise UnresolvableReference(
+                f"The reference `{reference_string(reference)}` could not be resolved."
+            )
+        return resource
+
+    __call__ = resolve
@@ -0,0 +1,144 @@
+from bisect import bisect_right
+from collections.abc import Iterable
+from itertools import accumulate
+from typing import NamedTuple
+
+from exceptions.fhir import (
+    InvalidCoordinateInterval,
+    OverlappingEdits,
+    ReplacedSequenceMismatch,
+)
+from representations.concatenated import ConcatenatedSequence
+from resources.sequenceview import SequenceView
+
+
+class Edit(NamedTuple):
+    """One edit of a relative representation, in 0-based, half-open coordinates."""
+
+    start: int
+    end: int
+    replacement: str | SequenceView
+    replaced: str | SequenceView | None = None
+    order: int | None = None
+
+
+class ShiftMap:
+    """Maps positions between a starting sequence and its edited sequence.
+
+    Positions outside of every edit are shifted by the net length change of the
+    edits before them; positions inside an edited region have no counterpart.
+
+    Args:
+        edits (Iterable[Edit]): The applied edits, sorted by position.
+
+    """
+
+    __slots__ = ("_old_starts", "_old_ends", "_new_starts", "_new_ends", "_shifts")
+
+    def __init__(self, edits: Iterable[Edit]):
+        self._old_starts, self._old_ends = [], []
+        self._new_starts, self._new_ends = [], []
+        deltas = []
+        shift = 0
+        for edit in edits:
+            delta = len(edit.replacement) - (edit.end - edit.start)
+            self._old_starts.append(edit.start)
+            self._old_ends.append(edit.end)
+            self._new_starts.append(edit.start + shift)
+            self._new_ends.append(edit.start + shift + len(edit.replacement))
+            deltas.append(delta)
+            shift += delta
+        # _shifts[i] is the net change of the first i edits.
+        self._shifts = (0, *accumulate(deltas))
+
+    @staticmethod
+    def _map(position, starts, ends, shifts, sign):
+        # Edits ending at or before `position` all come before it.
+        before = bisect_right(ends, position)
+        if before < len(starts) and starts[before] <= position:
+            return None
+        return position + sign * shifts[before]
+
+    def to_edited(self, position: int) -> int | None:
+        """Returns where base `position` of the starting sequence ends up, None if it was replaced."""
+        return self._map(position, self._old_starts, self._old_ends, self._shifts, 1)
+
+    def to_starting(self, position: int) -> int | None:
+        """Returns where base `position` of the edited sequence comes from, None if it was inserted."""
+        return self._map(position, self._new_starts, self._new_ends, self._shifts, -1)
+
+    @property
+    def shift(self) -> int:
+        """The net length change of all edits."""
+        return self._shifts[-1]
+
+
+class EditResult(NamedTuple):
+    """The edited sequence of a relative representation and its shift map."""
+
+    sequence: ConcatenatedSequence
+    shifts: ShiftMap
+
+
+def sort_edits(edits: Iterable[Edit]) -> list[Edit]:
+    """Sorts edits by position, checking that no two of them overlap.
+
+    Edits are applied in `editOrder`; insertions at the same position are kept in
+    that order, edits without an `editOrder` come after the others.
+
+    Raises:
+        OverlappingEdits: If two edits change the same bases.
+
+    """
+    ranked = sorted(
+        enumerate(edits),
+        key=lambda item: (item[1].order is None, item[1].order or 0, item[0]),
+    )
+    ordered = sorted(
+        (edit for _, edit in ranked), key=lambda edit: (edit.start, edit.end)
+    )
+    for previous, edit in zip(ordered, ordered[1:], strict=False):
+        if previous.end > edit.start:
+            raise OverlappingEdits(
+                f"The edits [{previous.start}, {previous.end}) and [{edit.start}, {edit.end}) overlap."
+            )
+    return ordered
+
+
+def apply_edits(bases: str | SequenceView, edits: Iterable[Edit]) -> EditResult:
+    """Applies every edit to `bases` in a single pass.
+
+    The result is a piece table: a lazy view alternating unchanged slices of
+    `bases` with the replacement sequences, so no intermediate string is built.
+    All coordinates refer to the starting sequence.
+
+    Args:
+        bases (str | SequenceView): The starting sequence.
+        edits (Iterable[Edit]): The edits, in any order.
+
+    Raises:
+        InvalidCoordinateInterval: If an edit falls outside of `bases`.
+        OverlappingEdits: If two edits change the same bases.
+        ReplacedSequenceMismatch: If the `replaced` bases of an edit are not those of `bases`.
+
+    Returns:
+        EditResult: The edited sequence and its shift map.
+
+    """
+    ordered = sort_edits(edits)
+    pieces = []
+    position = 0
+    for edit in ordered:
+        if edit.start < 0 or edit.end > len(bases):
+            raise InvalidCoordinateInterval(
+                f"The edit [{edit.start}, {edit.end}) is outside of the starting molecule (length {len(bases)})."
+            )
+        if edit.replaced is not None and bases[edit.start : edit.end] != edit.replaced:
+            raise ReplacedSequenceMismatch(
+                f"The bases [{edit.start}, {edit.end}) of the starting molecule are not the `replacedMolecule`."
+            )
+        pieces.append(bases[position : edit.start])
+        pieces.append(edit.replacement)
+        position = edit.end
+    pieces.append(bases[position:])
+    return EditResult(ConcatenatedSequence(pieces), ShiftMap(ordered))
@@ -0,0 +1,81 @@
+from collections.abc import Iterator
+from itertools import cycle, islice
+
+from resources.sequenceview import SequenceView
+
+
+def primitive_root(motif: str) -> str:
+    """Returns the shortest string whose repetition gives `motif`, e.g. "CA" for "CACA"."""
+    # `motif` is a repetition iff it occurs in itself rotated by less than a full turn.
+    period = (motif + motif).find(motif, 1)
+    return motif[:period] if period and len(motif) % period == 0 else motif
+
+
+class PeriodicSequence(SequenceView):
+    """A virtual sequence made of a motif repeated over a given length.
+
+    Nothing is expanded: length, indexing and slicing are computed from the motif,
+    and two periodic sequences are compared in ``O(len(motif))`` whatever their
+    length.
+
+    Args:
+        motif (str): The repeated unit, e.g. the motif of a short tandem repeat.
+        length (int): Number of bases of the sequence.
+        phase (int): Position in `motif` of the first base.
+
+    """
+
+    __slots__ = ("motif", "length", "phase")
+
+    def __init__(self, motif: str, length: int, phase: int = 0):
+        self.motif = str(motif)
+        if not self.motif and length:
+            raise ValueError("An empty motif cannot be repeated.")
+        self.length = length
+        self.phase = phase % len(self.motif) if self.motif else 0
+
+    @classmethod
+    def repeat(cls, motif: str, copies: int) -> "PeriodicSequence":
+        """Returns `motif` repeated `copies` times."""
+        return cls(motif, len(motif) * copies)
+
+    @property
+    def unit(self) -> str:
+        """The motif rotated so that it starts with the first base."""
+        return self.motif[self.phase :] + self.motif[: self.phase]
+
+    def __len__(self) -> int:
+        return self.length
+
+    def _decode(self, start: int, stop: int) -> str:
+        if start >= stop:
+            return ""
+        unit = self.motif
+        offset = (self.phase + start) % len(unit)
+        copies = -(-(offset + stop - start) // len(unit))
+        return (unit * copies)[offset : offset + stop - start]
+
+    def _slice(self, start: int, stop: int) -> "PeriodicSequence":
+        return PeriodicSequence(self.motif, stop - start, self.phase + start)
+
+    def __iter__(self) -> Iterator[str]:
+        return islice(cycle(self.unit), self.length)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PeriodicSequence):
+            if self.length != other.length:
+                return False
+            # Both sequences are fully determined by their first |p| + |q| bases
+            # (Fine and Wilf), whatever their length.
+            span = min(
+                self.length,
+                len(primitive_root(self.unit)) + len(primitive_root(other.unit)),
+            )
+            return self._decode(0, span) == other._decode(0, span)
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        return super().__hash__()
+
+    def __repr__(self) -> str:
+        return f"PeriodicSequence({self.unit!r}, length={self.length})"
@@ -0,0 +1,171 @@
+from functools import cache
+from typing import NamedTuple
+
+from exceptions.fhir import InvalidCoordinateInterval, UnsupportedCoordinateSystem
+
+# LOINC answers for the `system` of a coordinateSystem (LL5323-2).
+ZERO_BASED_INTERVAL = "LA30100-4"  # 0-based interval counting
+ZERO_BASED_CHARACTER = "LA30101-2"  # 0-based character counting
+ONE_BASED_CHARACTER = "LA30102-0"  # 1-based character counting
+
+SEQUENCE_START = "sequence-start"
+
+# Offsets turning (start, end) into a 0-based, half-open interval, per system.
+_SYSTEM_OFFSETS: dict[str, tuple[int, int]] = {
+    ZERO_BASED_INTERVAL: (0, 0),
+    ZERO_BASED_CHARACTER: (0, 1),
+    ONE_BASED_CHARACTER: (-1, 0),
+}
+
+
+class IntervalConverter(NamedTuple):
+    """Converts the intervals of one coordinate system to 0-based, half-open coordinates."""
+
+    system: str
+    start_offset: int
+    end_offset: int
+    normalization: str | None = None
+
+    def __call__(self, start, end) -> tuple[int, int]:
+        """Returns ``(start, end)`` as 0-based, half-open coordinates.
+
+        With character counting, a `start` without an `end` denotes a single base.
+
+        Raises:
+            InvalidCoordinateInterval: If a bound is missing or `start` is after `end`.
+
+        """
+        if end is None and self.system != ZERO_BASED_INTERVAL:
+            end = start
+        if start is None or end is None:
+            raise InvalidCoordinateInterval(
+                "The coordinate interval must have both a `start` and an `end`."
+            )
+        start, end = int(start) + self.start_offset, int(end) + self.end_offset
+        if start > end:
+            raise InvalidCoordinateInterval(
+                f"The coordinate interval starts after it ends ({start} > {end})."
+            )
+        return start, end
+
+    def inverse(self, start: int, end: int) -> tuple[int, int]:
+        """Returns 0-based, half-open ``(start, end)`` in this coordinate system."""
+        return start - self.start_offset, end - self.end_offset
+
+
+def _codes(concept) -> tuple[str, ...]:
+    if concept is None:
+        return ()
+    return tuple(coding.code for coding in concept.coding or () if coding.code)
+
+
+def coordinate_system_key(coordinate_system) -> tuple[tuple[str, ...], ...]:
+    """Returns the codes of the system, origin and normalizationMethod of a coordinateSystem."""
+    if coordinate_system is None:
+        return (), (), ()
+    return (
+        _codes(coordinate_system.system),
+        _codes(coordinate_system.origin),
+        _codes(coordinate_system.normalizationMethod),
+    )
+
+
+@cache
+def _converter(system, origin, normalization) -> IntervalConverter:
+    for code in origin:
+        if code != SEQUENCE_START:
+            raise UnsupportedCoordinateSystem(
+                f"The coordinate origin `{code}` is not supported, only `{SEQUENCE_START}` is."
+            )
+    if not system:
+        system = (ZERO_BASED_INTERVAL,)
+    for code in system:
+        if code in _SYSTEM_OFFSETS:
+            return IntervalConverter(
+                code,
+                *_SYSTEM_OFFSETS[code],
+                normalization[0] if normalization else None,
+            )
+    raise UnsupportedCoordinateSystem(
+        f"The coordinate system `{system[0]}` is not supported."
+    )
+
+
+def converter(coordinate_system) -> IntervalConverter:
+    """Returns the converter of a coordinateSystem.
+
+    Converters are memoized per combination of system, origin and
+    normalizationMethod codes. An interval without a coordinate system, or whose
+    system has no code, is read as 0-based interval counting. Only intervals
+    relative to the start of the sequence can be interpreted.
+
+    Args:
+        coordinate_system (BackboneElement | None): The `coordinateSystem` of an interval.
+
+    Raises:
+        UnsupportedCoordinateSystem: If the system or origin is not supported.
+
+    Returns:
+        IntervalConverter: The converter.
+
+    """
+    return _converter(*coordinate_system_key(coordinate_system))
+
+
+def to_half_open(start, end, coordinate_system) -> tuple[int, int]:
+    """Converts an interval to 0-based, half-open ``[start, end)`` coordinates.
+
+    Args:
+        start (int | None): The start coordinate.
+        end (int | None): The end coordinate.
+        coordinate_system (BackboneElement | None): The `coordinateSystem` of the interval.
+
+    Raises:
+        InvalidCoordinateInterval: If a bound is missing or `start` is after `end`.
+        UnsupportedCoordinateSystem: If the coordinate system is not supported.
+
+    Returns:
+        tuple[int, int]: The converted ``(start, end)``.
+
+    """
+    return converter(coordinate_system)(start, end)
+
+
+def _quantity_value(quantity):
+    return None if quantity is None else quantity.value
+
+
+def interval_bounds(interval) -> tuple:
+    """Returns the raw ``(start, end)`` of any coordinate interval.
+
+    Sequence location intervals use `startQuantity`/`endQuantity`, or the outer
+    bounds of `startRange`/`endRange` (the low start and the high end); extracted
+    and relative edit intervals use `start`/`end`.
+    """
+    if "startQuantity" not in type(interval).model_fields:
+        return interval.start, interval.end
+
+    start = _quantity_value(interval.startQuantity)
+    if start is None and interval.startRange is not None:
+        start = _quantity_value(interval.startRange.low)
+    end = _quantity_value(interval.endQuantity)
+    if end is None and interval.endRange is not None:
+        end = _quantity_value(interval.endRange.high)
+    return start, end
+
+
+def normalize_interval(interval) -> tuple[int, int]:
+    """Converts any coordinate interval to 0-based, half-open coordinates.
+
+    Args:
+        interval (BackboneElement): A sequence location, extracted or relative edit `coordinateInterval`.
+
+    Raises:
+        InvalidCoordinateInterval: If a bound is missing or `start` is after `end`.
+        UnsupportedCoordinateSystem: If the coordinate system is not supported.
+
+    Returns:
+        tuple[int, int]: The converted ``(start, end)``.
+
+    """
+    return converter(interval.coordinateSystem)(*interval_bounds(interval))
@@ -0,0 +1,193 @@
+import base64
+import json
+
+from exceptions.fhir import CoordinateError
+from resources.coordinates import (
+    coordinate_system_key,
+    interval_bounds,
+    normalize_interval,
+)
+
+# Bytes of the SHA-512 hash kept in a digest, as in GA4GH VRS identifiers.
+DIGEST_SIZE = 24
+
+
+def sha512t24u(blob: bytes) -> str:
+    """Returns the base64url encoded, truncated SHA-512 digest of `blob`."""
+    import hashlib  # Deferred, it is slow to import and only needed here.
+
+    digest = hashlib.sha512(blob).digest()[:DIGEST_SIZE]
+    return base64.urlsafe_b64encode(digest).decode("ascii")
+
+
+def _codings(concept) -> list | None:
+    if concept is None:
+        return None
+    codings = sorted(
+        {
+            (coding.system or "", coding.code)
+            for coding in concept.coding or ()
+            if coding.code
+        }
+    )
+    if codings:
+        return [list(coding) for coding in codings]
+    return concept.text or None
+
+
+def _number(value):
+    if value is None:
+        return None
+    return int(value) if value == int(value) else str(value)
+
+
+def _interval(interval) -> dict | None:
+    """Returns an interval as 0-based, half-open coordinates, as given otherwise."""
+    if interval is None:
+        return None
+    try:
+        start, end = normalize_interval(interval)
+    except CoordinateError:
+        start, end = interval_bounds(interval)
+        return {
+            "system": [
+                list(codes)
+                for codes in coordinate_system_key(interval.coordinateSystem)
+            ],
+            "start": _number(start),
+            "end": _number(end),
+        }
+    return {"start": start, "end": end}
+
+
+class _Canonicalizer:
+    """Reduces a MolecularDefinition to its semantically significant content."""
+
+    def __init__(self, moldef):
+        self.contained = {
+            resource.id: resource
+            for resource in moldef.contained or ()
+            if getattr(resource, "id", None)
+        }
+
+    def reference(self, reference) -> str | list | None:
+        # A contained resource is identified by its content, not by its local id.
+        if reference is None:
+            return None
+        target = reference.reference
+        if target and target.startswith("#"):
+            resource = self.contained.get(target[1:])
+            if resource is not None and getattr(resource, "digest", None):
+                return resource.digest
+        if target:
+            return target
+        if reference.identifier is not None:
+            return [reference.identifier.system or "", reference.identifier.value or ""]
+        return reference.display
+
+    def location(self, location) -> dict:
+        sequence_location = location.sequenceLocation
+        feature_location = location.featureLocation
+        canonical = {}
+        if sequence_location is not None:
+            canonical["sequence"] = {
+                "context": self.reference(sequence_location.sequenceContext),
+                "interval": _interval(sequence_location.coordinateInterval),
+                "strand": _codings(sequence_location.strand),
+            }
+        if feature_location is not None:
+            canonical["feature"] = _sorted(
+                _codings(gene) for gene in feature_location.geneId or ()
+            )
+        return canonical
+
+    def representation(self, representation) -> dict:
+        canonical = {"focus": _codings(representation.focus)}
+        if representation.literal is not None:
+            canonical["literal"] = str(representation.literal.value)
+        if (extracted := representation.extracted) is not None:
+            canonical["extracted"] = {
+                "molecule": self.reference(extracted.startingMolecule),
+                "interval": _interval(extracted.coordinateInterval),
+                "reverse": bool(extracted.reverseComplement),
+            }
+        if (repeated := representation.repeated) is not None:
+            canonical["repeated"] = {
+                "motif": self.reference(repeated.sequenceMotif),
+                "copies": repeated.copyCount,
+            }
+        if (concatenated := representation.concatenated) is not None:
+            elements = sorted(
+                concatenated.sequenceElement or (), key=lambda e: e.ordinalIndex
+            )
+            canonical["concatenated"] = [
+                self.reference(element.sequence) for element in elements
+            ]
+        if (relative := representation.relative) is not None:
+            canonical["relative"] = {
+                "molecule": self.reference(relative.startingMolecule),
+                "edits": _sorted(
+                    {
+                        "order": edit.editOrder,
+                        "interval": _interval(edit.coordinateInterval),
+                        "replacement": self.reference(edit.replacementMolecule),
+                        "replaced": self.reference(edit.replacedMolecule),
+                    }
+                    for edit in relative.edit or ()
+                ),
+            }
+        return canonical
+
+    def __call__(self, moldef) -> dict:
+        return {
+            "moleculeType": _codings(moldef.moleculeType),
+            "type": sorted(moldef.type or ()),
+            "memberState": _sorted(
+                self.reference(state)
+                for state in getattr(moldef, "memberState", None) or ()
+            ),
+            "location": _sorted(
+                self.location(location)
+                for location in getattr(moldef, "location", None) or ()
+            ),
+            "representation": _sorted(
+                self.representation(representation)
+                for representation in moldef.representation or ()
+            ),
+        }
+
+
+def _sorted(items) -> list:
+    # The order of repeated elements carries no meaning, so it must not change the digest.
+    return sorted(items, key=lambda item: json.dumps(item, sort_keys=True))
+
+
+def canonical_json(moldef) -> bytes:
+    """Returns the canonical serialization `digest` hashes.
+
+    Only the content identifying the molecule is kept: moleculeType, type,
+    memberState, the locations, with intervals converted to 0-based, half-open
+    coordinates, and the representations. `id`, `meta`, `text`, identifiers,
+    descriptions, displays and extensions are left out, and repeated elements
+    are sorted, so records that differ only in those produce the same bytes.
+    """
+    canonical = _Canonicalizer(moldef)(moldef)
+    return json.dumps(
+        canonical, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def digest(moldef) -> str:
+    """Returns the content-addressed digest of a MolecularDefinition.
+
+    The digest is the base64url encoded first 24 bytes of the SHA-512 hash of
+    `canonical_json(moldef)`, as VRS computes its identifiers.
+
+    Args:
+        moldef (MolecularDefinition): The molecular definition.
+
+    Returns:
+        str: A 32 character digest, suitable as a dict key for deduplication.
+
+    """
+    return sha512t24u(canonical_json(moldef))
@@ -0,0 +1,24 @@
+def is_empty(element) -> bool:
+    """Returns whether a fhir-core model holds no value at all.
+
+    Equivalent to ``not element.model_dump(exclude_unset=True)`` (fhir-core
+    dumps exclude None), without building the dict tree: it stops at the
+    first element that was set to a value. Anything other than a pydantic
+    model is not empty.
+
+    Args:
+        element (FHIRAbstractModel): The model to test, e.g. a CodeableConcept.
+
+    Returns:
+        bool: True if no element of `element` is set to a value other than None.
+
+    """
+    fields_set = getattr(element, "model_fields_set", None)
+    if fields_set is None:
+        return False
+    values = element.__dict__
+    # A plain loop: about twice as fast as `all()` over a generator here.
+    for name in fields_set:  # noqa: SIM110
+        if values.get(name) is not None:
+            return False
+    return True
@@ -0,0 +1,183 @@
+import mmap
+import os
+import weakref
+from typing import NamedTuple
+
+from resources.sequenceview import SequenceView
+
+
+class FastaIndexEntry(NamedTuple):
+    """One record of a samtools-style FASTA index (`.fai`)."""
+
+    name: str
+    length: int
+    offset: int
+    linebases: int
+    linewidth: int
+
+    def byte_offset(self, position: int) -> int:
+        """Returns the file offset of the base at 0-based `position`."""
+        line, column = divmod(position, self.linebases)
+        return self.offset + line * self.linewidth + column
+
+
+def read_fasta_index(fai_path) -> dict[str, FastaIndexEntry]:
+    """Reads a `.fai` file.
+
+    Args:
+        fai_path (str | os.PathLike): Location of the index.
+
+    Returns:
+        dict[str, FastaIndexEntry]: The index entries keyed by contig name.
+
+    """
+    index = {}
+    with open(fai_path) as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            name, length, offset, linebases, linewidth = line.split("\t")[:5]
+            index[name] = FastaIndexEntry(
+                name, int(length), int(offset), int(linebases), int(linewidth)
+            )
+    return index
+
+
+def build_fasta_index(fasta_path) -> dict[str, FastaIndexEntry]:
+    """Indexes a FASTA file in a single pass, as `samtools faidx` would.
+
+    Args:
+        fasta_path (str | os.PathLike): Location of the (uncompressed) FASTA file.
+
+    Returns:
+        dict[str, FastaIndexEntry]: The index entries keyed by contig name.
+
+    """
+    index = {}
+    name = None
+    position = 0
+
+    def close_record():
+        if name is not None:
+            index[name] = FastaIndexEntry(
+                name, length, offset, linebases or length, linewidth or length
+            )
+
+    with open(fasta_path, "rb") as handle:
+        for line in handle:
+            if line.startswith(b">"):
+                close_record()
+                name = line[1:].split()[0].decode()
+                length = linebases = linewidth = 0
+                offset = position + len(line)
+            elif name is not None:
+                bases = len(line.rstrip(b"\r\n"))
+                if not linebases:
+                    linebases, linewidth = bases, len(line)
+                length += bases
+            position += len(line)
+    close_record()
+    return index
+
+
+class FastaFile:
+    """A FASTA file memory-mapped for random access through its `.fai` index.
+
+    The index is read from ``<path>.fai`` when present, otherwise it is built by
+    scanning the file once. Use `open_fasta` to share one mapping per file.
+
+    Args:
+        path (str | os.PathLike): Location of the (uncompressed) FASTA file.
+
+    Raises:
+        ValueError: If the file is empty.
+
+    """
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        # mmap cannot map an empty file, and would fail with a less helpful error.
+        if os.path.getsize(self.path) == 0:
+            raise ValueError(f"The FASTA file `{self.path}` is empty.")
+        fai_path = self.path + ".fai"
+        if os.path.exists(fai_path):
+            self.index = read_fasta_index(fai_path)
+        else:
+            self.index = build_fasta_index(self.path)
+
+        with open(self.path, "rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def fetch(self, contig: str, start: int, stop: int) -> str:
+        """Reads the bases ``[start, stop)`` (0-based) of `contig`."""
+        entry = self.index[contig]
+        if start >= stop:
+            return ""
+        raw = self._mmap[entry.byte_offset(start) : entry.byte_offset(stop - 1) + 1]
+        return raw.translate(None, b"\r\n").decode("ascii")
+
+    def sequence(self, contig: str) -> "FastaSequence":
+        """Returns a lazy view over the whole of `contig`.
+
+        Raises:
+            KeyError: If `contig` is not in the index.
+
+        """
+        entry = self.index[contig]
+        return FastaSequence(self, contig, 0, entry.length)
+
+    def close(self):
+        """Unmaps the file; views over it can no longer be read."""
+        self._mmap.close()
+
+
+_open_files: "weakref.WeakValueDictionary[str, FastaFile]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def open_fasta(path) -> FastaFile:
+    """Returns the `FastaFile` for `path`, reusing an open mapping when there is one."""
+    key = os.path.realpath(path)
+    fasta = _open_files.get(key)
+    if fasta is None:
+        fasta = _open_files[key] = FastaFile(key)
+    return fasta
+
+
+class FastaSequence(SequenceView):
+    """A `str`-compatible view over a contig of a memory-mapped FASTA file.
+
+    Bases are only read from the file when the view (or a slice of it) is turned
+    into a `str`; slicing itself never reads.
+    """
+
+    __slots__ = ("fasta", "contig", "start", "length")
+
+    def __init__(self, fasta: FastaFile, contig: str, start: int, length: int):
+        self.fasta = fasta
+        self.contig = contig
+        self.start = start
+        self.length = length
+
+    def __len__(self) -> int:
+        return self.length
+
+    def _decode(self, start: int, stop: int) -> str:
+        return self.fasta.fetch(self.contig, self.start + start, self.start + stop)
+
+    def _slice(self, start: int, stop: int) -> "FastaSequence":
+        return FastaSequence(self.fasta, self.contig, self.start + start, stop - start)
+
+    def __reduce__(self):
+        # The mapping itself cannot be pickled, re-open the file on the other side.
+        return _reopen, (self.fasta.path, self.contig, self.start, self.length)
+
+    def __repr__(self) -> str:
+        return (
+            f"FastaSequence({self.contig!r}, start={self.start}, length={self.length})"
+        )
+
+
+def _reopen(path, contig, start, length) -> FastaSequence:
+    return FastaSequence(open_fasta(path), contig, start, length)
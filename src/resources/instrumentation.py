@@ -0,0 +1,189 @@
+import functools
+import time
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from fhir_core.fhirabstractmodel import FHIRAbstractModel
+
+# Upper bounds, in seconds, of the histogram buckets; a last bucket holds the rest.
+BUCKETS = (
+    1e-6,
+    2.5e-6,
+    5e-6,
+    1e-5,
+    2.5e-5,
+    5e-5,
+    1e-4,
+    2.5e-4,
+    5e-4,
+    1e-3,
+    2.5e-3,
+    5e-3,
+    1e-2,
+    1e-1,
+    1.0,
+)
+
+# The fhir-core checks run by `FHIRAbstractModel.validate_after_model_construction`
+# on every element: required primitives and choice ([x]) elements.
+FHIR_CORE_CHECKS = ("_validate_required_primitive_elements", "_validate_one_of_many")
+
+# Process-wide, like the fhir-core checks it patches; None when disabled.
+_active: "ValidationTimer | None" = None
+
+
+class Timing:
+    """Call count and histogram of the durations of one validator."""
+
+    __slots__ = ("buckets", "count", "max", "total")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.buckets[bisect_left(BUCKETS, seconds)] += 1
+
+    def percentile(self, q: float) -> float:
+        """Returns an upper bound of the `q` quantile (0.0 - 1.0), from the histogram."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS, self.buckets, strict=False):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class ValidationTimer:
+    """Records how long each validator takes, while activated.
+
+    Covers the profile validators (e.g. ``Variation.validate_focus``) and the
+    fhir-core checks of every element, by class (e.g.
+    ``MolecularDefinitionRepresentation._validate_required_primitive_elements``).
+    Outside of `activate()` the validators only pay for a global lookup.
+
+    Example:
+        >>> timer = ValidationTimer()
+        >>> with timer.activate():
+        ...     Variation(**data)
+        >>> timer.to_dict()["Variation.validate_focus"]["count"]
+        1
+
+    """
+
+    def __init__(self):
+        self.timings: dict[str, Timing] = {}
+
+    def record(self, name: str, seconds: float) -> None:
+        """Adds one call of `name` that lasted `seconds`."""
+        timing = self.timings.get(name)
+        if timing is None:
+            timing = self.timings[name] = Timing()
+        timing.add(seconds)
+
+    def reset(self) -> None:
+        self.timings.clear()
+
+    @contextmanager
+    def activate(self) -> Iterator["ValidationTimer"]:
+        """Times the validators run in the block, in any thread.
+
+        Raises:
+            RuntimeError: If a timer is already active.
+
+        """
+        global _active
+        if _active is not None:
+            raise RuntimeError("A ValidationTimer is already active.")
+        originals = {
+            name: FHIRAbstractModel.__dict__[name] for name in FHIR_CORE_CHECKS
+        }
+        for name, check in originals.items():
+            setattr(FHIRAbstractModel, name, _timed_check(name, check))
+        _active = self
+        try:
+            yield self
+        finally:
+            _active = None
+            for name, check in originals.items():
+                setattr(FHIRAbstractModel, name, check)
+
+    def to_dict(self) -> dict[str, dict]:
+        """Returns the count, total, mean, max and p50/p90/p99 (in seconds) of every validator."""
+        return {
+            name: {
+                "count": timing.count,
+                "total": timing.total,
+                "mean": timing.total / timing.count,
+                "max": timing.max,
+                "p50": timing.percentile(0.5),
+                "p90": timing.percentile(0.9),
+                "p99": timing.percentile(0.99),
+            }
+            for name, timing in sorted(self.timings.items())
+        }
+
+    def to_prometheus(self, metric: str = "moldef_validator_seconds") -> str:
+        """Returns the timings as a Prometheus histogram, in the text exposition format."""
+        lines = [
+            f"# HELP {metric} Time spent in MolecularDefinition validators.",
+            f"# TYPE {metric} histogram",
+        ]
+        for name, timing in sorted(self.timings.items()):
+            label = f'validator="{name}"'
+            cumulative = 0
+            for bound, count in zip(BUCKETS, timing.buckets, strict=False):
+                cumulative += count
+                lines.append(f'{metric}_bucket{{{label},le="{bound:g}"}} {cumulative}')
+            lines.append(f'{metric}_bucket{{{label},le="+Inf"}} {timing.count}')
+            lines.append(f"{metric}_sum{{{label}}} {timing.total:.9f}")
+            lines.append(f"{metric}_count{{{label}}} {timing.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _timed_check(name: str, check):
+    @functools.wraps(check)
+    def wrapper(self):
+        started = time.perf_counter()
+        try:
+            return check(self)
+        finally:
+            timer = _active
+            if timer is not None:
+                timer.record(
+                    f"{type(self).__name__}.{name}", time.perf_counter() - started
+                )
+
+    return wrapper
+
+
+def timed(validator):
+    """Decorates a model validator so that an active `ValidationTimer` times it.
+
+    Place it below ``@model_validator``; calls are recorded under the
+    qualified name of the validator, e.g. ``"Allele.validate_focus"``.
+    """
+    name = validator.__qualname__
+
+    @functools.wraps(validator)
+    def wrapper(*args):
+        timer = _active
+        if timer is None:
+            return validator(*args)
+        started = time.perf_counter()
+        try:
+            return validator(*args)
+        finally:
+            timer.record(name, time.perf_counter() - started)
+
+    return wrapper
@@ -0,0 +1,308 @@
+import weakref
+from contextvars import ContextVar
+from decimal import Decimal
+from functools import cache
+from typing import TYPE_CHECKING, get_args
+
+from fhir_core.fhirabstractmodel import FHIRAbstractModel
+from pydantic import ConfigDict
+
+if TYPE_CHECKING:
+    from fhir.resources.codeableconcept import CodeableConcept
+    from fhir.resources.coding import Coding
+
+_PRIMITIVES = (str, int, float, bool, Decimal)
+
+# What a value is, by type: what `ConceptInterner` does with it.
+_OTHER, _CONCEPT, _CODING, _MODEL, _LIST = range(5)
+
+_active: ContextVar["ConceptInterner | None"] = ContextVar(
+    "active_interner", default=None
+)
+
+
+@cache
+def _fields(model_class) -> tuple[str, ...]:
+    return tuple(model_class.model_fields)
+
+
+def _is_primitive(annotation) -> bool:
+    args = get_args(annotation)
+    if args:
+        return all(
+            _is_primitive(arg) for arg in args if isinstance(arg, type) or get_args(arg)
+        )
+    return annotation is type(None) or issubclass(annotation, _PRIMITIVES)
+
+
+@cache
+def _nested_fields(model_class) -> tuple[str, ...]:
+    """Returns the fields of `model_class` that may hold a model."""
+    return tuple(
+        name
+        for name, field in model_class.model_fields.items()
+        if not _is_primitive(field.annotation)
+    )
+
+
+@cache
+def _kind(value_class) -> int:
+    # Imported on first use, to keep them out of `import resources.moleculardefinition`.
+    from fhir.resources.codeableconcept import CodeableConcept
+    from fhir.resources.coding import Coding
+
+    if issubclass(value_class, CodeableConcept):
+        return _CONCEPT
+    if issubclass(value_class, Coding):
+        return _CODING
+    if issubclass(value_class, FHIRAbstractModel):
+        return _MODEL
+    if issubclass(value_class, list):
+        return _LIST
+    return _OTHER
+
+
+class _FrozenList(list):
+    """The `coding` list of an interned CodeableConcept, which cannot be changed in place."""
+
+    __slots__ = ()
+
+    def _frozen(self, *_args, **_kwargs):
+        raise TypeError(
+            "The codings of an interned CodeableConcept are shared between records "
+            "and cannot be changed in place; assign a new list instead."
+        )
+
+    append = extend = insert = pop = remove = clear = sort = reverse = _frozen
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _frozen
+
+    def __reduce__(self):
+        # Copies are not shared: they are plain lists.
+        return list, (list(self),)
+
+
+class _Frozen:
+    """Base of the frozen classes interned values are switched to.
+
+    An interned value is shared between records, so assigning to one of its
+    elements raises, as for any frozen pydantic model. It still compares equal
+    to the instances of its mutable class, and copies of it (`copy`, `pickle`)
+    are mutable instances of that class.
+    """
+
+    def __eq__(self, other):
+        mutable_class = type(self).__bases__[1]
+        if not isinstance(other, mutable_class):
+            return NotImplemented
+        values, others = self.__dict__, other.__dict__
+        return all(
+            values.get(name) == others.get(name) for name in _fields(mutable_class)
+        )
+
+    def __copy__(self):
+        copy = super().__copy__()
+        object.__setattr__(copy, "__class__", type(self).__bases__[1])
+        return copy
+
+    def __deepcopy__(self, memo=None):
+        copy = super().__deepcopy__(memo)
+        object.__setattr__(copy, "__class__", type(self).__bases__[1])
+        return copy
+
+    def __reduce_ex__(self, protocol):
+        return _thawed, (type(self).__bases__[1], self.__getstate__())
+
+
+def _thawed(model_class, state):
+    """Unpickles an interned value as an instance of its mutable class."""
+    model = model_class.__new__(model_class)
+    model.__setstate__(state)
+    return model
+
+
+@cache
+def _frozen_class(model_class):
+    """Returns the frozen subclass interned instances of `model_class` are switched to."""
+    return type(
+        f"Frozen{model_class.__name__}",
+        (_Frozen, model_class),
+        {"__module__": __name__, "model_config": ConfigDict(frozen=True)},
+    )
+
+
+@cache
+def _mutable_class(model_class):
+    return model_class.__bases__[1] if issubclass(model_class, _Frozen) else model_class
+
+
+def _freeze(value):
+    """Makes `value`, about to be shared between records, immutable."""
+    codings = value.__dict__.get("coding")
+    if isinstance(codings, list):
+        value.__dict__["coding"] = _FrozenList(codings)
+    object.__setattr__(value, "__class__", _frozen_class(type(value)))
+
+
+def _key(model, skip: str | None = None) -> tuple | None:
+    """Returns a hashable key of the primitive elements of `model`.
+
+    Returns:
+        tuple | None: The key, None if an element other than `skip` is not a
+        primitive (e.g. an `extension`), in which case `model` is not interned.
+
+    """
+    model_class = _mutable_class(type(model))
+    values = model.__dict__
+    key = [model_class]
+    for name in _fields(model_class):
+        value = values.get(name)
+        if value is None or name == skip:
+            continue
+        if not isinstance(value, _PRIMITIVES):
+            return None
+        key.append((name, value))
+    return tuple(key)
+
+
+class ConceptInterner:
+    """Shares one instance between equal Codings and CodeableConcepts.
+
+    Records validated while the interner is active (see `activate`) have their
+    Codings and CodeableConcepts replaced by a canonical instance, so the
+    `moleculeType`, `focus` or `coordinateSystem` concepts repeated across
+    records are held in memory once. Values are only referenced weakly: an
+    entry lives as long as a record uses it. At most `maxsize` values are held;
+    once full, new values are no longer interned.
+
+    Interned values are shared between records, so they are frozen: assigning
+    to one of their elements, or changing the `coding` list of an interned
+    CodeableConcept in place, raises. Assign a new value to the element of the
+    record instead. Interned values still compare equal to non-interned ones.
+
+    Args:
+        maxsize (int): Maximum number of interned values.
+
+    Attributes:
+        hits (int): Values replaced by an interned instance.
+        misses (int): Values that were not interned yet, or could not be.
+
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._values = weakref.WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of the values looked up that were already interned."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        """Returns the counters of the interner, e.g. for logging."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "size": len(self._values),
+            "maxsize": self.maxsize,
+        }
+
+    def _intern(self, key, value):
+        if key is None:
+            self.misses += 1
+            return value
+        interned = self._values.get(key)
+        if interned is not None:
+            self.hits += 1
+            return interned
+        self.misses += 1
+        if len(self._values) < self.maxsize:
+            _freeze(value)
+            self._values[key] = value
+        return value
+
+    def coding(self, coding: "Coding") -> "Coding":
+        """Returns the interned instance equal to `coding`."""
+        return self._intern(_key(coding), coding)
+
+    def concept(self, concept: "CodeableConcept") -> "CodeableConcept":
+        """Returns the interned instance equal to `concept`, interning its codings."""
+        if isinstance(concept, _Frozen):
+            self.hits += 1
+            return concept
+        key = _key(concept, skip="coding")
+        codings = concept.coding
+        if codings:
+            codings = [self.coding(coding) for coding in codings]
+            concept.__dict__["coding"] = codings
+            if key is not None:
+                coding_keys = tuple(_key(coding) for coding in codings)
+                key = None if None in coding_keys else (*key, coding_keys)
+        return self._intern(key, concept)
+
+    def _value(self, value):
+        kind = _kind(value.__class__)
+        if kind == _CONCEPT:
+            return self.concept(value)
+        if kind == _CODING:
+            return self.coding(value)
+        if kind == _MODEL:
+            self.intern(value)
+        elif kind == _LIST:
+            for index, item in enumerate(value):
+                if _kind(item.__class__) != _OTHER:
+                    value[index] = self._value(item)
+        return value
+
+    def intern(self, model: FHIRAbstractModel) -> FHIRAbstractModel:
+        """Replaces, in place, the Codings and CodeableConcepts nested in `model`.
+
+        Returns:
+            FHIRAbstractModel: `model` itself.
+
+        """
+        values = model.__dict__
+        for name in _nested_fields(model.__class__):
+            value = values.get(name)
+            if value is not None and _kind(value.__class__) != _OTHER:
+                values[name] = self._value(value)
+        return model
+
+    def activate(self) -> "_Activation":
+        """Returns a context manager interning the records validated in its block.
+
+        Example:
+            >>> interner = ConceptInterner()
+            >>> with interner.activate():
+            ...     variations = [Variation(**data) for data in records]
+            >>> interner.stats()["hit_rate"]
+            0.97
+
+        """
+        return _Activation(self)
+
+
+class _Activation:
+    __slots__ = ("interner", "token")
+
+    def __init__(self, interner: ConceptInterner):
+        self.interner = interner
+        self.token = None
+
+    def __enter__(self) -> ConceptInterner:
+        self.token = _active.set(self.interner)
+        return self.interner
+
+    def __exit__(self, *exc_info):
+        _active.reset(self.token)
+
+
+def active_interner() -> ConceptInterner | None:
+    """Returns the interner activated in the current context, if any."""
+    return _active.get()
@@ -1,8 +1,20 @@
+import random
+from functools import cached_property
+from typing import ClassVar
+
 from fhir.resources import backboneelement, domainresource, fhirtypes
 from fhir_core.types import BooleanType, CodeType, IntegerType
-from pydantic import Field
+from pydantic import ConfigDict, Field, model_validator
 
 import resources.fhirtypesextra as fhirtypesextra
+from resources.digest import digest as content_digest
+from resources.interning import active_interner
+from resources.sequenceview import SequenceView
+from resources.trusted import construct_trusted
+
+# The validators and serializers of these classes are built on first use rather
+# than at import, see `build_schemas`.
+DEFERRED_BUILD = ConfigDict(defer_build=True)
 
 
 class MolecularDefinition(domainresource.DomainResource):
@@ -14,6 +26,11 @@ class MolecularDefinition(domainresource.DomainResource):
     """
 
     __resource_type__ = "MolecularDefinition"
+    model_config = DEFERRED_BUILD
+
+    # Cached properties derived from the elements, dropped when an element is
+    # assigned, or the model is copied with updates or deeply.
+    DERIVED_PROPERTIES: ClassVar[tuple[str, ...]] = ("digest",)
 
     identifier: list[fhirtypes.IdentifierType] | None = Field(  # type: ignore
         None,
@@ -131,6 +148,73 @@ class MolecularDefinition(domainresource.DomainResource):
             "representation",
         ]
 
+    @model_validator(mode="after")
+    def intern_concepts(self):
+        """Shares the Codings and CodeableConcepts of the record with equal ones.
+
+        Only runs inside `ConceptInterner.activate()`, see `resources.interning`.
+
+        Returns:
+            BaseModel: The validated model instance.
+
+        """
+        interner = active_interner()
+        if interner is not None:
+            interner.intern(self)
+        return self
+
+    @classmethod
+    def from_trusted(cls, data: dict, sample_rate: float = 0.0):
+        """Builds an instance from data that is known to be valid, skipping validation.
+
+        Intended for records read back from a store that only holds validated
+        resources. Nested elements are built recursively without running any
+        fhir-core or profile validator.
+
+        Args:
+            data (dict): FHIR JSON-like data, e.g. the output of `model_dump()`.
+            sample_rate (float): Fraction of calls (0.0 - 1.0) that run full validation
+                instead, as a spot-check of the trusted source.
+
+        Raises:
+            ValueError: If `data` contains an element the class does not define.
+
+        Returns:
+            MolecularDefinition: An instance of the class `from_trusted` is called on.
+
+        """
+        if sample_rate and random.random() < sample_rate:  # noqa: S311
+            return cls(**data)
+        return construct_trusted(cls, data)
+
+    @cached_property
+    def digest(self) -> str:
+        """The content-addressed digest of this MolecularDefinition.
+
+        Records that differ only in `id`, `meta` or other non-identifying
+        elements have the same digest; see `resources.digest.canonical_json`.
+        Computed on first access and kept until an element of the record is
+        assigned; changes made inside a nested element are not tracked.
+        """
+        return content_digest(self)
+
+    def _clear_derived(self) -> None:
+        values = self.__dict__
+        for name in self.DERIVED_PROPERTIES:
+            values.pop(name, None)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        self._clear_derived()
+
+    def model_copy(self, *, update=None, deep: bool = False):
+        """Returns a copy of the model, without the derived values cached on the original."""
+        copy = super().model_copy(update=update, deep=deep)
+        # A deep copy has new elements, which the cached values do not point to.
+        if update or deep:
+            copy._clear_derived()
+        return copy
+
 
 class MolecularDefinitionLocation(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -141,6 +225,7 @@ class MolecularDefinitionLocation(backboneelement.BackboneElement):
     """
 
     __resource_type__ = "MolecularDefinitionLocation"
+    model_config = DEFERRED_BUILD
 
     sequenceLocation: (
         fhirtypesextra.MolecularDefinitionLocationSequenceLocationType | None
@@ -190,6 +275,7 @@ class MolecularDefinitionLocationSequenceLocation(backboneelement.BackboneElemen
     """
 
     __resource_type__ = "MolecularDefinitionLocationSequenceLocation"
+    model_config = DEFERRED_BUILD
 
     sequenceContext: fhirtypes.ReferenceType = Field(  # type: ignore
         ...,
@@ -256,6 +342,7 @@ class MolecularDefinitionLocationSequenceLocationCoordinateInterval(
     """
 
     __resource_type__ = "MolecularDefinitionLocationSequenceLocationCoordinateInterval"
+    model_config = DEFERRED_BUILD
 
     coordinateSystem: (
         fhirtypesextra.MolecularDefinitionLocationSequenceLocationCoordinateIntervalCoordinateSystemType
@@ -375,6 +462,7 @@ class MolecularDefinitionLocationSequenceLocationCoordinateIntervalCoordinateSys
     __resource_type__ = (
         "MolecularDefinitionLocationSequenceLocationCoordinateIntervalCoordinateSystem"
     )
+    model_config = DEFERRED_BUILD
 
     system: fhirtypes.CodeableConceptType | None = Field(  # type: ignore
         None,
@@ -431,6 +519,7 @@ class MolecularDefinitionLocationFeatureLocation(backboneelement.BackboneElement
     """
 
     __resource_type__ = "MolecularDefinitionLocationFeatureLocation"
+    model_config = DEFERRED_BUILD
 
     geneId: list[fhirtypes.CodeableConceptType] | None = Field(  # type: ignore
         None,
@@ -465,6 +554,7 @@ class MolecularDefinitionRepresentation(backboneelement.BackboneElement):
     """
 
     __resource_type__ = "MolecularDefinitionRepresentation"
+    model_config = DEFERRED_BUILD
 
     focus: fhirtypes.CodeableConceptType | None = Field(  # type: ignore
         None,
@@ -594,6 +684,7 @@ class MolecularDefinitionRepresentationLiteral(backboneelement.BackboneElement):
     """
 
     __resource_type__ = "MolecularDefinitionRepresentationLiteral"
+    model_config = DEFERRED_BUILD
 
     encoding: fhirtypes.CodeableConceptType | None = Field(  # type: ignore
         None,
@@ -631,6 +722,12 @@ class MolecularDefinitionRepresentationLiteral(backboneelement.BackboneElement):
             "value",
         ]
 
+    def _serialize_primitive_value(self, value, field_info):
+        """Decodes packed or file-backed `value`s (see `SequenceView`) only when dumped."""
+        if isinstance(value, SequenceView):
+            return str(value)
+        return super()._serialize_primitive_value(value, field_info)
+
 
 class MolecularDefinitionRepresentationExtracted(backboneelement.BackboneElement):
     """Disclaimer: Any field name ends with ``__ext`` doesn't part of
@@ -641,6 +738,7 @@ class MolecularDefinitionRepresentationExtracted(backboneelement.BackboneElement
     """
 
     __resource_type__ = "MolecularDefinitionRepresentationExtracted"
+    model_config = DEFERRED_BUILD
 
     startingMolecule: fhirtypes.ReferenceType = Field(  # type: ignore
         ...,
@@ -706,6 +804,7 @@ class MolecularDefinitionRepresentationExtractedCoordinateInterval(
     """
 
     __resource_type__ = "MolecularDefinitionRepresentationExtractedCoordinateInterval"
+    model_config = DEFERRED_BUILD
 
     coordinateSystem: (
         fhirtypesextra.MolecularDefinitionRepresentationExtractedCoordinateIntervalCoordinateSystemType
@@ -769,6 +868,7 @@ class MolecularDefinitionRepresentationExtractedCoordinateIntervalCoordinateSyst
     __resource_type__ = (
         "MolecularDefinitionRepresentationExtractedCoordinateIntervalCoordinateSystem"
     )
+    model_config = DEFERRED_BUILD
 
     system: fhirtypes.CodeableConceptType | None = Field(  # type: ignore
         None,
@@ -825,6 +925,7 @@ class MolecularDefinitionRepresentationRepeated(backboneelement.BackboneElement)
     """
 
     __resource_type__ = "MolecularDefinitionRepresentationRepeated"
+    model_config = DEFERRED_BUILD
 
     sequenceMotif: fhirtypes.ReferenceType = Field(  # type: ignore
         ...,
@@ -872,6 +973,7 @@ class MolecularDefinitionRepresentationConcatenated(backboneelement.BackboneElem
     """
 
     __resource_type__ = "MolecularDefinitionRepresentationConcatenated"
+    model_config = DEFERRED_BUILD
 
     sequenceElement: (
         list[
@@ -913,6 +1015,7 @@ class MolecularDefinitionRepresentationConcatenatedSequenceElement(
     """
 
     __resource_type__ = "MolecularDefinitionRepresentationConcatenatedSequenceElement"
+    model_config = DEFERRED_BUILD
 
     sequence: fhirtypes.ReferenceType = Field(  # type: ignore
         ...,
@@ -962,6 +1065,7 @@ class MolecularDefinitionRepresentationRelative(backboneelement.BackboneElement)
     """
 
     __resource_type__ = "MolecularDefinitionRepresentationRelative"
+    model_config = DEFERRED_BUILD
 
     startingMolecule: fhirtypes.ReferenceType = Field(  # type: ignore
         ...,
@@ -1013,6 +1117,7 @@ class MolecularDefinitionRepresentationRelativeEdit(backboneelement.BackboneElem
     """
 
     __resource_type__ = "MolecularDefinitionRepresentationRelativeEdit"
+    model_config = DEFERRED_BUILD
 
     editOrder: IntegerType | None = Field(  # type: ignore
         None,
@@ -1095,6 +1200,7 @@ class MolecularDefinitionRepresentationRelativeEditCoordinateInterval(
     __resource_type__ = (
         "MolecularDefinitionRepresentationRelativeEditCoordinateInterval"
     )
+    model_config = DEFERRED_BUILD
 
     coordinateSystem: (
         fhirtypesextra.MolecularDefinitionRepresentationRelativeEditCoordinateIntervalCoordinateSystemType
@@ -1158,6 +1264,7 @@ class MolecularDefinitionRepresentationRelativeEditCoordinateIntervalCoordinateS
     """
 
     __resource_type__ = "MolecularDefinitionRepresentationRelativeEditCoordinateIntervalCoordinateSystem"
+    model_config = DEFERRED_BUILD
 
     system: fhirtypes.CodeableConceptType | None = Field(  # type: ignore
         None,
@@ -1203,3 +1310,20 @@ class MolecularDefinitionRepresentationRelativeEditCoordinateIntervalCoordinateS
             "origin",
             "normalizationMethod",
         ]
+
+
+def build_schemas(*model_classes) -> None:
+    """Builds the deferred validators and serializers of `model_classes` now.
+
+    Schemas are otherwise built when a class is first used, which moves that
+    cost onto the first record. Call this where start-up time is not billed,
+    e.g. in a serverless init phase or before forking worker processes.
+
+    Args:
+        *model_classes (type[MolecularDefinition]): The classes, e.g. profiles,
+            to build. Defaults to `MolecularDefinition`.
+
+    """
+    for model_class in model_classes or (MolecularDefinition,):
+        if not model_class.__pydantic_complete__:
+            model_class.model_rebuild()
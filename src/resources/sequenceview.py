@@ -0,0 +1,264 @@
+from collections.abc import Iterator
+
+
+class SequenceView:
+    """Base class for `str`-compatible, lazily decoded sequence values.
+
+    Subclasses only implement `__len__`, `_decode` and `_slice`; everything else
+    (indexing, comparison with `str`, hashing, ...) is derived from them. A view
+    is decoded to a real `str` only when `str()` is called on it, e.g. when the
+    owning model is serialized.
+    """
+
+    __slots__ = ()
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def _decode(self, start: int, stop: int) -> str:
+        """Returns the bases in ``[start, stop)`` as a `str`."""
+        raise NotImplementedError
+
+    def _slice(self, start: int, stop: int) -> "SequenceView":
+        """Returns a view over ``[start, stop)`` without copying the bases."""
+        raise NotImplementedError
+
+    def __str__(self) -> str:
+        return self._decode(0, len(self))
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return str(self)[key]
+            return self._slice(start, max(start, stop))
+
+        length = len(self)
+        if key < 0:
+            key += length
+        if not 0 <= key < length:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return self._decode(key, key + 1)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(str(self))
+
+    def __contains__(self, item) -> bool:
+        return str(item) in str(self)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, str | SequenceView):
+            return len(self) == len(other) and str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(length={len(self)})"
+
+
+class Alphabet:
+    """A fixed-width code for the bases of a sequence.
+
+    Args:
+        name (str): Name of the alphabet.
+        symbols (str): The symbols in code order, at most ``2 ** bits`` of them.
+        bits (int): Bits per base, 2 or 4.
+
+    """
+
+    __slots__ = ("name", "symbols", "bits", "per_byte", "_encode", "_decode", "_mask")
+
+    def __init__(self, name: str, symbols: str, bits: int):
+        if bits not in (2, 4) or len(symbols) > 2**bits:
+            raise ValueError(f"{len(symbols)} symbols do not fit in {bits} bits.")
+        self.name = name
+        self.symbols = frozenset(symbols)
+        self.bits = bits
+        self.per_byte = 8 // bits
+        raw = symbols.encode("ascii")
+        self._encode = bytes.maketrans(raw, bytes(range(len(raw))))
+        self._decode = bytes.maketrans(bytes(range(len(raw))), raw)
+        self._mask = 2**bits - 1
+
+    def accepts(self, value: str) -> bool:
+        """Whether every character of `value` has a code in this alphabet."""
+        return set(value) <= self.symbols
+
+    def pack(self, value: str) -> bytes:
+        """Packs `value` into ``bits`` per base.
+
+        The codes of every ``per_byte``-th base are combined as big integers, so
+        the work is done by C-level integer and bytes operations, not per base.
+        """
+        codes = value.encode("ascii").translate(self._encode)
+        padding = -len(codes) % self.per_byte
+        codes += bytes(padding)
+        nbytes = len(codes) // self.per_byte
+
+        packed = 0
+        for lane in range(self.per_byte):
+            shift = self.bits * (self.per_byte - 1 - lane)
+            packed |= int.from_bytes(codes[lane :: self.per_byte], "big") << shift
+        return packed.to_bytes(nbytes, "big")
+
+    def unpack(self, data: bytes, start: int, stop: int) -> str:
+        """Decodes the bases ``[start, stop)`` of packed `data`."""
+        if start >= stop:
+            return ""
+        first, last = start // self.per_byte, -(-stop // self.per_byte)
+        chunk = data[first:last]
+        nbytes = len(chunk)
+
+        packed = int.from_bytes(chunk, "big")
+        lane_mask = int.from_bytes(bytes([self._mask]) * nbytes, "big")
+        codes = bytearray(nbytes * self.per_byte)
+        for lane in range(self.per_byte):
+            shift = self.bits * (self.per_byte - 1 - lane)
+            codes[lane :: self.per_byte] = ((packed >> shift) & lane_mask).to_bytes(
+                nbytes, "big"
+            )
+
+        offset = start - first * self.per_byte
+        return (
+            codes[offset : offset + stop - start]
+            .translate(self._decode)
+            .decode("ascii")
+        )
+
+    def __repr__(self) -> str:
+        return f"Alphabet({self.name!r}, bits={self.bits})"
+
+
+NUCLEOTIDE = Alphabet("nucleotide", "ACGT", bits=2)
+IUPAC = Alphabet("iupac", "ACGTURYSWKMBDHVN", bits=4)
+
+# `literal.encoding` codes (lower case) mapped to the alphabet used to pack the value.
+ENCODING_ALPHABETS: dict[str, Alphabet] = {
+    "nucleotide": NUCLEOTIDE,
+    "acgt": NUCLEOTIDE,
+    "iupac": IUPAC,
+}
+
+
+class PackedSequence(SequenceView):
+    """A sequence stored at 2 or 4 bits per base.
+
+    Slicing returns a new `PackedSequence` sharing the same buffer, so taking a
+    subsequence of a chromosome-scale literal does not copy it.
+
+    Args:
+        data (bytes): The packed bases.
+        alphabet (Alphabet): The code `data` is packed with.
+        start (int): Offset, in bases, of the first base of this view.
+        length (int): Number of bases in this view.
+
+    """
+
+    __slots__ = ("data", "alphabet", "start", "length")
+
+    def __init__(self, data: bytes, alphabet: Alphabet, start: int, length: int):
+        self.data = data
+        self.alphabet = alphabet
+        self.start = start
+        self.length = length
+
+    @classmethod
+    def pack(cls, value: str, alphabet: Alphabet) -> "PackedSequence":
+        """Packs `value` with `alphabet`.
+
+        Raises:
+            ValueError: If `value` has a character `alphabet` cannot encode.
+
+        """
+        if not alphabet.accepts(value):
+            raise ValueError(
+                f"The sequence contains characters outside the {alphabet.name} alphabet."
+            )
+        return cls(alphabet.pack(value), alphabet, 0, len(value))
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the shared packed buffer, in bytes."""
+        return len(self.data)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def _decode(self, start: int, stop: int) -> str:
+        return self.alphabet.unpack(self.data, self.start + start, self.start + stop)
+
+    def _slice(self, start: int, stop: int) -> "PackedSequence":
+        return PackedSequence(
+            self.data, self.alphabet, self.start + start, stop - start
+        )
+
+
+def select_alphabet(encoding, value: str) -> Alphabet | None:
+    """Chooses the alphabet a literal value is packed with.
+
+    A code of `encoding` listed in `ENCODING_ALPHABETS` selects the alphabet;
+    without one, the most compact alphabet that can hold `value` is used.
+
+    Args:
+        encoding (CodeableConcept | None): The `encoding` of the literal.
+        value (str): The literal value.
+
+    Returns:
+        Alphabet | None: The alphabet, or None if `value` cannot be packed.
+
+    """
+    if encoding is not None:
+        for coding in encoding.coding or ():
+            alphabet = ENCODING_ALPHABETS.get((coding.code or "").lower())
+            if alphabet is not None:
+                return alphabet if alphabet.accepts(value) else None
+
+    for alphabet in (NUCLEOTIDE, IUPAC):
+        if alphabet.accepts(value):
+            return alphabet
+    return None
+
+
+def pack_literal(literal, min_length: int = 256) -> bool:
+    """Replaces the `value` of a literal representation by a `PackedSequence`.
+
+    The model keeps behaving as before: `literal.value` compares equal to the
+    original string and is decoded back to a `str` when the model is dumped.
+
+    Args:
+        literal (MolecularDefinitionRepresentationLiteral): The literal to pack in place.
+        min_length (int): Values shorter than this are left as `str`.
+
+    Returns:
+        bool: Whether the value was packed.
+
+    """
+    value = literal.value
+    if not isinstance(value, str) or len(value) < min_length:
+        return False
+    alphabet = select_alphabet(literal.encoding, value)
+    if alphabet is None:
+        return False
+    # Bypass assignment validation, which only accepts `str`.
+    literal.__dict__["value"] = PackedSequence.pack(value, alphabet)
+    return True
+
+
+def pack_literals(moldef, min_length: int = 256) -> int:
+    """Packs every literal representation of a MolecularDefinition.
+
+    Args:
+        moldef (MolecularDefinition): The resource, e.g. a `Sequence`.
+        min_length (int): Values shorter than this are left as `str`.
+
+    Returns:
+        int: The number of literals that were packed.
+
+    """
+    packed = 0
+    for rep in moldef.representation or ():
+        if rep.literal is not None and pack_literal(rep.literal, min_length):
+            packed += 1
+    return packed
@@ -0,0 +1,123 @@
+import types
+import typing
+from functools import cache
+from importlib import import_module
+
+from fhir_core.types import FHIR_TYPES_MAPS, FhirBase, FhirElementOrResourceBase
+from pydantic import TypeAdapter
+from pydantic_core import PydanticUndefined
+
+# How the value of an element is turned into its in-model representation.
+_PASS = 0  # used as is (str, int, bool and their FHIR aliases)
+_MODEL = 1  # a nested FHIR model
+_ADAPT = 2  # a primitive stored as a different python type (Decimal, datetime, ...)
+_RESOURCE = 3  # any resource, dispatched on `resourceType` (e.g. `contained`)
+
+_object_new = object.__new__
+_object_setattr = object.__setattr__
+
+
+def _element_kind(annotation) -> tuple[int, typing.Any]:
+    origin = typing.get_origin(annotation)
+    if origin in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        return _element_kind(args[0]) if len(args) == 1 else (_PASS, None)
+    if origin is list:
+        return _element_kind(typing.get_args(annotation)[0])
+    if isinstance(annotation, type) and issubclass(annotation, FhirBase):
+        if issubclass(annotation, FhirElementOrResourceBase):
+            return _RESOURCE, None
+        return _MODEL, annotation.get_model_klass()
+    if origin is typing.Annotated:
+        if typing.get_args(annotation)[0] in (str, int, bool):
+            return _PASS, None
+        return _ADAPT, TypeAdapter(annotation).validate_python
+    return _PASS, None
+
+
+@cache
+def _construction_plan(model_class):
+    """Precomputes, once per class, how every element is built.
+
+    Returns:
+        tuple: ``(elements, defaults, private)`` where `elements` maps both the alias
+        and the field name to ``(field_name, kind, target)``.
+
+    """
+    elements = {}
+    defaults = {}
+    for name, field in model_class.model_fields.items():
+        entry = (name, *_element_kind(field.annotation))
+        elements[field.alias or name] = entry
+        elements.setdefault(name, entry)
+        defaults[name] = None if field.default is PydanticUndefined else field.default
+
+    private = {
+        name: attr.get_default()
+        for name, attr in (model_class.__private_attributes__ or {}).items()
+    }
+    return elements, defaults, private or None
+
+
+def resource_class(data: dict):
+    """Returns the model class of FHIR JSON-like resource `data`, from its `resourceType`."""
+    module, _, name = FHIR_TYPES_MAPS[data["resourceType"] + "Type"].rpartition(".")
+    return getattr(import_module(module), name)
+
+
+def _build(kind: int, target, value):
+    if kind == _MODEL:
+        return construct_trusted(target, value)
+    if kind == _ADAPT:
+        return target(value)
+    return construct_trusted(resource_class(value), value)
+
+
+def construct_trusted(model_class, data: dict):
+    """Builds `model_class`, and every nested model, from already validated data.
+
+    This is the recursive counterpart of pydantic's `model_construct`: no validator
+    runs, values are only converted to the python type the model stores them as
+    (e.g. nested dicts to models, decimals to `Decimal`).
+
+    Args:
+        model_class (type[FHIRAbstractModel]): The model to build.
+        data (dict): FHIR JSON-like data, keyed by element alias or field name.
+
+    Raises:
+        ValueError: If `data` contains an element `model_class` does not define.
+
+    Returns:
+        FHIRAbstractModel: An instance of `model_class`.
+
+    """
+    elements, defaults, private = _construction_plan(model_class)
+    values = defaults.copy()
+    fields_set = set()
+
+    for key, value in data.items():
+        if key == "resourceType":
+            continue
+        try:
+            name, kind, target = elements[key]
+        except KeyError:
+            raise ValueError(
+                f"`{key}` is not an element of {model_class.__name__}."
+            ) from None
+
+        if kind and value is not None:
+            if value.__class__ is list:
+                value = [_build(kind, target, item) for item in value]
+            else:
+                value = _build(kind, target, value)
+        values[name] = value
+        fields_set.add(name)
+
+    instance = _object_new(model_class)
+    _object_setattr(instance, "__dict__", values)
+    _object_setattr(instance, "__pydantic_fields_set__", fields_set)
+    _object_setattr(instance, "__pydantic_extra__", None)
+    _object_setattr(
+        instance, "__pydantic_private__", None if private is None else private.copy()
+    )
+    return instance
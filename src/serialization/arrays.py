@@ -0,0 +1,184 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from representations.references import reference_string
+from resources.coordinates import normalize_interval
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+MISSING = -1
+
+
+def require_numpy():
+    """Returns the numpy module.
+
+    Raises:
+        ImportError: If numpy is not installed.
+
+    """
+    if np is None:
+        raise ImportError(
+            "numpy is required for columnar arrays, install it with `pip install moldef.spec[numpy]`."
+        )
+    return np
+
+
+def concept_code(concept) -> str | None:
+    """Returns the first code of a CodeableConcept, falling back on its text."""
+    if concept is None:
+        return None
+    for coding in concept.coding or ():
+        if coding.code:
+            return coding.code
+    return concept.text
+
+
+class Categories:
+    """Dictionary encoding of the values of a categorical column."""
+
+    __slots__ = ("values", "_codes")
+
+    def __init__(self):
+        self.values: list[str] = []
+        self._codes: dict[str, int] = {}
+
+    def encode(self, value: str | None) -> int:
+        """Returns the code of `value`, `MISSING` for None."""
+        if value is None:
+            return MISSING
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+@dataclass(frozen=True, slots=True)
+class RecordArrays:
+    """Columns extracted from a list of MolecularDefinitions, one row per record.
+
+    `start`/`end` are 0-based, half-open coordinates of the first sequence
+    location (`MISSING` without one). `sequence_context`, `molecule_type` and
+    `strand` hold codes into `categories`; `focus` is a bitmask whose bit ``i``
+    is set when a representation has the focus ``categories["focus"][i]``.
+    """
+
+    start: "np.ndarray"
+    end: "np.ndarray"
+    sequence_context: "np.ndarray"
+    molecule_type: "np.ndarray"
+    strand: "np.ndarray"
+    focus: "np.ndarray"
+    categories: dict[str, list[str]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def code(self, column: str, value: str) -> int:
+        """Returns the code of `value` in a categorical column, `MISSING` if absent."""
+        values = self.categories[column]
+        return values.index(value) if value in values else MISSING
+
+    def decode(self, column: str) -> list[str | None]:
+        """Returns the values of a categorical column."""
+        values = self.categories[column]
+        return [
+            None if code == MISSING else values[code] for code in getattr(self, column)
+        ]
+
+    def has_focus(self, focus: str) -> "np.ndarray":
+        """Returns a mask of the records with a representation of focus `focus`."""
+        values = self.categories["focus"]
+        if focus not in values:
+            return np.zeros(len(self), dtype=bool)
+        return (self.focus >> np.uint64(values.index(focus))) & np.uint64(1) == 1
+
+    def overlapping(self, context: str, start: int, end: int) -> "np.ndarray":
+        """Returns a mask of the records overlapping ``[start, end)`` on `context`."""
+        code = self.code("sequence_context", context)
+        # Records without a context hold `MISSING` too; they overlap nothing.
+        if code == MISSING:
+            return np.zeros(len(self), dtype=bool)
+        return (
+            (self.sequence_context == code)
+            & (self.start < end)
+            & (self.end > start)
+            & (self.start != MISSING)
+        )
+
+
+def to_arrays(records: Iterable) -> RecordArrays:
+    """Extracts coordinates and codes of MolecularDefinitions into NumPy columns.
+
+    The records are walked once; every later filter, sort or overlap test can
+    then run vectorized.
+
+    Args:
+        records (Iterable[MolecularDefinition]): e.g. Alleles or Variations.
+
+    Raises:
+        ImportError: If numpy is not installed.
+        UnsupportedCoordinateSystem: If an interval's coordinate system is not supported.
+
+    Returns:
+        RecordArrays: The columns.
+
+    """
+    np = require_numpy()
+    contexts = Categories()
+    molecule_types = Categories()
+    strands = Categories()
+    foci = Categories()
+    starts, ends, context_codes, type_codes, strand_codes, focus_masks = (
+        [] for _ in range(6)
+    )
+
+    for record in records:
+        start = end = MISSING
+        context = strand = None
+        for location in getattr(record, "location", None) or ():
+            sequence_location = location.sequenceLocation
+            if sequence_location is None:
+                continue
+            context = reference_string(sequence_location.sequenceContext)
+            strand = concept_code(sequence_location.strand)
+            if sequence_location.coordinateInterval is not None:
+                start, end = normalize_interval(sequence_location.coordinateInterval)
+            break
+
+        molecule_type = record.moleculeType
+        if isinstance(molecule_type, list):
+            molecule_type = molecule_type[0] if molecule_type else None
+
+        mask = 0
+        for representation in record.representation or ():
+            focus = concept_code(representation.focus)
+            if focus is not None:
+                mask |= 1 << foci.encode(focus)
+
+        starts.append(start)
+        ends.append(end)
+        context_codes.append(contexts.encode(context))
+        type_codes.append(molecule_types.encode(concept_code(molecule_type)))
+        strand_codes.append(strands.encode(strand))
+        focus_masks.append(mask)
+
+    if len(foci.values) > 64:
+        raise ValueError("More than 64 distinct focus codes cannot be encoded.")
+    return RecordArrays(
+        start=np.array(starts, dtype=np.int64),
+        end=np.array(ends, dtype=np.int64),
+        sequence_context=np.array(context_codes, dtype=np.int32),
+        molecule_type=np.array(type_codes, dtype=np.int32),
+        strand=np.array(strand_codes, dtype=np.int32),
+        focus=np.array(focus_masks, dtype=np.uint64),
+        categories={
+            "sequence_context": contexts.values,
+            "molecule_type": molecule_types.values,
+            "strand": strands.values,
+            "focus": foci.values,
+        },
+    )
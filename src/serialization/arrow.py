@@ -0,0 +1,322 @@
+import json
+from collections.abc import Iterable, Iterator
+from contextlib import suppress
+from itertools import islice
+
+from exceptions.fhir import CoordinateError
+from resources.coordinates import normalize_interval
+from resources.moleculardefinition import MolecularDefinition
+from serialization.fastjson import to_dict
+from validation.records import validate_record
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = ds = pq = None
+
+# Marks the position of a repeated element in a path.
+EACH = "*"
+
+_LOCATION = ("location", 0, "sequenceLocation")
+_INTERVAL = (*_LOCATION, "coordinateInterval")
+_SYSTEM = (*_INTERVAL, "coordinateSystem", "system", "coding", 0)
+
+# Flattened columns: (name, path in the FHIR JSON, value type). A path holding
+# `EACH` is stored as a list column, one item per repeated element.
+COLUMNS: tuple[tuple[str, tuple, type], ...] = (
+    ("id", ("id",), str),
+    ("molecule_type_system", ("moleculeType", "coding", 0, "system"), str),
+    ("molecule_type_code", ("moleculeType", "coding", 0, "code"), str),
+    ("molecule_type_display", ("moleculeType", "coding", 0, "display"), str),
+    ("sequence_context", (*_LOCATION, "sequenceContext", "reference"), str),
+    ("sequence_context_type", (*_LOCATION, "sequenceContext", "type"), str),
+    ("sequence_context_display", (*_LOCATION, "sequenceContext", "display"), str),
+    ("coordinate_system_uri", (*_SYSTEM, "system"), str),
+    ("coordinate_system", (*_SYSTEM, "code"), str),
+    ("coordinate_system_display", (*_SYSTEM, "display"), str),
+    ("start_value", (*_INTERVAL, "startQuantity", "value"), int),
+    ("end_value", (*_INTERVAL, "endQuantity", "value"), int),
+    ("strand", (*_LOCATION, "strand", "coding", 0, "code"), str),
+    ("identifier_system", ("identifier", EACH, "system"), str),
+    ("identifier_value", ("identifier", EACH, "value"), str),
+    ("focus_system", ("representation", EACH, "focus", "coding", 0, "system"), str),
+    ("focus", ("representation", EACH, "focus", "coding", 0, "code"), str),
+    ("focus_display", ("representation", EACH, "focus", "coding", 0, "display"), str),
+    ("literal_value", ("representation", EACH, "literal", "value"), str),
+    (
+        "literal_encoding",
+        ("representation", EACH, "literal", "encoding", "coding", 0, "code"),
+        str,
+    ),
+)
+
+# Normalized 0-based, half-open interval, written for filtering only.
+DERIVED_COLUMNS = ("start", "end")
+# Everything that is not flattened, as FHIR JSON.
+EXTRA_COLUMN = "extra"
+
+
+def require_pyarrow():
+    """Returns the pyarrow module.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+
+    """
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required for Arrow and Parquet, install it with `pip install moldef.spec[arrow]`."
+        )
+    return pa
+
+
+def schema() -> "pa.Schema":
+    """Returns the Arrow schema of flattened MolecularDefinitions."""
+    require_pyarrow()
+    arrow_types = {str: pa.string(), int: pa.int64()}
+    fields = []
+    for name, path, value_type in COLUMNS:
+        arrow_type = arrow_types[value_type]
+        fields.append(
+            pa.field(name, pa.list_(arrow_type) if EACH in path else arrow_type)
+        )
+    fields += [pa.field(name, pa.int64()) for name in DERIVED_COLUMNS]
+    fields.append(pa.field(EXTRA_COLUMN, pa.string()))
+    return pa.schema(fields)
+
+
+def _accepts(value, value_type: type):
+    if value_type is int:
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return None
+    return value if isinstance(value, value_type) else None
+
+
+def _pop(node, path: tuple, value_type: type):
+    """Removes and returns the value at `path`, None if it is absent or of another type."""
+    key, rest = path[0], path[1:]
+    if isinstance(key, int):
+        if not isinstance(node, list) or key >= len(node):
+            return None
+    elif not isinstance(node, dict) or key not in node:
+        return None
+    if rest:
+        return _pop(node[key], rest, value_type)
+    value = _accepts(node[key], value_type)
+    if value is not None:
+        node[key] = None
+    return value
+
+
+def _prune(node):
+    """Drops emptied branches, keeping placeholders so list positions are unchanged."""
+    if isinstance(node, dict):
+        pruned = {}
+        for key, value in node.items():
+            value = _prune(value)
+            if value is not None:
+                pruned[key] = value
+        return pruned or None
+    if isinstance(node, list):
+        pruned = [_prune(item) for item in node]
+        while pruned and pruned[-1] is None:
+            pruned.pop()
+        return [{} if item is None else item for item in pruned] or None
+    return node
+
+
+def _put(node, path: tuple, value) -> None:
+    for key, next_key in zip(path, path[1:], strict=False):
+        container = [] if isinstance(next_key, int) else {}
+        if isinstance(key, int):
+            while len(node) <= key:
+                node.append(None)
+            if node[key] is None:
+                node[key] = container
+            node = node[key]
+        else:
+            node = node.setdefault(key, container)
+    last = path[-1]
+    if isinstance(last, int):
+        while len(node) <= last:
+            node.append(None)
+    node[last] = value
+
+
+def _merge(base, extra):
+    if isinstance(base, dict) and isinstance(extra, dict):
+        for key, value in extra.items():
+            base[key] = _merge(base[key], value) if key in base else value
+        return base
+    if isinstance(base, list) and isinstance(extra, list):
+        for index, value in enumerate(extra):
+            if index < len(base):
+                base[index] = _merge(base[index], value)
+            else:
+                base.append(value)
+        return base
+    return extra
+
+
+def flatten(record) -> dict:
+    """Flattens one MolecularDefinition into a row of `schema()`.
+
+    Returns:
+        dict: The column values; what no column holds is kept as JSON in `extra`.
+
+    """
+    data = to_dict(record)
+    data.pop("resourceType", None)
+    row = {}
+    for name, path, value_type in COLUMNS:
+        if EACH in path:
+            split = path.index(EACH)
+            items = data
+            for key in path[:split]:
+                items = items.get(key) if isinstance(items, dict) else None
+            row[name] = (
+                [_pop(item, path[split + 1 :], value_type) for item in items]
+                if isinstance(items, list)
+                else None
+            )
+        else:
+            row[name] = _pop(data, path, value_type)
+
+    start = end = None
+    for location in getattr(record, "location", None) or ():
+        sequence_location = location.sequenceLocation
+        if sequence_location is not None and sequence_location.coordinateInterval:
+            with suppress(CoordinateError):
+                start, end = normalize_interval(sequence_location.coordinateInterval)
+        break
+    row["start"], row["end"] = start, end
+
+    extra = _prune(data)
+    row[EXTRA_COLUMN] = None if extra is None else json.dumps(extra)
+    return row
+
+
+def unflatten(row: dict) -> dict:
+    """Rebuilds the FHIR JSON of a row produced by `flatten`."""
+    data = {"resourceType": "MolecularDefinition"}
+    for name, path, _ in COLUMNS:
+        value = row.get(name)
+        if value is None:
+            continue
+        if EACH in path:
+            split = path.index(EACH)
+            for index, item in enumerate(value):
+                if item is not None:
+                    _put(data, (*path[:split], index, *path[split + 1 :]), item)
+        else:
+            _put(data, path, value)
+    if row.get(EXTRA_COLUMN):
+        data = _merge(data, json.loads(row[EXTRA_COLUMN]))
+    return _fill(data)
+
+
+def _fill(node):
+    # List slots only set in `extra` or in other columns are placeholders.
+    if isinstance(node, dict):
+        return {key: _fill(value) for key, value in node.items()}
+    if isinstance(node, list):
+        return [{} if item is None else _fill(item) for item in node]
+    return node
+
+
+def to_record_batches(
+    records: Iterable, batch_size: int = 10_000
+) -> Iterator["pa.RecordBatch"]:
+    """Streams MolecularDefinitions as Arrow record batches of `batch_size` rows.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+
+    """
+    arrow_schema = schema()
+    records = iter(records)
+    while batch := list(islice(records, batch_size)):
+        rows = [flatten(record) for record in batch]
+        yield pa.RecordBatch.from_pylist(rows, schema=arrow_schema)
+
+
+def write_parquet(records: Iterable, path, batch_size: int = 10_000, **options) -> int:
+    """Writes MolecularDefinitions to a Parquet file, one row group per batch.
+
+    Sorting the records by `sequence_context` and position first makes the row
+    group statistics selective, so `read_parquet` filters can skip most groups.
+
+    Args:
+        records (Iterable[MolecularDefinition]): The records.
+        path (str | os.PathLike): The Parquet file.
+        batch_size (int): Rows per record batch and row group.
+        **options: Passed to `pyarrow.parquet.ParquetWriter`, e.g. `compression`.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+
+    Returns:
+        int: The number of records written.
+
+    """
+    require_pyarrow()
+    written = 0
+    with pq.ParquetWriter(path, schema(), **options) as writer:
+        for batch in to_record_batches(records, batch_size):
+            writer.write_batch(batch, row_group_size=batch_size)
+            written += batch.num_rows
+    return written
+
+
+def interval_filter(context: str, start: int | None = None, end: int | None = None):
+    """Returns a filter for the records on `context` overlapping ``[start, end)``.
+
+    Coordinates are 0-based, half-open; either bound may be omitted.
+    """
+    require_pyarrow()
+    expression = ds.field("sequence_context") == context
+    if end is not None:
+        expression &= ds.field("start") < end
+    if start is not None:
+        expression &= ds.field("end") > start
+    return expression
+
+
+def from_record_batch(batch: "pa.RecordBatch", model_class=MolecularDefinition) -> list:
+    """Rebuilds the records of a record batch as `model_class` instances."""
+    return [validate_record(model_class, unflatten(row)) for row in batch.to_pylist()]
+
+
+def read_parquet(
+    path,
+    model_class=MolecularDefinition,
+    filter=None,
+    batch_size: int = 10_000,
+) -> Iterator:
+    """Streams the records of a Parquet file written by `write_parquet`.
+
+    `filter` is pushed down to the scan: row groups whose statistics cannot
+    match are skipped without being read.
+
+    Args:
+        path (str | os.PathLike): The Parquet file, or a directory of them.
+        model_class (type[MolecularDefinition]): The class, e.g. a profile, to build.
+        filter (pyarrow.compute.Expression | None): e.g. `interval_filter(...)`.
+        batch_size (int): Rows decoded at a time.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+
+    Yields:
+        MolecularDefinition: The records, as `model_class` instances.
+
+    """
+    require_pyarrow()
+    dataset = ds.dataset(path, format="parquet")
+    for batch in dataset.to_batches(filter=filter, batch_size=batch_size):
+        yield from from_record_batch(batch, model_class)
@@ -0,0 +1,158 @@
+import base64
+import datetime
+import decimal
+import json
+from collections.abc import Iterable
+from functools import cache
+
+from fhir_core.fhirabstractmodel import FHIR_COMMENTS_FIELD_NAME, FHIRAbstractModel
+from pydantic_core import to_jsonable_python
+
+from resources.sequenceview import SequenceView
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+_CONTAINERS = (list, dict)
+
+
+@cache
+def element_plan(model_class) -> tuple:
+    """Returns, once per class, the elements to write in `elements_sequence` order.
+
+    Returns:
+        tuple: ``(resource_type, elements)`` where `elements` holds
+        ``(field_name, json_key, extension_field_name, extension_json_key)``.
+
+    """
+    fields = model_class.model_fields
+    alias_mapping = model_class.get_alias_mapping()
+    elements = []
+    for prop_name in model_class.elements_sequence():
+        name = alias_mapping[prop_name]
+        extension = f"{name}__ext"
+        extension_field = fields.get(extension)
+        elements.append(
+            (
+                name,
+                fields[name].alias or name,
+                extension if extension_field is not None else None,
+                extension_field.alias if extension_field is not None else None,
+            )
+        )
+    resource_type = (
+        model_class.__resource_type__ if model_class.has_resource_base() else None
+    )
+    return resource_type, tuple(elements)
+
+
+def _members(model):
+    """Yields the ``(json_key, value)`` pairs of `model` that are not empty."""
+    resource_type, elements = element_plan(type(model))
+    values = model.__dict__
+    if resource_type is not None:
+        yield "resourceType", resource_type
+    for name, key, extension, extension_key in elements:
+        value = values.get(name)
+        if value is not None and (value or value.__class__ not in _CONTAINERS):
+            yield key, value
+        if extension is not None:
+            value = values.get(extension)
+            if value is not None and (value or value.__class__ not in _CONTAINERS):
+                yield extension_key, value
+    comments = values.get(FHIR_COMMENTS_FIELD_NAME)
+    if comments:
+        yield FHIR_COMMENTS_FIELD_NAME, comments
+
+
+def _default(value):
+    """Converts what the JSON encoder cannot write natively, one level at a time."""
+    if isinstance(value, FHIRAbstractModel):
+        return dict(_members(value))
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if isinstance(value, SequenceView):
+        return str(value)
+    if isinstance(value, bytes | bytearray):
+        return base64.b64encode(value).decode("ascii")
+    if isinstance(value, datetime.date | datetime.time):
+        # The serializer of `model_dump_json`: UTC instants keep their "Z".
+        return to_jsonable_python(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def to_dict(model) -> dict:
+    """Converts `model`, and every nested model, to FHIR JSON-compatible builtins."""
+    return {key: _to_builtin(value) for key, value in _members(model)}
+
+
+def _to_builtin(value):
+    if isinstance(value, list):
+        return [_to_builtin(item) for item in value]
+    if isinstance(value, FHIRAbstractModel):
+        return to_dict(value)
+    if isinstance(value, str | int | float | bool):
+        return value
+    return _default(value)
+
+
+def dumps(model) -> bytes:
+    """Serializes `model` to FHIR JSON bytes.
+
+    Element order follows `elements_sequence`, cached per class, and empty
+    elements are skipped. Nested models are converted one level at a time while
+    the encoder writes, so no intermediate dict tree is built. orjson is used
+    when it is installed, the `json` module otherwise.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            model, default=_default, option=orjson.OPT_PASSTHROUGH_DATETIME
+        )
+    return json.dumps(
+        model, default=_default, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def write_ndjson(records: Iterable, fp) -> int:
+    """Writes one record per line to binary file `fp`.
+
+    Returns:
+        int: The number of records written.
+
+    """
+    count = 0
+    for record in records:
+        fp.write(dumps(record))
+        fp.write(b"\n")
+        count += 1
+    return count
+
+
+def write_bundle(records: Iterable, fp, bundle_type: str = "collection") -> int:
+    """Streams `records` to binary file `fp` as the entries of a FHIR Bundle.
+
+    The Bundle is written as it goes, without holding all records in memory.
+
+    Returns:
+        int: The number of entries written.
+
+    """
+    fp.write(b'{"resourceType":"Bundle","type":' + dumps_value(bundle_type))
+    fp.write(b',"entry":[')
+    count = 0
+    for record in records:
+        fp.write(b'{"resource":' if not count else b',{"resource":')
+        fp.write(dumps(record))
+        fp.write(b"}")
+        count += 1
+    fp.write(b"]}")
+    return count
+
+
+def dumps_value(value) -> bytes:
+    """Serializes a plain JSON value."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
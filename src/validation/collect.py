@@ -0,0 +1,102 @@
+import dataclasses
+
+from pydantic import ValidationError
+
+from exceptions.fhir import FHIRException
+from profiles.violations import Violation, collecting
+from resources.moleculardefinition import MolecularDefinition
+from validation.records import validate_json_record, validate_record
+
+
+def json_path(loc: tuple) -> str:
+    """Converts a pydantic error location, e.g. ``("location", 0, "sequenceLocation")``, to a JSON path."""
+    path = "$"
+    for part in loc:
+        path += f"[{part}]" if isinstance(part, int) else f".{part}"
+    return path
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ValidationReport:
+    """Every problem found in one record, by a single validation pass.
+
+    Attributes:
+        model (MolecularDefinition | None): The validated record, None if it is invalid.
+        violations (tuple[Violation, ...]): The profile rules the record breaks.
+        errors (tuple[dict, ...]): pydantic error details, for records that do not
+            even match the structure of the resource.
+
+    """
+
+    model: MolecularDefinition | None
+    violations: tuple[Violation, ...] = ()
+    errors: tuple[dict, ...] = ()
+
+    @property
+    def valid(self) -> bool:
+        """Whether the record passed validation."""
+        return self.model is not None
+
+    def entries(self) -> list[dict]:
+        """Returns one ``{"path", "error", "message"}`` dict per problem, e.g. to dump as JSON.
+
+        Profile violations also hold the structured fields of their exception,
+        e.g. ``"index"`` and ``"code"``.
+        """
+        entries = [
+            {
+                "path": violation.path,
+                "error": violation.error,
+                "message": violation.message,
+                **violation.exception.fields,
+            }
+            for violation in self.violations
+        ]
+        entries += [
+            {
+                "path": json_path(error["loc"]),
+                "error": error["type"],
+                "message": error["msg"],
+            }
+            for error in self.errors
+        ]
+        return entries
+
+
+def validate_all(
+    data: dict | str | bytes, profile: type[MolecularDefinition] = MolecularDefinition
+) -> ValidationReport:
+    """Validates a record once, collecting every violation instead of stopping at the first.
+
+    Profile rules that do not hold are recorded with the JSON path of the
+    offending element, and validation goes on with the next rule.
+
+    Args:
+        data (dict | str | bytes): The record, as FHIR JSON or a dict.
+        profile (type[MolecularDefinition]): The class the record is validated against.
+
+    Returns:
+        ValidationReport: The model when the record is valid, every problem found otherwise.
+
+    Example:
+        >>> report = validate_all(record, profile=Variation)
+        >>> for entry in report.entries():
+        ...     print(entry["path"], entry["message"])
+
+    """
+    model = None
+    errors = ()
+    with collecting() as violations:
+        try:
+            if isinstance(data, str | bytes | bytearray):
+                model = validate_json_record(profile, data)
+            else:
+                model = validate_record(profile, data)
+        except ValidationError as exc:
+            errors = tuple(exc.errors(include_url=False, include_input=False))
+        except FHIRException as exc:
+            # Raised outside of a profile rule, e.g. while resolving a coordinate system.
+            violations.append(Violation("$", exc))
+    if violations:
+        model = None
+    return ValidationReport(model, tuple(violations), errors)
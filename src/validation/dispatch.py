@@ -0,0 +1,234 @@
+import time
+from collections.abc import Iterable, Iterator
+
+from pydantic import ValidationError
+
+from exceptions.fhir import FHIRException
+from profiles.allele import Allele
+from profiles.sequence import Sequence
+from profiles.variation import Variation
+from resources.moleculardefinition import MolecularDefinition
+from validation.ndjson import RecordError, ValidationStats, to_record_error
+from validation.records import loads, validate_record
+
+PROFILES = (Sequence, Allele, Variation)
+
+
+class ProfileDetector:
+    """Picks the profile a raw MolecularDefinition dict should be validated against.
+
+    The rules are tried in order:
+
+    1. a `meta.profile` canonical whose last segment names a profile, e.g.
+       ``http://hl7.org/fhir/StructureDefinition/sequence``;
+    2. `memberState`, which none of the profiles allows: the base class;
+    3. a `representation.focus` code that belongs to the slices of a single
+       profile, e.g. ``allele-state`` (Allele) or ``reference-state`` (Variation);
+    4. no `location`: Sequence;
+    5. otherwise the base `MolecularDefinition`.
+
+    The detector only looks at the raw dict; it does not validate it.
+
+    Args:
+        profiles (Iterable[type[MolecularDefinition]]): The candidate profile classes.
+        default (type[MolecularDefinition]): The class used when no rule applies.
+
+    """
+
+    def __init__(
+        self,
+        profiles: Iterable[type[MolecularDefinition]] = PROFILES,
+        default: type[MolecularDefinition] = MolecularDefinition,
+    ):
+        self.profiles = tuple(profiles)
+        self.default = default
+        self.by_name = {profile.__name__.lower(): profile for profile in self.profiles}
+
+        owners = {}
+        for profile in self.profiles:
+            for code in getattr(profile, "EXPECTED_DISPLAY", {}):
+                owners.setdefault(code, set()).add(profile)
+        # Codes shared by several profiles (e.g. "context-state") decide nothing.
+        self.by_focus = {
+            code: next(iter(classes))
+            for code, classes in owners.items()
+            if len(classes) == 1
+        }
+        self.without_location = next(
+            (
+                profile
+                for profile in self.profiles
+                if "location" not in profile.model_fields
+            ),
+            None,
+        )
+
+    def _declared(self, data: dict):
+        meta = data.get("meta")
+        if not isinstance(meta, dict):
+            return None
+        for url in meta.get("profile") or ():
+            if isinstance(url, str):
+                name = url.partition("|")[0].rstrip("/").rpartition("/")[2]
+                profile = self.by_name.get(name.lower())
+                if profile is not None:
+                    return profile
+        return None
+
+    def _by_focus(self, representations):
+        by_focus = self.by_focus
+        for rep in representations:
+            focus = rep.get("focus") if isinstance(rep, dict) else None
+            if not isinstance(focus, dict):
+                continue
+            for coding in focus.get("coding") or ():
+                if isinstance(coding, dict):
+                    profile = by_focus.get(coding.get("code"))
+                    if profile is not None:
+                        return profile
+        return None
+
+    def detect(self, data) -> type[MolecularDefinition]:
+        """Returns the class `data` should be validated against.
+
+        Args:
+            data (dict): A raw MolecularDefinition, as decoded from FHIR JSON.
+
+        Returns:
+            type[MolecularDefinition]: One of `profiles`, or `default`.
+
+        """
+        if not isinstance(data, dict):
+            return self.default
+        profile = self._declared(data)
+        if profile is not None:
+            return profile
+        if data.get("memberState"):
+            return self.default
+        representations = data.get("representation")
+        if isinstance(representations, list):
+            profile = self._by_focus(representations)
+            if profile is not None:
+                return profile
+        if self.without_location is not None and not data.get("location"):
+            return self.without_location
+        return self.default
+
+
+class ProfileDispatcher:
+    """Validates a stream mixing profiles, each record once against its detected class.
+
+    Args:
+        detector (ProfileDetector | None): Picks the class of every record, the default rules if omitted.
+
+    Attributes:
+        stats (dict[str, ValidationStats]): Counters of every class used so far, by class name.
+
+    """
+
+    def __init__(self, detector: ProfileDetector | None = None):
+        self.detector = detector if detector is not None else ProfileDetector()
+        self.stats: dict[str, ValidationStats] = {}
+
+    def validate(self, data: dict, line: int = 1):
+        """Detects the profile of a raw dict and validates it against that class.
+
+        Args:
+            data (dict): A raw MolecularDefinition.
+            line (int): 1-based position of the record, used for error reporting.
+
+        Returns:
+            MolecularDefinition | RecordError: The validated model, or the error describing why it failed.
+
+        """
+        profile = self.detector.detect(data)
+        stats = self.stats.get(profile.__name__)
+        if stats is None:
+            stats = self.stats[profile.__name__] = ValidationStats()
+
+        started = time.perf_counter()
+        try:
+            result = validate_record(profile, data)
+        except (ValidationError, FHIRException) as exc:
+            result = to_record_error(line, exc)
+            stats.invalid += 1
+        else:
+            stats.valid += 1
+        stats.elapsed += time.perf_counter() - started
+        stats.records += 1
+        return result
+
+    def iter_records(self, records: Iterable[dict]) -> Iterator:
+        """Validates every raw dict of `records`, yielding results in input order.
+
+        Yields:
+            MolecularDefinition | RecordError: One result per record.
+
+        """
+        for line, data in enumerate(records, start=1):
+            yield self.validate(data, line)
+
+    def iter_lines(self, lines: Iterable[str | bytes]) -> Iterator:
+        """Decodes and validates every non-blank NDJSON line of `lines`.
+
+        Lines that are not valid JSON are reported as a `RecordError` and are not
+        counted in any profile's stats.
+
+        Yields:
+            MolecularDefinition | RecordError: One result per non-blank line.
+
+        """
+        for line, raw in enumerate(lines, start=1):
+            if not raw.strip():
+                continue
+            try:
+                data = loads(raw)
+            except ValueError as exc:
+                yield RecordError(line=line, error=type(exc).__name__, cause=exc)
+                continue
+            yield self.validate(data, line)
+
+    def iter_file(self, path) -> Iterator:
+        """Validates every record of the NDJSON file at `path`.
+
+        Yields:
+            MolecularDefinition | RecordError: One result per non-blank line.
+
+        """
+        with open(path, "rb") as handle:
+            yield from self.iter_lines(handle)
+
+    def report(self) -> dict[str, dict]:
+        """Returns the counters and throughput of every class, by class name."""
+        return {
+            name: {
+                "records": stats.records,
+                "valid": stats.valid,
+                "invalid": stats.invalid,
+                "records_per_second": round(stats.records_per_second, 1),
+            }
+            for name, stats in self.stats.items()
+        }
+
+
+def dispatch_ndjson(path, dispatcher: ProfileDispatcher | None = None) -> Iterator:
+    """Streams validated models (or `RecordError`s) from an NDJSON file mixing profiles.
+
+    Args:
+        path (str | os.PathLike): Location of the NDJSON file.
+        dispatcher (ProfileDispatcher | None): The dispatcher to use, e.g. to read its `stats` afterwards.
+
+    Returns:
+        Iterator: Models of the detected classes and `RecordError`s, in file order.
+
+    Example:
+        >>> dispatcher = ProfileDispatcher()
+        >>> for result in dispatch_ndjson("feed.ndjson", dispatcher):
+        ...     if isinstance(result, RecordError):
+        ...         print(result.line, result.message)
+        >>> dispatcher.report()
+        {'Variation': {'records': 120, 'valid': 118, 'invalid': 2, 'records_per_second': 2310.4}, ...}
+
+    """
+    dispatcher = dispatcher if dispatcher is not None else ProfileDispatcher()
+    return dispatcher.iter_file(path)
@@ -0,0 +1,244 @@
+import dataclasses
+import time
+from collections.abc import Iterable, Iterator
+from functools import partial
+from itertools import islice
+
+from pydantic import ValidationError
+
+from exceptions.fhir import FHIRException
+from resources.moleculardefinition import MolecularDefinition
+from validation.collect import ValidationReport, validate_all
+from validation.records import validate_json_record
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class RecordError:
+    """A record that failed validation.
+
+    Attributes:
+        line (int): 1-based position of the record in its source (the line number for NDJSON).
+        error (str): Name of the exception class raised during validation.
+        cause (Exception | str): The exception `message` is rendered from, or the message itself.
+        details (tuple): pydantic error details, empty for profile (`FHIRException`) errors.
+        violations (tuple[Violation, ...]): Every profile violation, when validated with `collect_all`.
+        code (str | None): Stable identifier of a profile error, e.g. ``"missing-focus"``.
+        fields (dict): Structured fields of a profile error, e.g. ``{"index": 1}``.
+
+    """
+
+    line: int
+    error: str
+    cause: Exception | str
+    details: tuple = ()
+    violations: tuple = ()
+    code: str | None = None
+    fields: dict = dataclasses.field(default_factory=dict)
+
+    @property
+    def message(self) -> str:
+        """Human readable description of the failure, rendered when first read."""
+        return str(self.cause)
+
+    def rendered(self) -> "RecordError":
+        """Returns a copy holding the message instead of the exception, e.g. to pickle it."""
+        return dataclasses.replace(self, cause=self.message)
+
+
+@dataclasses.dataclass(slots=True)
+class ValidationStats:
+    """Running counters for a validation run.
+
+    `elapsed` only accounts for the time spent decoding and validating records,
+    not the time the caller spends consuming the results.
+    """
+
+    records: int = 0
+    valid: int = 0
+    invalid: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def records_per_second(self) -> float:
+        """Throughput of the run so far."""
+        return self.records / self.elapsed if self.elapsed else 0.0
+
+
+def to_record_error(line: int, exc: Exception) -> RecordError:
+    """Converts a validation failure into a `RecordError`.
+
+    The message is only rendered if it is read; the traceback is dropped so
+    that a kept error does not hold the frames of the validation.
+    """
+    exc = exc.with_traceback(None)
+    if isinstance(exc, ValidationError):
+        return RecordError(
+            line=line,
+            error=type(exc).__name__,
+            cause=exc,
+            details=tuple(exc.errors(include_url=False, include_input=False)),
+        )
+    return RecordError(
+        line=line,
+        error=type(exc).__name__,
+        cause=exc,
+        code=getattr(exc, "error_code", None),
+        fields=getattr(exc, "fields", {}),
+    )
+
+
+def report_to_record_error(line: int, report: ValidationReport) -> RecordError:
+    """Converts the report of an invalid record into a `RecordError`.
+
+    `error` and `message` describe the first problem; `violations` and
+    `details` hold all of them.
+    """
+    if report.violations:
+        first = report.violations[0]
+        return RecordError(
+            line=line,
+            error=first.error,
+            cause=first.exception,
+            details=report.errors,
+            violations=report.violations,
+            code=first.code,
+            fields=first.exception.fields,
+        )
+    return RecordError(
+        line=line,
+        error=ValidationError.__name__,
+        cause=report.errors[0]["msg"],
+        details=report.errors,
+    )
+
+
+class NDJSONValidator:
+    """Validates newline-delimited JSON records against a single profile class.
+
+    Lines are read and validated in chunks of `chunk_size`; a record that fails
+    validation is reported as a `RecordError` and the run continues.
+
+    Args:
+        profile (type[MolecularDefinition]): The class every record is validated against.
+        chunk_size (int): Number of lines processed per chunk.
+        stats (ValidationStats | None): Counters to update, a fresh instance is created if omitted.
+        collect_all (bool): Report every profile violation of a record, rather than the first.
+
+    Raises:
+        ValueError: If `chunk_size` is smaller than 1.
+
+    """
+
+    def __init__(
+        self,
+        profile: type[MolecularDefinition] = MolecularDefinition,
+        chunk_size: int = 1000,
+        stats: ValidationStats | None = None,
+        collect_all: bool = False,
+    ):
+        if chunk_size < 1:
+            raise ValueError("`chunk_size` must be a positive integer.")
+        self.profile = profile
+        self.chunk_size = chunk_size
+        self.stats = stats if stats is not None else ValidationStats()
+        self.collect_all = collect_all
+        self._validate_json = partial(validate_json_record, profile)
+
+    def validate_line(self, line: str | bytes, lineno: int):
+        """Validates a single NDJSON line.
+
+        Args:
+            line (str | bytes): The raw JSON document.
+            lineno (int): 1-based line number, used for error reporting.
+
+        Returns:
+            MolecularDefinition | RecordError: The validated model, or the error describing why it failed.
+
+        """
+        if self.collect_all:
+            report = validate_all(line, self.profile)
+            return (
+                report.model if report.valid else report_to_record_error(lineno, report)
+            )
+        try:
+            return self._validate_json(line)
+        except (ValidationError, FHIRException) as exc:
+            return to_record_error(lineno, exc)
+
+    def iter_lines(self, lines: Iterable[str | bytes]) -> Iterator:
+        """Validates every non-blank line of `lines`, yielding results in input order.
+
+        Args:
+            lines (Iterable[str | bytes]): NDJSON lines, e.g. an open file.
+
+        Yields:
+            MolecularDefinition | RecordError: One result per non-blank line.
+
+        """
+        numbered = enumerate(lines, start=1)
+        stats = self.stats
+        while True:
+            chunk = list(islice(numbered, self.chunk_size))
+            if not chunk:
+                return
+
+            started = time.perf_counter()
+            results = [
+                self.validate_line(line, lineno)
+                for lineno, line in chunk
+                if line.strip()
+            ]
+            stats.elapsed += time.perf_counter() - started
+
+            invalid = sum(isinstance(result, RecordError) for result in results)
+            stats.records += len(results)
+            stats.invalid += invalid
+            stats.valid += len(results) - invalid
+
+            yield from results
+
+    def iter_file(self, path) -> Iterator:
+        """Validates every record of the NDJSON file at `path`.
+
+        Args:
+            path (str | os.PathLike): Location of the NDJSON file.
+
+        Yields:
+            MolecularDefinition | RecordError: One result per non-blank line.
+
+        """
+        with open(path, "rb") as handle:
+            yield from self.iter_lines(handle)
+
+
+def validate_ndjson(
+    path,
+    profile: type[MolecularDefinition] = MolecularDefinition,
+    chunk_size: int = 1000,
+    stats: ValidationStats | None = None,
+    collect_all: bool = False,
+) -> Iterator:
+    """Streams validated models (or `RecordError`s) from an NDJSON file.
+
+    Args:
+        path (str | os.PathLike): Location of the NDJSON file.
+        profile (type[MolecularDefinition]): The class every record is validated against.
+        chunk_size (int): Number of lines processed per chunk.
+        stats (ValidationStats | None): Optional counters updated as the run progresses.
+        collect_all (bool): Report every profile violation of a record, rather than the first.
+
+    Returns:
+        Iterator: Validated models and `RecordError`s, in file order.
+
+    Example:
+        >>> stats = ValidationStats()
+        >>> for result in validate_ndjson("alleles.ndjson", profile=Allele, stats=stats):
+        ...     if isinstance(result, RecordError):
+        ...         print(result.line, result.message)
+        >>> stats.records_per_second
+
+    """
+    validator = NDJSONValidator(
+        profile=profile, chunk_size=chunk_size, stats=stats, collect_all=collect_all
+    )
+    return validator.iter_file(path)
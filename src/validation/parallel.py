@@ -0,0 +1,175 @@
+import os
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from pydantic import ValidationError
+
+from exceptions.fhir import FHIRException
+from resources.moleculardefinition import MolecularDefinition
+from validation.collect import validate_all
+from validation.ndjson import (
+    RecordError,
+    ValidationStats,
+    report_to_record_error,
+    to_record_error,
+)
+from validation.records import validate_record
+
+
+def _validate_chunk(
+    profile: type[MolecularDefinition],
+    start: int,
+    records: list[dict],
+    collect_all: bool = False,
+) -> list:
+    """Worker entry point: validates one chunk and returns picklable results.
+
+    Valid records are sent back as FHIR JSON-ready dicts rather than pydantic
+    models, which keeps the payload small and cheap to unpickle.
+    """
+    results = []
+    for position, record in enumerate(records, start=start):
+        if collect_all:
+            report = validate_all(record, profile)
+            results.append(
+                report.model.model_dump()
+                if report.valid
+                else report_to_record_error(position, report)
+            )
+            continue
+        try:
+            results.append(validate_record(profile, record).model_dump())
+        except (ValidationError, FHIRException) as exc:
+            # Rendered here: pydantic cannot always unpickle a ValidationError.
+            results.append(to_record_error(position, exc).rendered())
+    return results
+
+
+class ParallelValidator:
+    """Validates raw MolecularDefinition dicts across a pool of worker processes.
+
+    Records are grouped into chunks of `chunk_size` and each chunk is validated
+    by a worker. At most `max_workers * 2` chunks are in flight at any time, so
+    arbitrarily long iterators can be validated without being loaded up front.
+
+    Args:
+        profile (type[MolecularDefinition]): The class every record is validated against.
+        max_workers (int | None): Number of worker processes, defaults to the CPU count.
+        chunk_size (int): Number of records sent to a worker per task.
+        stats (ValidationStats | None): Counters to update, a fresh instance is created if omitted.
+        mp_context (multiprocessing.context.BaseContext | None): Start method context for the pool.
+        collect_all (bool): Report every profile violation of a record, rather than the first.
+
+    Raises:
+        ValueError: If `chunk_size` or `max_workers` is smaller than 1.
+
+    """
+
+    def __init__(
+        self,
+        profile: type[MolecularDefinition] = MolecularDefinition,
+        max_workers: int | None = None,
+        chunk_size: int = 500,
+        stats: ValidationStats | None = None,
+        mp_context=None,
+        collect_all: bool = False,
+    ):
+        if chunk_size < 1:
+            raise ValueError("`chunk_size` must be a positive integer.")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("`max_workers` must be a positive integer.")
+        self.profile = profile
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.stats = stats if stats is not None else ValidationStats()
+        self.mp_context = mp_context
+        self.collect_all = collect_all
+
+    def _chunks(self, records: Iterable[dict]) -> Iterator[tuple[int, list[dict]]]:
+        iterator = iter(records)
+        start = 1
+        while chunk := list(islice(iterator, self.chunk_size)):
+            yield start, chunk
+            start += len(chunk)
+
+    def validate(self, records: Iterable[dict]) -> Iterator:
+        """Validates `records`, yielding one result per record in input order.
+
+        Args:
+            records (Iterable[dict]): Raw MolecularDefinition dicts.
+
+        Yields:
+            dict | RecordError: The serialized, validated record or the error describing why it failed.
+
+        """
+        workers = self.max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=self.mp_context
+        ) as executor:
+            window = workers * 2
+            pending = deque()
+            chunks = self._chunks(records)
+            started = time.perf_counter()
+
+            for start, chunk in chunks:
+                pending.append(
+                    executor.submit(
+                        _validate_chunk, self.profile, start, chunk, self.collect_all
+                    )
+                )
+                if len(pending) >= window:
+                    yield from self._collect(pending.popleft().result(), started)
+                    started = time.perf_counter()
+
+            while pending:
+                yield from self._collect(pending.popleft().result(), started)
+                started = time.perf_counter()
+
+    def _collect(self, results: list, started: float) -> list:
+        stats = self.stats
+        stats.elapsed += time.perf_counter() - started
+        invalid = sum(isinstance(result, RecordError) for result in results)
+        stats.records += len(results)
+        stats.invalid += invalid
+        stats.valid += len(results) - invalid
+        return results
+
+
+def validate_parallel(
+    records: Iterable[dict],
+    profile: type[MolecularDefinition] = MolecularDefinition,
+    max_workers: int | None = None,
+    chunk_size: int = 500,
+    stats: ValidationStats | None = None,
+    collect_all: bool = False,
+) -> Iterator:
+    """Validates raw dicts on a `ProcessPoolExecutor`, preserving input order.
+
+    Args:
+        records (Iterable[dict]): Raw MolecularDefinition dicts, a list or any iterator.
+        profile (type[MolecularDefinition]): The class every record is validated against.
+        max_workers (int | None): Number of worker processes, defaults to the CPU count.
+        chunk_size (int): Number of records sent to a worker per task.
+        stats (ValidationStats | None): Optional counters updated as the run progresses.
+        collect_all (bool): Report every profile violation of a record, rather than the first.
+
+    Returns:
+        Iterator: Serialized records and `RecordError`s, in input order.
+
+    Example:
+        >>> for result in validate_parallel(records, profile=Variation, max_workers=8):
+        ...     if isinstance(result, RecordError):
+        ...         print(result.line, result.error)
+
+    """
+    validator = ParallelValidator(
+        profile=profile,
+        max_workers=max_workers,
+        chunk_size=chunk_size,
+        stats=stats,
+        collect_all=collect_all,
+    )
+    return validator.validate(records)
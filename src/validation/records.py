@@ -0,0 +1,60 @@
+import json
+from functools import cache
+
+from pydantic_core import SchemaValidator
+
+from resources.moleculardefinition import MolecularDefinition
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+loads = orjson.loads if orjson is not None else json.loads
+
+
+@cache
+def get_validator(profile: type[MolecularDefinition]) -> SchemaValidator:
+    """Returns the pydantic-core validator for a profile class, building it once.
+
+    Args:
+        profile (type[MolecularDefinition]): `MolecularDefinition` or one of its profiles.
+
+    Returns:
+        SchemaValidator: The validator shared by every record validated against `profile`.
+
+    """
+    if not profile.__pydantic_complete__:
+        profile.model_rebuild()
+    return profile.__pydantic_validator__
+
+
+def validate_record(profile: type[MolecularDefinition], data):
+    """Validates one raw record against `profile`, running each validator once.
+
+    The record is passed to the class itself: fhir-core's `__init__` validates
+    the data, so going through the schema validator (`model_validate`,
+    `validate_python`) runs every after validator a second time.
+
+    Args:
+        profile (type[MolecularDefinition]): `MolecularDefinition` or one of its profiles.
+        data (dict): The raw record.
+
+    Returns:
+        MolecularDefinition: The validated model.
+
+    """
+    if isinstance(data, dict):
+        return profile(**data)
+    # Not an object: reported by pydantic as a `model_type` error.
+    return get_validator(profile).validate_python(data)
+
+
+def validate_json_record(profile: type[MolecularDefinition], line: str | bytes):
+    """Decodes one JSON document and validates it with `validate_record`."""
+    try:
+        data = loads(line)
+    except ValueError:
+        # Reported by pydantic, as a `json_invalid` ValidationError.
+        return get_validator(profile).validate_json(line)
+    return validate_record(profile, data)
@@ -291,3 +291,19 @@ def test_multiple_context_state_globally(valid_allele):
         FhirAllele,
         **data,
     )
+
+
+def test_representation_slices(valid_allele):
+    allele = FhirAllele(**valid_allele)
+    assert allele.slices["allele-state"] is allele.representation[0]
+    assert allele.slices["context-state"] is allele.representation[1]
+    assert allele.slices.codes == ("allele-state", "context-state")
+    assert allele == FhirAllele(**deepcopy(valid_allele))
+
+
+def test_allele_from_trusted(valid_allele):
+    allele = FhirAllele(**valid_allele)
+    trusted = FhirAllele.from_trusted(allele.model_dump())
+    assert isinstance(trusted, FhirAllele)
+    assert trusted == allele
+    assert trusted.slices.codes == allele.slices.codes
@@ -0,0 +1,140 @@
+from copy import deepcopy
+
+import pytest
+
+from profiles.allele import Allele as FhirAllele
+from profiles.sequence import Sequence as FhirSequence
+
+np = pytest.importorskip("numpy")
+
+from serialization.arrays import MISSING, RecordArrays, to_arrays  # noqa: E402
+
+
+@pytest.fixture()
+def valid_allele():
+    return {
+        "resourceType": "MolecularDefinition",
+        "id": "example-allelesliced-cyp2c19-1016",
+        "moleculeType": {
+            "coding": [
+                {
+                    "system": "http://hl7.org/fhir/sequence-type",
+                    "code": "dna",
+                    "display": "DNA Sequence",
+                }
+            ]
+        },
+        "location": [
+            {
+                "sequenceLocation": {
+                    "sequenceContext": {
+                        "reference": "MolecularDefinition/example-sequence-nm0007694-url",
+                    },
+                    "coordinateInterval": {
+                        "coordinateSystem": {
+                            "system": {
+                                "coding": [
+                                    {
+                                        "system": "http://loinc.org",
+                                        "code": "LA30102-0",
+                                        "display": "1-based character counting",
+                                    }
+                                ]
+                            }
+                        },
+                        "startQuantity": {"value": 1016},
+                    },
+                    "strand": {"coding": [{"code": "forward"}]},
+                }
+            }
+        ],
+        "representation": [
+            {
+                "focus": {
+                    "coding": [
+                        {
+                            "system": "http://hl7.org/fhir/moleculardefinition-focus",
+                            "code": "allele-state",
+                            "display": "Allele State",
+                        }
+                    ]
+                },
+                "literal": {"value": "G"},
+            },
+        ],
+    }
+
+
+@pytest.fixture()
+def alleles(valid_allele):
+    records = []
+    for position, context in [
+        (1016, "NM_000769.4"),
+        (20, "NM_000769.4"),
+        (500, "NC_000019.10"),
+    ]:
+        data = deepcopy(valid_allele)
+        sequence_location = data["location"][0]["sequenceLocation"]
+        sequence_location["sequenceContext"]["reference"] = f"#{context}"
+        sequence_location["coordinateInterval"]["startQuantity"]["value"] = position
+        records.append(FhirAllele(**data))
+    records.append(
+        FhirAllele.model_construct(
+            id="no-location", moleculeType=None, location=None, representation=None
+        )
+    )
+    return records
+
+
+def test_to_arrays(alleles):
+    arrays = to_arrays(alleles)
+    assert len(arrays) == 4
+    assert arrays.start.dtype == np.int64
+    assert arrays.start.tolist() == [1015, 19, 499, MISSING]
+    assert arrays.end.tolist() == [1016, 20, 500, MISSING]
+    assert arrays.decode("sequence_context") == [
+        "#NM_000769.4",
+        "#NM_000769.4",
+        "#NC_000019.10",
+        None,
+    ]
+    assert arrays.decode("molecule_type") == ["dna", "dna", "dna", None]
+    assert arrays.decode("strand") == ["forward", "forward", "forward", None]
+    assert arrays.has_focus("allele-state").tolist() == [True, True, True, False]
+    assert not arrays.has_focus("context-state").any()
+
+
+def test_vectorized_overlap(alleles):
+    arrays = to_arrays(alleles)
+    mask = arrays.overlapping("#NM_000769.4", 0, 1000)
+    assert mask.tolist() == [False, True, False, False]
+    order = np.argsort(arrays.start[arrays.start != MISSING])
+    assert order.tolist() == [1, 2, 0]
+
+
+def test_unknown_context_overlaps_nothing():
+    column = np.array([MISSING, 0])
+    arrays = RecordArrays(
+        start=np.array([10, 10]),
+        end=np.array([20, 20]),
+        sequence_context=column,
+        molecule_type=column,
+        strand=column,
+        focus=np.zeros(2, dtype=np.uint64),
+        categories={"sequence_context": ["#NC_000019.10"]},
+    )
+    assert arrays.overlapping("#NC_000019.10", 0, 100).tolist() == [False, True]
+    assert not arrays.overlapping("#NM_000769.4", 0, 100).any()
+
+
+def test_sequences_have_no_coordinates(alleles):
+    sequence = FhirSequence(
+        moleculeType={"coding": [{"code": "rna"}]},
+        representation=[{"literal": {"value": "ACGU"}}],
+    )
+    arrays = to_arrays([alleles[0], sequence])
+    assert arrays.start.tolist() == [1015, MISSING]
+    assert arrays.end.tolist() == [1016, MISSING]
+    assert arrays.decode("sequence_context") == ["#NM_000769.4", None]
+    assert arrays.decode("molecule_type") == ["dna", "rna"]
+    assert not arrays.overlapping("#NM_000769.4", 0, 2000)[1]
@@ -0,0 +1,164 @@
+from copy import deepcopy
+
+import pytest
+
+from profiles.sequence import Sequence as FhirSequence
+from profiles.variation import Variation as FhirVariation
+from resources.instrumentation import ValidationTimer
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from serialization.arrow import (  # noqa: E402
+    flatten,
+    interval_filter,
+    read_parquet,
+    to_record_batches,
+    unflatten,
+    write_parquet,
+)
+
+FOCUS_SYSTEM = "http://hl7.org/fhir/uv/molecular-definition-data-types/CodeSystem/molecular-definition-focus"
+
+
+@pytest.fixture
+def valid_fhir_variation():
+    return {
+        "resourceType": "MolecularDefinition",
+        "id": "rs429358",
+        "identifier": [
+            {"system": "https://www.ncbi.nlm.nih.gov/snp", "value": "rs429358"}
+        ],
+        "moleculeType": {
+            "coding": [
+                {
+                    "system": "http://hl7.org/fhir/uv/molecular-definition-data-types/CodeSystem/molecule-type",
+                    "code": "dna",
+                    "display": "DNA Sequence",
+                }
+            ]
+        },
+        "location": [
+            {
+                "sequenceLocation": {
+                    "sequenceContext": {
+                        "reference": "#ref-to-nc000019",
+                        "type": "MolecularDefinition",
+                        "display": "NC_000019.10",
+                    },
+                    "coordinateInterval": {
+                        "coordinateSystem": {
+                            "system": {
+                                "coding": [
+                                    {
+                                        "system": "http://loinc.org",
+                                        "code": "LA30100-4",
+                                        "display": "0-based interval counting",
+                                    }
+                                ]
+                            },
+                            "normalizationMethod": {
+                                "coding": [{"code": "fully-justified"}]
+                            },
+                        },
+                        "startQuantity": {"value": 44908683.0},
+                        "endQuantity": {"value": 44908684.0},
+                    },
+                }
+            }
+        ],
+        "representation": [
+            {
+                "focus": {
+                    "coding": [
+                        {
+                            "system": FOCUS_SYSTEM,
+                            "code": "reference-state",
+                            "display": "Reference State",
+                        }
+                    ]
+                },
+                "code": [{"text": "rare branch"}],
+                "literal": {"value": "T"},
+            },
+            {
+                "focus": {
+                    "coding": [
+                        {
+                            "system": FOCUS_SYSTEM,
+                            "code": "alternative-state",
+                            "display": "Alternative State",
+                        }
+                    ]
+                },
+                "literal": {"value": "C"},
+            },
+        ],
+    }
+
+
+@pytest.fixture
+def variations(valid_fhir_variation):
+    records = []
+    for index in range(40):
+        data = deepcopy(valid_fhir_variation)
+        data["id"] = f"variation-{index}"
+        interval = data["location"][0]["sequenceLocation"]["coordinateInterval"]
+        interval["startQuantity"]["value"] = 1000.0 * index
+        interval["endQuantity"]["value"] = 1000.0 * index + 1
+        records.append(FhirVariation(**data))
+    return records
+
+
+def test_flatten_round_trip(valid_fhir_variation):
+    variation = FhirVariation(**valid_fhir_variation)
+    row = flatten(variation)
+    assert row["sequence_context"] == "#ref-to-nc000019"
+    assert row["start_value"] == 44908683
+    assert (row["start"], row["end"]) == (44908683, 44908684)
+    assert row["focus"] == ["reference-state", "alternative-state"]
+    assert row["literal_value"] == ["T", "C"]
+    assert row["identifier_value"] == ["rs429358"]
+    assert "rare branch" in row["extra"]
+    assert "literal" not in row["extra"]
+    assert FhirVariation(**unflatten(row)) == variation
+
+
+def test_record_batches(variations):
+    batches = list(to_record_batches(variations, batch_size=16))
+    assert [batch.num_rows for batch in batches] == [16, 16, 8]
+    assert batches[0].column("focus").type == pa.list_(pa.string())
+
+
+def test_parquet_round_trip_with_pushdown(variations, tmp_path):
+    path = tmp_path / "variations.parquet"
+    assert write_parquet(variations, path, batch_size=10) == 40
+    assert pq.ParquetFile(path).metadata.num_row_groups == 4
+
+    assert list(read_parquet(path, FhirVariation)) == variations
+
+    found = list(
+        read_parquet(
+            path, FhirVariation, filter=interval_filter("#ref-to-nc000019", 4500, 7001)
+        )
+    )
+    assert [record.id for record in found] == [
+        "variation-5",
+        "variation-6",
+        "variation-7",
+    ]
+    assert list(read_parquet(path, filter=interval_filter("#elsewhere"))) == []
+
+
+def test_sequence_parquet_round_trip(tmp_path):
+    sequence = FhirSequence(
+        id="seq",
+        moleculeType={"coding": [{"code": "dna"}]},
+        representation=[{"literal": {"value": "ACGT"}}],
+    )
+    path = tmp_path / "sequences.parquet"
+    assert write_parquet([sequence], path) == 1
+    timer = ValidationTimer()
+    with timer.activate():
+        assert list(read_parquet(path, FhirSequence)) == [sequence]
+    assert timer.to_dict()["Sequence.validate_moleculeType"]["count"] == 1
@@ -0,0 +1,58 @@
+import pytest
+from benchmarks import generators
+from benchmarks.suite import cases, compare, measure, report
+
+from profiles.allele import Allele as FhirAllele
+from profiles.sequence import Sequence as FhirSequence
+from profiles.variation import Variation as FhirVariation
+
+
+@pytest.mark.parametrize("count", [1, 2, 5])
+def test_allele_generator(count):
+    allele = FhirAllele.model_validate(generators.allele(representations=count))
+    assert len(allele.representation) == count
+    assert "allele-state" in allele.slices
+
+
+@pytest.mark.parametrize("count", [2, 3, 5])
+def test_variation_generator(count):
+    variation = FhirVariation.model_validate(
+        generators.variation(representations=count, length=3)
+    )
+    assert len(variation.representation) == count
+    assert len(variation.slices["alternative-state"].literal.value) == 3
+
+
+def test_sequence_generator():
+    sequence = FhirSequence.model_validate(generators.sequence(50, seed=1))
+    assert sequence.representation[0].literal.value == generators.bases(50, seed=1)
+
+
+def test_every_class_has_a_case():
+    case_list = cases()
+    assert len({case.name for case in case_list}) == len(case_list)
+    for case in case_list:
+        case.model_class.model_validate(case.data())
+
+
+def test_measure_and_compare():
+    case = next(case for case in cases() if case.name == "allele[1]")
+    metrics = measure(case, min_time=0.001, repeat=1)
+    assert set(metrics) == {
+        "validate",
+        "dump",
+        "dump_json",
+        "json_round_trip",
+        "peak_kib",
+        "json_bytes",
+    }
+
+    baseline = {"results": {"allele[1]": dict(metrics, validate=1.0)}}
+    current = {"results": {"allele[1]": metrics, "new": {"validate": 1.0}}}
+    changes = list(compare(baseline, current, tolerance=0.2))
+    assert [(change.case, change.metric) for change in changes] == [
+        ("allele[1]", "validate")
+    ]
+    assert changes[0].ratio == metrics["validate"]
+    assert list(compare({"results": {"allele[1]": metrics}}, current)) == []
+    assert "allele[1]" in report(current)
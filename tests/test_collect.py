@@ -0,0 +1,92 @@
+import json
+
+import pytest
+from benchmarks import generators
+
+from exceptions.fhir import MissingFocus
+from profiles.sequence import Sequence as FhirSequence
+from profiles.variation import Variation as FhirVariation
+from resources.instrumentation import ValidationTimer
+from validation.collect import json_path, validate_all
+from validation.ndjson import RecordError, validate_ndjson
+
+
+@pytest.fixture
+def invalid_variation():
+    data = generators.variation(representations=3)
+    data["memberState"] = [{"reference": "#allele"}]
+    data["location"].append(data["location"][0])
+    data["representation"][0]["focus"]["coding"][0]["display"] = "Reference"
+    del data["representation"][1]["focus"]
+    return data
+
+
+def test_collects_every_violation(invalid_variation):
+    report = validate_all(invalid_variation, FhirVariation)
+    assert not report.valid
+    assert report.model is None
+    assert [(entry["path"], entry["error"]) for entry in report.entries()] == [
+        ("$.memberState", "MemberStateNotAllowedError"),
+        ("$.location", "MultipleLocation"),
+        ("$.representation[0].focus.coding[0].display", "InvalidFocusCodingDisplay"),
+        ("$.representation[1].focus", "MissingFocus"),
+        ("$.representation", "MissingAlternativeState"),
+    ]
+
+
+def test_profile_rules_run_once(invalid_variation):
+    timer = ValidationTimer()
+    with timer.activate():
+        report = validate_all(json.dumps(invalid_variation), FhirVariation)
+    assert len(report.violations) == 5
+    assert timer.to_dict()["Variation.validate_focus"]["count"] == 1
+
+
+def test_raises_first_violation_outside_collect_mode(invalid_variation):
+    del invalid_variation["memberState"]
+    invalid_variation["location"].pop()
+    invalid_variation["representation"][0]["focus"]["coding"][0]["display"] = (
+        "Reference State"
+    )
+    with pytest.raises(MissingFocus):
+        FhirVariation(**invalid_variation)
+
+
+def test_valid_record_and_json_input():
+    data = generators.variation()
+    report = validate_all(json.dumps(data), FhirVariation)
+    assert report.valid
+    assert report.model == FhirVariation(**data)
+    assert report.entries() == []
+
+
+def test_structural_errors_and_excluded_elements():
+    data = generators.sequence(10)
+    data["location"] = []
+    data["representation"] = [{"literal": {}}]
+    report = validate_all(data, FhirSequence)
+    assert [entry["path"] for entry in report.entries()] == [
+        "$.location",
+        "$.representation[0].literal.value",
+    ]
+    assert (
+        json_path(("location", 0, "sequenceLocation"))
+        == "$.location[0].sequenceLocation"
+    )
+
+
+def test_ndjson_collect_all(tmp_path, invalid_variation):
+    path = tmp_path / "variations.ndjson"
+    path.write_text(
+        "\n".join(
+            json.dumps(record) for record in [generators.variation(), invalid_variation]
+        )
+    )
+    valid, invalid = validate_ndjson(path, profile=FhirVariation, collect_all=True)
+    assert isinstance(valid, FhirVariation)
+    assert isinstance(invalid, RecordError)
+    assert (invalid.line, invalid.error) == (2, "MemberStateNotAllowedError")
+    assert len(invalid.violations) == 5
+
+    (first_only,) = list(validate_ndjson(path, profile=FhirVariation))[1:]
+    assert first_only.violations == ()
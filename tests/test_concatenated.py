@@ -0,0 +1,57 @@
+import pytest
+
+from exceptions.fhir import DuplicateOrdinalIndex
+from representations.concatenated import ConcatenatedSequence
+from representations.materialize import Materializer
+from resources.moleculardefinition import MolecularDefinition
+from resources.sequenceview import NUCLEOTIDE, PackedSequence
+
+EXONS = {"#exon1": "ATGGCC", "#exon2": "TTAG", "#exon3": "CCGATAA"}
+
+
+def concatenated_moldef(order):
+    return MolecularDefinition(
+        id="transcript",
+        moleculeType={"coding": [{"code": "dna"}]},
+        representation=[
+            {
+                "concatenated": {
+                    "sequenceElement": [
+                        {"sequence": {"reference": reference}, "ordinalIndex": index}
+                        for reference, index in order
+                    ]
+                }
+            }
+        ],
+    )
+
+
+def test_elements_are_ordered_by_ordinal_index():
+    moldef = concatenated_moldef([("#exon3", 3), ("#exon1", 1), ("#exon2", 2)])
+    bases = Materializer(EXONS).sequence(moldef)
+    assert isinstance(bases, ConcatenatedSequence)
+    assert bases == "ATGGCC" + "TTAG" + "CCGATAA"
+
+
+def test_random_access_and_slices():
+    parts = ["ACG", PackedSequence.pack("TTGCA", NUCLEOTIDE), "", "G", "CCAT"]
+    expected = "".join(str(part) for part in parts)
+    rope = ConcatenatedSequence(parts)
+
+    assert len(rope) == len(expected)
+    assert list(rope) == list(expected)
+    for position in range(-len(expected), len(expected)):
+        assert rope[position] == expected[position]
+    for start in range(len(expected) + 1):
+        for stop in range(start, len(expected) + 1):
+            assert rope[start:stop] == expected[start:stop]
+    assert rope[2:10][3:6] == expected[5:8]
+    assert rope[::-1] == expected[::-1]
+    with pytest.raises(IndexError):
+        rope[len(expected)]
+
+
+def test_duplicate_ordinal_index():
+    moldef = concatenated_moldef([("#exon1", 1), ("#exon2", 1)])
+    with pytest.raises(DuplicateOrdinalIndex):
+        Materializer(EXONS).sequence(moldef)
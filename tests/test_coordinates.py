@@ -0,0 +1,89 @@
+import pytest
+
+from exceptions.fhir import InvalidCoordinateInterval, UnsupportedCoordinateSystem
+from resources.coordinates import (
+    ONE_BASED_CHARACTER,
+    ZERO_BASED_INTERVAL,
+    converter,
+    normalize_interval,
+)
+from resources.moleculardefinition import (
+    MolecularDefinitionLocationSequenceLocationCoordinateInterval,
+    MolecularDefinitionRepresentationExtractedCoordinateInterval,
+    MolecularDefinitionRepresentationRelativeEditCoordinateInterval,
+)
+
+
+def coordinate_system(code, origin="sequence-start", normalization=None):
+    system = {
+        "system": {"coding": [{"system": "http://loinc.org", "code": code}]},
+        "origin": {"coding": [{"code": origin}]},
+    }
+    if normalization is not None:
+        system["normalizationMethod"] = {"coding": [{"code": normalization}]}
+    return system
+
+
+@pytest.mark.parametrize(
+    ("code", "start", "end"),
+    [("LA30100-4", 10, 20), ("LA30101-2", 10, 19), ("LA30102-0", 11, 20)],
+)
+def test_every_interval_type_is_normalized(code, start, end):
+    location = MolecularDefinitionLocationSequenceLocationCoordinateInterval(
+        coordinateSystem=coordinate_system(code),
+        startQuantity={"value": start},
+        endQuantity={"value": end},
+    )
+    ranged = MolecularDefinitionLocationSequenceLocationCoordinateInterval(
+        coordinateSystem=coordinate_system(code),
+        startRange={"low": {"value": start}, "high": {"value": start + 2}},
+        endRange={"low": {"value": end - 2}, "high": {"value": end}},
+    )
+    extracted = MolecularDefinitionRepresentationExtractedCoordinateInterval(
+        coordinateSystem=coordinate_system(code), start=start, end=end
+    )
+    edit = MolecularDefinitionRepresentationRelativeEditCoordinateInterval(
+        coordinateSystem=coordinate_system(code), start=start, end=end
+    )
+    for interval in (location, ranged, extracted, edit):
+        assert normalize_interval(interval) == (10, 20)
+
+
+def test_converters_are_memoized():
+    first = MolecularDefinitionRepresentationExtractedCoordinateInterval(
+        coordinateSystem=coordinate_system(
+            ONE_BASED_CHARACTER, normalization="left-shift"
+        ),
+        start=1,
+        end=1,
+    )
+    second = first.model_copy(deep=True)
+    convert = converter(first.coordinateSystem)
+    assert convert is converter(second.coordinateSystem)
+    assert convert.system == ONE_BASED_CHARACTER
+    assert convert.normalization == "left-shift"
+    assert convert.inverse(*convert(5, 9)) == (5, 9)
+    assert converter(None).system == ZERO_BASED_INTERVAL
+
+
+def test_unsupported_coordinates():
+    with pytest.raises(UnsupportedCoordinateSystem):
+        converter(
+            MolecularDefinitionRepresentationExtractedCoordinateInterval(
+                coordinateSystem=coordinate_system("LA30100-4", origin="cds-start"),
+                start=1,
+                end=2,
+            ).coordinateSystem
+        )
+    with pytest.raises(InvalidCoordinateInterval):
+        normalize_interval(
+            MolecularDefinitionRepresentationRelativeEditCoordinateInterval(start=4)
+        )
+
+
+def test_character_position_without_end():
+    interval = MolecularDefinitionLocationSequenceLocationCoordinateInterval(
+        coordinateSystem=coordinate_system(ONE_BASED_CHARACTER),
+        startQuantity={"value": 1016},
+    )
+    assert normalize_interval(interval) == (1015, 1016)
@@ -0,0 +1,185 @@
+from copy import deepcopy
+
+import pytest
+
+from profiles.allele import Allele as FhirAllele
+from profiles.sequence import Sequence as FhirSequence
+from resources.digest import canonical_json, digest
+from resources.moleculardefinition import MolecularDefinition
+
+LOINC = "http://loinc.org"
+
+
+@pytest.fixture()
+def valid_allele():
+    return {
+        "resourceType": "MolecularDefinition",
+        "id": "example-allelesliced-cyp2c19-1016",
+        "meta": {"profile": ["http://hl7.org/fhir/StructureDefinition/allelesliced"]},
+        "moleculeType": {
+            "coding": [
+                {
+                    "system": "http://hl7.org/fhir/sequence-type",
+                    "code": "dna",
+                    "display": "DNA Sequence",
+                }
+            ]
+        },
+        "location": [
+            {
+                "sequenceLocation": {
+                    "sequenceContext": {
+                        "reference": "MolecularDefinition/example-sequence-nm0007694-url",
+                        "display": "NM_000769.4",
+                    },
+                    "coordinateInterval": {
+                        "coordinateSystem": {
+                            "system": {
+                                "coding": [{"system": LOINC, "code": "LA30102-0"}]
+                            }
+                        },
+                        "startQuantity": {"value": 1016},
+                    },
+                }
+            }
+        ],
+        "representation": [
+            {
+                "focus": {
+                    "coding": [
+                        {
+                            "system": "http://hl7.org/fhir/moleculardefinition-focus",
+                            "code": "allele-state",
+                            "display": "Allele State",
+                        }
+                    ]
+                },
+                "literal": {"value": "G"},
+            }
+        ],
+    }
+
+
+def test_digest_ignores_non_identifying_elements(valid_allele):
+    allele = FhirAllele(**valid_allele)
+    other = deepcopy(valid_allele)
+    other["id"] = "another-id"
+    other["meta"] = {"versionId": "7"}
+    other["moleculeType"]["coding"][0]["display"] = "DNA"
+    other["location"][0]["sequenceLocation"]["sequenceContext"]["display"] = "other"
+    assert FhirAllele(**other).digest == allele.digest
+    assert len(allele.digest) == 32
+    assert digest(allele) == allele.digest
+
+
+def test_digest_normalizes_coordinates(valid_allele):
+    allele = FhirAllele(**valid_allele)
+    interval = deepcopy(valid_allele)
+    coordinate_interval = interval["location"][0]["sequenceLocation"][
+        "coordinateInterval"
+    ]
+    coordinate_interval["coordinateSystem"]["system"]["coding"][0]["code"] = "LA30100-4"
+    coordinate_interval["startQuantity"]["value"] = 1015
+    coordinate_interval["endQuantity"] = {"value": 1016}
+    assert FhirAllele(**interval).digest == allele.digest
+    assert b'"start":1015,"end":1016' not in canonical_json(allele)
+    assert b'"end":1016,"start":1015' in canonical_json(allele)
+
+
+def test_digest_distinguishes_content(valid_allele):
+    allele = FhirAllele(**valid_allele)
+    changed = deepcopy(valid_allele)
+    changed["representation"][0]["literal"]["value"] = "A"
+    assert FhirAllele(**changed).digest != allele.digest
+    moved = deepcopy(valid_allele)
+    moved["location"][0]["sequenceLocation"]["coordinateInterval"]["startQuantity"][
+        "value"
+    ] = 1017
+    assert FhirAllele(**moved).digest != allele.digest
+
+
+def test_digest_is_cached_and_deduplicates(valid_allele):
+    records = []
+    for index in range(5):
+        data = deepcopy(valid_allele)
+        data["id"] = f"allele-{index % 3}"
+        records.append(FhirAllele(**data))
+    unique = {record.digest: record for record in records}
+    assert len(unique) == 1
+    record = records[0]
+    assert record.__dict__["digest"] == record.digest
+    # The cached digest does not take part in equality.
+    assert record == FhirAllele(**{**valid_allele, "id": "allele-0"})
+
+
+def test_digest_follows_assignments_and_copies(valid_allele):
+    allele = FhirAllele(**valid_allele)
+    before = allele.digest
+    moved = allele.model_copy(update={"location": FhirAllele(**valid_allele).location})
+    assert moved.digest == before
+
+    allele.moleculeType = {"coding": [{"code": "rna"}]}
+    assert allele.digest != before
+    assert allele.digest == digest(allele)
+
+    copy = allele.model_copy(
+        update={"moleculeType": FhirAllele(**valid_allele).moleculeType}
+    )
+    assert copy.digest == before
+    assert allele.model_copy().digest == allele.digest
+
+
+def test_contained_references_use_content():
+    def sequence(contained_id, value):
+        return {
+            "resourceType": "MolecularDefinition",
+            "id": contained_id,
+            "moleculeType": {"coding": [{"code": "dna"}]},
+            "representation": [{"literal": {"value": value}}],
+        }
+
+    def extracted(contained_id, value):
+        return MolecularDefinition(
+            contained=[sequence(contained_id, value)],
+            representation=[
+                {
+                    "extracted": {
+                        "startingMolecule": {"reference": f"#{contained_id}"},
+                        "coordinateInterval": {"start": 1, "end": 3},
+                    }
+                }
+            ],
+        )
+
+    assert extracted("a", "ACGT").digest == extracted("b", "ACGT").digest
+    assert extracted("a", "ACGT").digest != extracted("a", "ACGA").digest
+
+
+def sequence_profile(value):
+    return FhirSequence(
+        moleculeType={"coding": [{"code": "dna"}]},
+        representation=[{"literal": {"value": value}}],
+    )
+
+
+def test_sequence_digest():
+    assert sequence_profile("ACGT").digest == sequence_profile("ACGT").digest
+    assert sequence_profile("ACGT").digest != sequence_profile("ACGA").digest
+
+
+def test_contained_sequence_digest():
+    def extracted(value):
+        return MolecularDefinition(
+            contained=[sequence_profile(value).model_copy(update={"id": "seq"})],
+            representation=[
+                {
+                    "extracted": {
+                        "startingMolecule": {"reference": "#seq"},
+                        "coordinateInterval": {"start": 1, "end": 3},
+                    }
+                }
+            ],
+        )
+
+    assert isinstance(extracted("ACGT").contained[0], FhirSequence)
+    assert extracted("ACGT").digest != extracted("ACGA").digest
@@ -0,0 +1,86 @@
+import json
+
+import pytest
+from benchmarks import generators
+
+from profiles.allele import Allele as FhirAllele
+from profiles.sequence import Sequence as FhirSequence
+from profiles.variation import Variation as FhirVariation
+from resources.instrumentation import ValidationTimer
+from resources.moleculardefinition import MolecularDefinition
+from validation.dispatch import ProfileDetector, ProfileDispatcher, dispatch_ndjson
+from validation.ndjson import RecordError
+
+
+@pytest.fixture
+def detector():
+    return ProfileDetector()
+
+
+def test_detects_by_content(detector):
+    assert detector.detect(generators.sequence(10)) is FhirSequence
+    assert detector.detect(generators.allele()) is FhirAllele
+    assert detector.detect(generators.allele(representations=2)) is FhirAllele
+    assert detector.detect(generators.variation()) is FhirVariation
+    assert detector.detect(generators.molecular_definition()) is MolecularDefinition
+
+
+def test_meta_profile_wins(detector):
+    data = generators.allele()
+    data["meta"] = {
+        "profile": [
+            "http://hl7.org/fhir/uv/molecular-definition-data-types/StructureDefinition/variation|1.0.0"
+        ]
+    }
+    assert detector.detect(data) is FhirVariation
+
+
+def test_shared_focus_codes_do_not_decide(detector):
+    data = generators.allele()
+    data["representation"][0]["focus"]["coding"][0]["code"] = "context-state"
+    assert detector.detect(data) is MolecularDefinition
+    del data["location"]
+    assert detector.detect(data) is FhirSequence
+
+
+def test_validates_each_record_once_with_counters(tmp_path):
+    invalid_allele = generators.allele(representations=2)
+    invalid_allele["location"].append(invalid_allele["location"][0])
+    records = [
+        generators.sequence(10),
+        generators.variation(),
+        invalid_allele,
+        generators.allele(),
+    ]
+    path = tmp_path / "feed.ndjson"
+    path.write_text(
+        "\n".join(json.dumps(record) for record in records) + "\n\nnot json\n"
+    )
+
+    dispatcher = ProfileDispatcher()
+    results = list(dispatch_ndjson(path, dispatcher))
+
+    assert [type(result) for result in results] == [
+        FhirSequence,
+        FhirVariation,
+        RecordError,
+        FhirAllele,
+        RecordError,
+    ]
+    assert (results[2].line, results[2].error) == (3, "MultipleLocation")
+    assert results[4].line == 6
+    report = dispatcher.report()
+    assert {name: counts["records"] for name, counts in report.items()} == {
+        "Sequence": 1,
+        "Variation": 1,
+        "Allele": 2,
+    }
+    assert (report["Allele"]["valid"], report["Allele"]["invalid"]) == (1, 1)
+    assert dispatcher.stats["Allele"].records_per_second > 0
+
+
+def test_profile_validators_run_once_per_record():
+    timer = ValidationTimer()
+    with timer.activate():
+        ProfileDispatcher().validate(generators.allele())
+    assert timer.to_dict()["Allele.validate_focus"]["count"] == 1
@@ -0,0 +1,43 @@
+import pytest
+from benchmarks import emptiness, generators
+from fhir.resources.codeableconcept import CodeableConcept
+
+from exceptions.fhir import InvalidMoleculeTypeError
+from profiles.variation import Variation as FhirVariation
+from resources.elements import is_empty
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {},
+        {"text": None},
+        {"coding": []},
+        {"coding": [{}]},
+        {"extension": []},
+        {"id": "molecule-type"},
+        {"text": "DNA"},
+        {"coding": [{"code": "dna"}]},
+    ],
+)
+def test_matches_model_dump(data):
+    concept = CodeableConcept.model_validate(data)
+    assert is_empty(concept) == (not concept.model_dump(exclude_unset=True))
+
+
+def test_non_models_are_not_empty():
+    assert not is_empty("dna")
+    assert is_empty(CodeableConcept.model_construct())
+
+
+def test_profiles_reject_an_empty_molecule_type():
+    data = generators.variation()
+    data["moleculeType"] = {"text": None}
+    with pytest.raises(InvalidMoleculeTypeError):
+        FhirVariation(**data)
+
+
+def test_microbenchmark():
+    results = emptiness.measure(records=20)
+    assert set(results) == {"model_dump", "is_empty"}
+    assert results["is_empty"]["peak_bytes"] < results["model_dump"]["peak_bytes"]
@@ -0,0 +1,118 @@
+import pytest
+
+from exceptions.fhir import (
+    InvalidCoordinateInterval,
+    UnresolvableReference,
+    UnsupportedCoordinateSystem,
+)
+from representations.extracted import reverse_complement
+from representations.materialize import Materializer
+from resources.coordinates import to_half_open
+from resources.moleculardefinition import MolecularDefinition
+from resources.sequenceview import NUCLEOTIDE, PackedSequence
+
+REFERENCE = "ACGTTGCAAGGCTTAACCGT"
+
+
+def coordinate_system(code, origin="sequence-start"):
+    return {
+        "system": {"coding": [{"system": "http://loinc.org", "code": code}]},
+        "origin": {
+            "coding": [
+                {
+                    "system": "http://hl7.org/fhir/uv/molecular-definition-data-types/CodeSystem/coordinate-origin",
+                    "code": origin,
+                }
+            ]
+        },
+    }
+
+
+def extracted_moldef(start, end, code="LA30100-4", reverse=None, **system):
+    extracted = {
+        "startingMolecule": {"reference": "#reference"},
+        "coordinateInterval": {
+            "coordinateSystem": coordinate_system(code, **system),
+            "start": start,
+            "end": end,
+        },
+    }
+    if reverse is not None:
+        extracted["reverseComplement"] = reverse
+    return MolecularDefinition(
+        id="extracted",
+        moleculeType={"coding": [{"code": "dna"}]},
+        representation=[{"extracted": extracted}],
+    )
+
+
+@pytest.fixture
+def reference():
+    return MolecularDefinition(
+        id="reference",
+        moleculeType={"coding": [{"code": "dna"}]},
+        representation=[{"literal": {"value": REFERENCE}}],
+    )
+
+
+@pytest.fixture
+def materializer(reference):
+    return Materializer({"#reference": reference})
+
+
+def test_reverse_complement():
+    assert reverse_complement("ACGTN") == "NACGT"
+    assert reverse_complement("aRYg") == "cRYt"
+    assert reverse_complement("AC-gt") == "ac-GT"
+
+
+@pytest.mark.parametrize(
+    ("code", "start", "end"),
+    [("LA30100-4", 4, 9), ("LA30101-2", 4, 8), ("LA30102-0", 5, 9)],
+)
+def test_coordinate_systems(materializer, code, start, end):
+    moldef = extracted_moldef(start, end, code)
+    assert materializer.sequence(moldef) == REFERENCE[4:9]
+
+
+def test_to_half_open_defaults_to_interval_counting():
+    assert to_half_open(3, 7, None) == (3, 7)
+    with pytest.raises(InvalidCoordinateInterval):
+        to_half_open(7, 3, None)
+
+
+def test_reverse_complement_extraction(materializer):
+    moldef = extracted_moldef(2, 6, reverse=True)
+    assert materializer.sequence(moldef) == "CAAC"
+
+
+def test_results_are_cached(reference):
+    calls = []
+
+    def resolve(ref):
+        calls.append(ref.reference)
+        return reference
+
+    materializer = Materializer(resolve)
+    for _ in range(3):
+        assert materializer.sequence(extracted_moldef(0, 4)) == "ACGT"
+    assert materializer.sequence(extracted_moldef(0, 4, reverse=True)) == "ACGT"
+    assert calls == ["#reference", "#reference"]
+    assert materializer.cache.hits == 2
+
+
+def test_packed_starting_molecule_is_sliced_lazily():
+    packed = PackedSequence.pack(REFERENCE, NUCLEOTIDE)
+    materializer = Materializer({"#reference": packed})
+    bases = materializer.sequence(extracted_moldef(4, 12))
+    assert isinstance(bases, PackedSequence)
+    assert bases == REFERENCE[4:12]
+
+
+def test_extraction_errors(materializer):
+    with pytest.raises(InvalidCoordinateInterval):
+        materializer.sequence(extracted_moldef(10, 40))
+    with pytest.raises(UnsupportedCoordinateSystem):
+        materializer.sequence(extracted_moldef(0, 4, origin="cds-start"))
+    with pytest.raises(UnresolvableReference):
+        Materializer({}).sequence(extracted_moldef(0, 4))
@@ -0,0 +1,84 @@
+import pickle
+
+import pytest
+
+from profiles.sequence import Sequence as FhirSequence
+from resources.fasta import (
+    FastaIndexEntry,
+    FastaSequence,
+    build_fasta_index,
+    open_fasta,
+    read_fasta_index,
+)
+
+CHR_A = "ACGTACGTAC" * 3 + "GGA"
+CHR_B = "TTTTCCCCGGGGAAAAN"
+
+
+@pytest.fixture
+def fasta_path(tmp_path):
+    path = tmp_path / "reference.fa"
+    lines = [">chrA description"]
+    lines += [CHR_A[i : i + 10] for i in range(0, len(CHR_A), 10)]
+    lines += [">chrB"]
+    lines += [CHR_B[i : i + 10] for i in range(0, len(CHR_B), 10)]
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def test_build_fasta_index(fasta_path):
+    index = build_fasta_index(fasta_path)
+    assert index["chrA"] == FastaIndexEntry("chrA", 33, 18, 10, 11)
+    assert index["chrB"] == FastaIndexEntry("chrB", 17, 61, 10, 11)
+
+
+def test_read_fasta_index(fasta_path, tmp_path):
+    fai = tmp_path / "reference.fa.fai"
+    fai.write_text("chrA\t33\t18\t10\t11\nchrB\t17\t61\t10\t11\n")
+    assert read_fasta_index(fai) == build_fasta_index(fasta_path)
+
+
+def test_fasta_sequence_reads_lazily(fasta_path):
+    sequence = open_fasta(fasta_path).sequence("chrA")
+    assert len(sequence) == len(CHR_A)
+    assert str(sequence) == CHR_A
+    for start in range(len(CHR_A)):
+        for stop in range(start, len(CHR_A) + 1, 3):
+            assert sequence[start:stop] == CHR_A[start:stop]
+
+    sub = sequence[8:25]
+    assert isinstance(sub, FastaSequence)
+    assert sub[2:5] == CHR_A[10:13]
+    assert open_fasta(fasta_path) is sequence.fasta
+    assert pickle.loads(pickle.dumps(sub)) == CHR_A[8:25]  # noqa: S301
+
+
+def test_sequence_from_fasta(fasta_path):
+    sequence = FhirSequence.from_fasta(fasta_path, "chrB", id="chrB")
+    literal = sequence.representation[0].literal
+    assert isinstance(literal.value, FastaSequence)
+    assert literal.value[4:8] == "CCCC"
+    assert sequence.moleculeType.coding[0].code == "dna"
+
+    dumped = sequence.model_dump()
+    assert dumped["representation"][0]["literal"]["value"] == CHR_B
+    assert FhirSequence(**dumped) == sequence
+
+
+def test_sequence_from_fasta_unknown_contig(fasta_path):
+    with pytest.raises(KeyError):
+        FhirSequence.from_fasta(fasta_path, "chrZ")
+
+
+def test_sequence_from_fasta_rejects_a_representation(fasta_path):
+    with pytest.raises(ValueError, match="representation"):
+        FhirSequence.from_fasta(
+            fasta_path, "chrB", representation=[{"literal": {"value": "ACGT"}}]
+        )
+
+
+def test_empty_fasta_file(tmp_path):
+    path = tmp_path / "empty.fa"
+    path.write_bytes(b"")
+    with pytest.raises(ValueError, match="is empty"):
+        open_fasta(path)
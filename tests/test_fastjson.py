@@ -0,0 +1,94 @@
+import io
+import json
+
+import pytest
+from fhir.resources.bundle import Bundle
+
+from profiles.sequence import Sequence as FhirSequence
+from resources.moleculardefinition import MolecularDefinition
+from resources.sequenceview import pack_literals
+from serialization import fastjson
+from serialization.fastjson import dumps, to_dict, write_bundle, write_ndjson
+
+
+@pytest.fixture
+def example_molecular_definition():
+    return MolecularDefinition(
+        id="example",
+        meta={"versionId": "2", "lastUpdated": "2024-01-02T03:04:05.123+02:00"},
+        implicitRules="http://example.org/rules",
+        _implicitRules={
+            "extension": [{"url": "http://example.org", "valueString": "x"}]
+        },
+        identifier=[{"system": "http://example.org", "value": "42"}],
+        moleculeType={"coding": [{"code": "dna", "display": "DNA Sequence"}]},
+        location=[
+            {
+                "sequenceLocation": {
+                    "sequenceContext": {"reference": "#ref"},
+                    "coordinateInterval": {
+                        "startQuantity": {"value": 10.5},
+                        "endQuantity": {"value": 12},
+                    },
+                }
+            }
+        ],
+        representation=[{"literal": {"value": "ACGT" * 100}}],
+    )
+
+
+def test_output_matches_model_dump_json(example_molecular_definition):
+    expected = example_molecular_definition.model_dump_json().encode()
+    assert dumps(example_molecular_definition) == expected
+    assert to_dict(example_molecular_definition) == json.loads(expected)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_utc_instants_keep_their_z(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(fastjson, "orjson", None)
+    model = MolecularDefinition(
+        meta={"lastUpdated": "2024-05-01T10:00:00Z"},
+        moleculeType={"coding": [{"code": "dna"}]},
+    )
+    payload = dumps(model)
+    assert b'"lastUpdated":"2024-05-01T10:00:00Z"' in payload
+    assert payload == model.model_dump_json().encode()
+    assert MolecularDefinition.model_validate_json(payload) == model
+    assert to_dict(model)["meta"]["lastUpdated"] == "2024-05-01T10:00:00Z"
+
+
+def test_packed_and_empty_literals():
+    sequence = FhirSequence(
+        id="sequence",
+        moleculeType={"coding": [{"code": "dna"}]},
+        representation=[
+            {"literal": {"value": "ACGT" * 100}},
+            {"literal": {"value": ""}},
+        ],
+    )
+    expected = sequence.model_dump_json().encode()
+    assert pack_literals(sequence) == 1
+    assert dumps(sequence) == expected
+
+
+def test_json_fallback(example_molecular_definition, monkeypatch):
+    monkeypatch.setattr(fastjson, "orjson", None)
+    expected = example_molecular_definition.model_dump_json()
+    assert json.loads(dumps(example_molecular_definition)) == json.loads(expected)
+
+
+def test_streamed_bundle_and_ndjson(example_molecular_definition):
+    records = [
+        example_molecular_definition.model_copy(update={"id": f"example-{index}"})
+        for index in range(3)
+    ]
+    buffer = io.BytesIO()
+    assert write_bundle(records, buffer) == 3
+    bundle = Bundle.model_validate_json(buffer.getvalue())
+    assert [entry.resource for entry in bundle.entry] == records
+
+    buffer = io.BytesIO()
+    assert write_ndjson(records, buffer) == 3
+    lines = buffer.getvalue().splitlines()
+    assert [MolecularDefinition.model_validate_json(line) for line in lines] == records
@@ -0,0 +1,100 @@
+import json
+import pickle
+
+import pytest
+from benchmarks import generators
+
+from exceptions.fhir import (
+    FHIRException,
+    InvalidFocusCodingDisplay,
+    InvalidMoleculeTypeError,
+    MemberStateNotAllowedError,
+    MissingFocus,
+    MultipleLocation,
+    UnresolvableReference,
+)
+from profiles.sequence import Sequence as FhirSequence
+from profiles.variation import Variation as FhirVariation
+from validation.ndjson import validate_ndjson
+
+
+def test_message_is_rendered_from_fields():
+    exception = InvalidFocusCodingDisplay(
+        profile="Variation",
+        index=0,
+        code="reference-state",
+        display="Reference",
+        expected="Reference State",
+    )
+    assert exception.args == ()
+    assert str(exception) == (
+        "The Coding with code='reference-state' must have "
+        "display='Reference State', found 'Reference'."
+    )
+    assert exception.fields == {
+        "profile": "Variation",
+        "index": 0,
+        "code": "reference-state",
+        "display": "Reference",
+        "expected": "Reference State",
+    }
+
+
+def test_plain_messages_still_work():
+    exception = UnresolvableReference("Cannot resolve 'MolecularDefinition/x'.")
+    assert str(exception) == "Cannot resolve 'MolecularDefinition/x'."
+    assert exception.fields == {}
+    assert str(FHIRException()) == ""
+
+
+@pytest.mark.parametrize(
+    "exception_type, code",
+    [
+        (FHIRException, "fhir-exception"),
+        (MemberStateNotAllowedError, "member-state-not-allowed"),
+        (MultipleLocation, "multiple-location"),
+        (MissingFocus, "missing-focus"),
+    ],
+)
+def test_error_codes(exception_type, code):
+    assert exception_type.error_code == code
+
+
+def test_to_dict_and_pickle():
+    exception = MissingFocus(profile="Allele", index=2)
+    assert exception.to_dict() == {
+        "error": "MissingFocus",
+        "code": "missing-focus",
+        "profile": "Allele",
+        "index": 2,
+        "message": "representation[2].focus is required when slicing by focus CodeableConcept.",
+    }
+    copy = pickle.loads(pickle.dumps(exception))  # noqa: S301
+    assert type(copy) is MissingFocus
+    assert copy.fields == exception.fields
+    assert str(copy) == str(exception)
+
+
+def test_profile_errors_carry_fields(tmp_path):
+    data = generators.variation(representations=3)
+    del data["representation"][1]["focus"]
+    with pytest.raises(MissingFocus) as exception_info:
+        FhirVariation(**data)
+    assert exception_info.value.fields == {"profile": "Variation", "index": 1}
+
+    path = tmp_path / "variations.ndjson"
+    path.write_text(json.dumps(data))
+    (error,) = validate_ndjson(path, profile=FhirVariation)
+    assert (error.error, error.code) == ("MissingFocus", "missing-focus")
+    assert error.fields == {"profile": "Variation", "index": 1}
+
+
+def test_sequence_errors_name_the_sequence_profile():
+    data = generators.sequence(10)
+    data["moleculeType"] = {}
+    with pytest.raises(InvalidMoleculeTypeError) as exception_info:
+        FhirSequence(**data)
+    assert str(exception_info.value) == (
+        "The `moleculeType` field must contain exactly one item. "
+        "`moleculeType` has a 1..1 cardinality for Sequence."
+    )
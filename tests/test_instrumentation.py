@@ -0,0 +1,73 @@
+import pytest
+from benchmarks import generators
+from fhir_core.fhirabstractmodel import FHIRAbstractModel
+
+from exceptions.fhir import MultipleLocation
+from profiles.allele import Allele as FhirAllele
+from resources.instrumentation import FHIR_CORE_CHECKS, Timing, ValidationTimer
+
+
+def test_records_profile_validators_and_fhir_core_checks():
+    timer = ValidationTimer()
+    with timer.activate():
+        FhirAllele.model_validate(generators.allele())
+
+    timings = timer.to_dict()
+    for name in (
+        "Allele.validate_moleculeType",
+        "Allele.validate_location_cardinality",
+        "Allele.validate_representation_cardinality",
+        "Allele.validate_focus",
+        "MolecularDefinitionRepresentation._validate_required_primitive_elements",
+        "Coding._validate_one_of_many",
+    ):
+        assert timings[name]["count"] >= 1
+        assert 0 < timings[name]["p50"] <= timings[name]["max"]
+
+
+def test_disabled_outside_the_block():
+    originals = {name: FHIRAbstractModel.__dict__[name] for name in FHIR_CORE_CHECKS}
+    timer = ValidationTimer()
+    with timer.activate():
+        pass
+    FhirAllele.model_validate(generators.allele())
+    assert timer.to_dict() == {}
+    assert {
+        name: FHIRAbstractModel.__dict__[name] for name in FHIR_CORE_CHECKS
+    } == originals
+
+
+def test_failures_are_timed_and_nesting_is_rejected():
+    data = generators.allele()
+    data["location"].append(data["location"][0])
+    timer = ValidationTimer()
+    with timer.activate():
+        with pytest.raises(MultipleLocation):
+            FhirAllele.model_validate(data)
+        with pytest.raises(RuntimeError), ValidationTimer().activate():
+            pass
+    assert timer.to_dict()["Allele.validate_location_cardinality"]["count"] == 1
+
+
+def test_percentiles_and_prometheus_export():
+    timing = Timing()
+    for seconds in [2e-6] * 90 + [3e-4] * 10:
+        timing.add(seconds)
+    assert timing.percentile(0.5) == 2.5e-6
+    assert timing.percentile(0.99) == 3e-4
+
+    timer = ValidationTimer()
+    timer.timings["Allele.validate_focus"] = timing
+    text = timer.to_prometheus()
+    assert "# TYPE moldef_validator_seconds histogram" in text
+    assert (
+        'moldef_validator_seconds_bucket{validator="Allele.validate_focus",le="2.5e-06"} 90'
+        in text
+    )
+    assert (
+        'moldef_validator_seconds_bucket{validator="Allele.validate_focus",le="+Inf"} 100'
+        in text
+    )
+    assert (
+        'moldef_validator_seconds_count{validator="Allele.validate_focus"} 100' in text
+    )
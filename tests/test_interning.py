@@ -0,0 +1,164 @@
+import gc
+import pickle
+from copy import deepcopy
+
+import pytest
+from fhir.resources.codeableconcept import CodeableConcept
+from pydantic import ValidationError
+
+from profiles.variation import Variation as FhirVariation
+from resources.interning import ConceptInterner, active_interner
+
+FOCUS_SYSTEM = "http://hl7.org/fhir/uv/molecular-definition-data-types/CodeSystem/molecular-definition-focus"
+
+
+@pytest.fixture
+def valid_fhir_variation():
+    return {
+        "resourceType": "MolecularDefinition",
+        "moleculeType": {
+            "coding": [
+                {
+                    "system": "http://hl7.org/fhir/uv/molecular-definition-data-types/CodeSystem/molecule-type",
+                    "code": "dna",
+                    "display": "DNA Sequence",
+                }
+            ]
+        },
+        "location": [
+            {
+                "sequenceLocation": {
+                    "sequenceContext": {"reference": "#ref-to-nc000019"},
+                    "coordinateInterval": {
+                        "coordinateSystem": {
+                            "system": {
+                                "coding": [
+                                    {
+                                        "system": "http://loinc.org",
+                                        "code": "LA30100-4",
+                                        "display": "0-based interval counting",
+                                    }
+                                ]
+                            }
+                        },
+                        "startQuantity": {"value": 44908683},
+                        "endQuantity": {"value": 44908684},
+                    },
+                }
+            }
+        ],
+        "representation": [
+            {
+                "focus": {
+                    "coding": [
+                        {
+                            "system": FOCUS_SYSTEM,
+                            "code": "reference-state",
+                            "display": "Reference State",
+                        }
+                    ]
+                },
+                "literal": {"value": "T"},
+            },
+            {
+                "focus": {
+                    "coding": [
+                        {
+                            "system": FOCUS_SYSTEM,
+                            "code": "alternative-state",
+                            "display": "Alternative State",
+                        }
+                    ]
+                },
+                "literal": {"value": "C"},
+            },
+        ],
+    }
+
+
+def _system(variation):
+    return variation.location[0].sequenceLocation.coordinateInterval.coordinateSystem
+
+
+def test_interning_is_opt_in(valid_fhir_variation):
+    assert active_interner() is None
+    first = FhirVariation(**deepcopy(valid_fhir_variation))
+    second = FhirVariation(**deepcopy(valid_fhir_variation))
+    assert first.moleculeType is not second.moleculeType
+
+
+def test_interning_shares_equal_concepts(valid_fhir_variation):
+    interner = ConceptInterner()
+    with interner.activate() as active:
+        assert active is interner is active_interner()
+        records = [FhirVariation(**deepcopy(valid_fhir_variation)) for _ in range(10)]
+    assert active_interner() is None
+
+    first, *others = records
+    for other in others:
+        assert other.moleculeType is first.moleculeType
+        assert _system(other).system is _system(first).system
+        assert other.representation[1].focus is first.representation[1].focus
+        assert other == first
+    assert first.representation[0].focus is not first.representation[1].focus
+    # 4 concepts and their 4 codings per record, all shared after the first one.
+    assert interner.stats() == {
+        "hits": 72,
+        "misses": 8,
+        "hit_rate": 0.9,
+        "size": 8,
+        "maxsize": 4096,
+    }
+    assert first.model_dump() == FhirVariation(**valid_fhir_variation).model_dump()
+
+
+def test_interned_values_cannot_be_changed_through_a_record(valid_fhir_variation):
+    interner = ConceptInterner()
+    with interner.activate():
+        first, second = (
+            FhirVariation(**deepcopy(valid_fhir_variation)) for _ in range(2)
+        )
+    with pytest.raises(ValidationError):
+        first.moleculeType.coding[0].display = "x"
+    with pytest.raises(TypeError):
+        first.moleculeType.coding.append(first.moleculeType.coding[0])
+    assert second.moleculeType.coding[0].display == "DNA Sequence"
+    assert len(second.moleculeType.coding) == 1
+
+    # Copies are private to their record, and mutable again.
+    for copy in (
+        first.model_copy(deep=True),
+        pickle.loads(pickle.dumps(first)),  # noqa: S301
+    ):
+        assert copy == second
+        copy.moleculeType.coding[0].display = "x"
+        copy.moleculeType.coding.append(copy.moleculeType.coding[0])
+    assert second.moleculeType.coding[0].display == "DNA Sequence"
+
+    first.moleculeType = {"coding": [{"code": "rna"}]}
+    assert second.moleculeType.coding[0].code == "dna"
+
+
+def test_interning_is_bounded_and_weak(valid_fhir_variation):
+    interner = ConceptInterner(maxsize=2)
+    with interner.activate():
+        records = [FhirVariation(**deepcopy(valid_fhir_variation)) for _ in range(2)]
+    assert len(interner) == 2
+    assert records[0].moleculeType is records[1].moleculeType
+    assert _system(records[0]).system is not _system(records[1]).system
+
+    del records
+    gc.collect()
+    assert len(interner) == 0
+
+
+def test_concepts_with_extensions_are_not_interned():
+    interner = ConceptInterner()
+    data = {
+        "coding": [{"code": "dna"}],
+        "extension": [{"url": "http://example.org", "valueString": "x"}],
+    }
+    first = interner.concept(CodeableConcept(**data))
+    second = interner.concept(CodeableConcept(**data))
+    assert first is not second
+    assert first.coding[0] is second.coding[0]
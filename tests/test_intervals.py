@@ -0,0 +1,143 @@
+import random
+
+import pytest
+
+from indexing.intervals import IntervalIndex, IntervalSet
+from profiles.sequence import Sequence as FhirSequence
+from resources.moleculardefinition import MolecularDefinition
+
+
+def located(id, start, end, context="#ref-to-nc000019", code="LA30102-0"):
+    return MolecularDefinition(
+        id=id,
+        moleculeType={"coding": [{"code": "dna"}]},
+        location=[
+            {
+                "sequenceLocation": {
+                    "sequenceContext": {"reference": context},
+                    "coordinateInterval": {
+                        "coordinateSystem": {
+                            "system": {
+                                "coding": [{"system": "http://loinc.org", "code": code}]
+                            }
+                        },
+                        "startQuantity": {"value": start},
+                        "endQuantity": {"value": end},
+                    },
+                }
+            }
+        ],
+    )
+
+
+@pytest.fixture
+def index():
+    return IntervalIndex(
+        [
+            located("apoe-e4", 44908684, 44908684),
+            located("apoe-e2", 44908822, 44908822),
+            located("apoe-gene", 44905791, 44909393),
+            located("elsewhere", 44908684, 44908684, context="#ref-to-nc000001"),
+        ]
+    )
+
+
+def ids(records):
+    return sorted(record.id for record in records)
+
+
+def test_queries_use_normalized_coordinates(index):
+    # 1-based inclusive 44908684 is [44908683, 44908684) once normalized.
+    context = "#ref-to-nc000019"
+    assert ids(index.overlapping(context, 44908000, 44909000)) == [
+        "apoe-e2",
+        "apoe-e4",
+        "apoe-gene",
+    ]
+    assert ids(index.overlapping(context, 44908684, 44908821)) == ["apoe-gene"]
+    assert ids(index.containing(context, 44908683, 44908684)) == [
+        "apoe-e4",
+        "apoe-gene",
+    ]
+    assert ids(index.within(context, 44908000, 44909000)) == ["apoe-e2", "apoe-e4"]
+    assert ids(index.nearest(context, 44909500)) == ["apoe-gene"]
+    assert index.overlapping("#unknown", 0, 10) == []
+
+
+def test_insert_and_delete(index):
+    context = "#ref-to-nc000019"
+    gene = index.overlapping(context, 44905000, 44906000)[0]
+    index.remove(gene)
+    assert gene not in index
+    assert ids(index.nearest(context, 44908700)) == ["apoe-e4"]
+    index.add(gene)
+    assert ids(index.nearest(context, 44908700)) == ["apoe-gene"]
+
+
+def test_incremental_updates_keep_few_runs():
+    rng = random.Random(12)  # noqa: S311
+    intervals = IntervalSet()
+    expected = {}
+    for serial in range(3000):
+        start = rng.randrange(100_000)
+        intervals.add(serial, start, start + 50, serial)
+        expected[serial] = start
+        if serial % 3 == 0:
+            removed = rng.choice(sorted(expected))
+            intervals.discard(removed)
+            del expected[removed]
+        found = {item for _, _, item in intervals.overlapping(start, start + 1)}
+        assert (serial in found) == (serial in expected)
+        assert len(intervals.pending) <= 33
+    assert len(intervals) == len(expected)
+    assert len(intervals.runs) <= 2 * (3000).bit_length()
+    found = sorted(item for _, _, item in intervals.overlapping(0, 200_000))
+    assert found == sorted(expected)
+    intervals.rebuild()
+    assert len(intervals.runs) == 1
+    assert len(intervals) == len(expected)
+
+
+def test_interval_set_matches_brute_force():
+    rng = random.Random(19)  # noqa: S311
+    intervals = IntervalSet()
+    expected = {}
+    for serial in range(2000):
+        start = rng.randrange(100_000)
+        end = start + rng.choice((0, 1, 10, 100, 5000))
+        intervals.add(serial, start, end, serial)
+        expected[serial] = (start, end)
+    for serial in rng.sample(sorted(expected), 300):
+        intervals.discard(serial)
+        del expected[serial]
+
+    for _ in range(200):
+        start = rng.randrange(100_000)
+        end = start + rng.randrange(2000)
+        found = sorted(item for _, _, item in intervals.overlapping(start, end))
+        assert found == sorted(
+            serial for serial, (s, e) in expected.items() if s < end and start < e
+        )
+
+        nearest = intervals.nearest(start)
+        distances = {
+            serial: max(s - start, start - e + 1, 0)
+            for serial, (s, e) in expected.items()
+        }
+        closest = min(distances.values())
+        assert {item for _, _, item in nearest} <= {
+            serial for serial, distance in distances.items() if distance == closest
+        }
+        assert nearest
+
+
+def test_records_without_location_are_skipped():
+    sequence = FhirSequence(
+        moleculeType={"coding": [{"code": "dna"}]},
+        representation=[{"literal": {"value": "ACGT"}}],
+    )
+    allele = located("apoe-e4", 44908684, 44908684)
+    index = IntervalIndex([allele, sequence])
+    assert index.add(sequence) is False
+    assert sequence not in index
+    assert len(index) == 1
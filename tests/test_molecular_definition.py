@@ -234,3 +234,31 @@ def test_molecular_definition_missing_sequence_context(example_molecular_definit
 
     with pytest.raises(ValidationError):
         MolecularDefinition(**invalid_data)
+
+
+def test_molecular_definition_from_trusted(example_molecular_definition):
+    moldef = MolecularDefinition(**example_molecular_definition)
+    trusted = MolecularDefinition.from_trusted(moldef.model_dump())
+
+    assert trusted == moldef
+    assert trusted.model_dump_json() == moldef.model_dump_json()
+    impl_molecular_definition_1(trusted)
+
+
+def test_molecular_definition_from_trusted_unknown_element(
+    example_molecular_definition,
+):
+    example_molecular_definition["representation"][0]["unknown"] = True
+
+    with pytest.raises(ValueError, match="`unknown` is not an element of"):
+        MolecularDefinition.from_trusted(example_molecular_definition)
+
+
+def test_molecular_definition_from_trusted_spot_check(example_molecular_definition):
+    del example_molecular_definition["location"][0]["sequenceLocation"][
+        "sequenceContext"
+    ]
+
+    MolecularDefinition.from_trusted(example_molecular_definition)
+    with pytest.raises(ValidationError):
+        MolecularDefinition.from_trusted(example_molecular_definition, sample_rate=1.0)
@@ -0,0 +1,103 @@
+import json
+from copy import deepcopy
+
+import pytest
+from pydantic import ValidationError
+
+from profiles.sequence import Sequence as FhirSequence
+from resources.instrumentation import ValidationTimer
+from validation.ndjson import (
+    NDJSONValidator,
+    RecordError,
+    ValidationStats,
+    validate_ndjson,
+)
+from validation.records import get_validator
+
+
+@pytest.fixture
+def valid_sequence():
+    return {
+        "resourceType": "MolecularDefinition",
+        "id": "example-sequence-c",
+        "meta": {"profile": ["http://hl7.org/fhir/StructureDefinition/sequence"]},
+        "moleculeType": {
+            "coding": [
+                {
+                    "system": "http://hl7.org/fhir/sequence-type",
+                    "code": "dna",
+                    "display": "DNA Sequence",
+                }
+            ]
+        },
+        "representation": [{"literal": {"value": "C"}}],
+    }
+
+
+@pytest.fixture
+def ndjson_file(tmp_path, valid_sequence):
+    invalid_profile = deepcopy(valid_sequence)
+    invalid_profile["location"] = []
+    invalid_schema = deepcopy(valid_sequence)
+    invalid_schema["representation"] = [{"literal": {}}]
+
+    lines = [
+        json.dumps(valid_sequence),
+        json.dumps(invalid_profile),
+        "",
+        "{not json",
+        json.dumps(invalid_schema),
+        json.dumps(valid_sequence),
+    ]
+    path = tmp_path / "sequences.ndjson"
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def test_validate_ndjson_keeps_going_after_errors(ndjson_file):
+    stats = ValidationStats()
+    results = list(
+        validate_ndjson(ndjson_file, profile=FhirSequence, chunk_size=2, stats=stats)
+    )
+
+    assert len(results) == 5
+    assert isinstance(results[0], FhirSequence)
+    assert isinstance(results[-1], FhirSequence)
+
+    errors = [result for result in results if isinstance(result, RecordError)]
+    assert [error.line for error in errors] == [2, 4, 5]
+    assert errors[0].error == "ElementNotAllowedError"
+    assert errors[0].message == "`location` is not allowed in Sequence."
+    assert errors[0].details == ()
+    assert errors[1].error == "ValidationError"
+    assert errors[1].details[0]["type"] == "json_invalid"
+    assert errors[2].error == "ValidationError"
+    assert isinstance(errors[2].cause, ValidationError)
+    assert errors[2].message == str(errors[2].cause)
+    assert errors[2].rendered().cause == errors[2].message
+
+    assert stats.records == 5
+    assert stats.valid == 2
+    assert stats.invalid == 3
+    assert stats.records_per_second > 0
+
+
+def test_validate_ndjson_matches_direct_construction(ndjson_file, valid_sequence):
+    first = next(validate_ndjson(ndjson_file, profile=FhirSequence))
+    assert first == FhirSequence(**valid_sequence)
+
+
+def test_validator_is_shared_per_profile():
+    assert get_validator(FhirSequence) is get_validator(FhirSequence)
+
+
+def test_validators_run_once_per_record(valid_sequence):
+    timer = ValidationTimer()
+    with timer.activate():
+        NDJSONValidator(FhirSequence).validate_line(json.dumps(valid_sequence), 1)
+    assert timer.to_dict()["Sequence.validate_moleculeType"]["count"] == 1
+
+
+def test_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        NDJSONValidator(FhirSequence, chunk_size=0)
@@ -0,0 +1,72 @@
+from copy import deepcopy
+
+import pytest
+
+from profiles.sequence import Sequence as FhirSequence
+from validation.ndjson import RecordError, ValidationStats
+from validation.parallel import ParallelValidator, validate_parallel
+
+
+@pytest.fixture
+def valid_sequence():
+    return {
+        "resourceType": "MolecularDefinition",
+        "id": "example-sequence-c",
+        "meta": {"profile": ["http://hl7.org/fhir/StructureDefinition/sequence"]},
+        "moleculeType": {
+            "coding": [
+                {
+                    "system": "http://hl7.org/fhir/sequence-type",
+                    "code": "dna",
+                    "display": "DNA Sequence",
+                }
+            ]
+        },
+        "representation": [{"literal": {"value": "C"}}],
+    }
+
+
+def test_validate_parallel_preserves_order(valid_sequence):
+    records = []
+    for idx in range(20):
+        record = deepcopy(valid_sequence)
+        record["id"] = f"sequence-{idx}"
+        if idx % 7 == 3:
+            record["location"] = []
+        records.append(record)
+
+    stats = ValidationStats()
+    results = list(
+        validate_parallel(
+            iter(records),
+            profile=FhirSequence,
+            max_workers=2,
+            chunk_size=3,
+            stats=stats,
+        )
+    )
+
+    assert len(results) == 20
+    for idx, result in enumerate(results):
+        if idx % 7 == 3:
+            assert isinstance(result, RecordError)
+            assert result.line == idx + 1
+            assert result.error == "ElementNotAllowedError"
+        else:
+            assert isinstance(result, dict)
+            assert result["id"] == f"sequence-{idx}"
+            assert FhirSequence(**result) == FhirSequence(**records[idx])
+
+    assert stats.records == 20
+    assert stats.invalid == 3
+    assert stats.valid == 17
+
+
+def test_validate_parallel_empty_input():
+    assert list(validate_parallel([], profile=FhirSequence, max_workers=1)) == []
+
+
+@pytest.mark.parametrize("kwargs", [{"chunk_size": 0}, {"max_workers": 0}])
+def test_invalid_pool_settings(kwargs):
+    with pytest.raises(ValueError):
+        ParallelValidator(FhirSequence, **kwargs)
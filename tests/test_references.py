@@ -0,0 +1,123 @@
+import pytest
+from fhir.resources.bundle import Bundle
+
+from exceptions.fhir import UnresolvableReference
+from representations.materialize import Materializer
+from representations.references import ReferenceResolver
+from resources.moleculardefinition import MolecularDefinition
+
+
+def sequence(id, value):
+    return {
+        "resourceType": "MolecularDefinition",
+        "id": id,
+        "moleculeType": {"coding": [{"code": "dna"}]},
+        "representation": [{"literal": {"value": value}}],
+    }
+
+
+@pytest.fixture
+def allele():
+    return MolecularDefinition(
+        id="allele",
+        contained=[sequence("ref-to-nc000019", "ACGTACGTAA")],
+        moleculeType={"coding": [{"code": "dna"}]},
+        representation=[
+            {
+                "extracted": {
+                    "startingMolecule": {"reference": "#ref-to-nc000019"},
+                    "coordinateInterval": {"start": 2, "end": 6},
+                }
+            }
+        ],
+    )
+
+
+@pytest.fixture
+def bundle():
+    return Bundle(
+        type="collection",
+        entry=[
+            {
+                "fullUrl": "http://example.org/fhir/MolecularDefinition/seq-1",
+                "resource": sequence("seq-1", "GATTACA"),
+            },
+            {"fullUrl": "urn:uuid:2b9d", "resource": sequence("seq-2", "CC")},
+        ],
+    )
+
+
+def test_local_reference(allele):
+    resolver = ReferenceResolver(allele)
+    resolved = resolver.resolve("#ref-to-nc000019")
+    assert resolved is allele.contained[0]
+    assert Materializer(resolver).sequence(allele) == "GTAC"
+
+
+def test_bundle_references(bundle):
+    resolver = ReferenceResolver(bundle=bundle, base_url="http://example.org/fhir/")
+    first = bundle.entry[0].resource
+    assert resolver.resolve("MolecularDefinition/seq-1") is first
+    assert (
+        resolver.resolve("http://example.org/fhir/MolecularDefinition/seq-1") is first
+    )
+    assert resolver.resolve("urn:uuid:2b9d") is bundle.entry[1].resource
+    assert resolver.get("MolecularDefinition/missing") is None
+    with pytest.raises(UnresolvableReference):
+        resolver.resolve("#seq-1")
+
+
+def test_registry_entries_are_parsed_once():
+    fetched = []
+
+    def registry(reference):
+        fetched.append(reference)
+        return sequence("remote", "TTGA")
+
+    resolver = ReferenceResolver(registry=registry, cache_size=1)
+    remote = resolver.resolve("https://registry.org/MolecularDefinition/remote")
+    assert isinstance(remote, MolecularDefinition)
+    assert resolver.resolve("https://registry.org/MolecularDefinition/remote") is remote
+    assert len(fetched) == 1
+
+    # Evicted from the cache by a more recent lookup, fetched again.
+    resolver.resolve("https://registry.org/MolecularDefinition/other")
+    resolver.resolve("https://registry.org/MolecularDefinition/remote")
+    assert len(fetched) == 3
+
+
+def test_container_indexes_are_bounded():
+    resolver = ReferenceResolver(cache_size=2)
+    containers = [
+        {"contained": [sequence(f"seq-{index}", "ACGT")]} for index in range(5)
+    ]
+    for index, container in enumerate(containers):
+        resolved = resolver.resolve(f"#seq-{index}", container)
+        assert isinstance(resolved, MolecularDefinition)
+        assert resolver.resolve(f"#seq-{index}", container) is resolved
+    assert len(resolver._contained) == 2
+    # Indexed again once evicted.
+    assert resolver.resolve("#seq-0", containers[0]).id == "seq-0"
+
+
+def test_materializer_resolves_local_references_per_resource():
+    def extracting(value):
+        return MolecularDefinition(
+            contained=[sequence("ref", value)],
+            moleculeType={"coding": [{"code": "dna"}]},
+            representation=[
+                {
+                    "extracted": {
+                        "startingMolecule": {"reference": "#ref"},
+                        "coordinateInterval": {"start": 0, "end": 4},
+                    }
+                }
+            ],
+        )
+
+    materializer = Materializer(ReferenceResolver())
+    first, second = extracting("ACGTAA"), extracting("TTGCAA")
+    assert materializer.sequence(first) == "ACGT"
+    assert materializer.sequence(second) == "TTGC"
+    assert materializer.sequence(first) == "ACGT"
+    assert materializer.cache.hits == 1
@@ -0,0 +1,88 @@
+import pytest
+
+from exceptions.fhir import OverlappingEdits, ReplacedSequenceMismatch
+from representations.materialize import Materializer
+from representations.relative import Edit, apply_edits
+from resources.moleculardefinition import MolecularDefinition
+
+STARTING = "ACGTACGTACGT"
+MOLECULES = {"#start": STARTING, "#ins": "TTT", "#del": "", "#snv": "G", "#ref": "A"}
+
+
+def edit(start, end, replacement, order=None, replaced=None):
+    data = {
+        "coordinateInterval": {
+            "coordinateSystem": {
+                "system": {
+                    "coding": [{"system": "http://loinc.org", "code": "LA30100-4"}]
+                }
+            },
+            "start": start,
+            "end": end,
+        },
+        "replacementMolecule": {"reference": replacement},
+    }
+    if order is not None:
+        data["editOrder"] = order
+    if replaced is not None:
+        data["replacedMolecule"] = {"reference": replaced}
+    return data
+
+
+def relative_moldef(*edits):
+    return MolecularDefinition(
+        id="edited",
+        moleculeType={"coding": [{"code": "dna"}]},
+        representation=[
+            {
+                "relative": {
+                    "startingMolecule": {"reference": "#start"},
+                    "edit": list(edits),
+                }
+            }
+        ],
+    )
+
+
+def test_edits_are_applied_in_one_pass():
+    moldef = relative_moldef(
+        edit(8, 9, "#snv", order=3, replaced="#ref"),
+        edit(2, 2, "#ins", order=1),
+        edit(4, 6, "#del", order=2),
+    )
+    result = Materializer(MOLECULES).relative(moldef.representation[0].relative)
+    assert result.sequence == "AC" + "TTT" + "GT" + "GT" + "G" + "CGT"
+    assert Materializer(MOLECULES).sequence(moldef) == result.sequence
+
+
+def test_shift_map():
+    result = apply_edits(
+        STARTING, [Edit(2, 2, "TTT"), Edit(4, 6, ""), Edit(8, 9, "GG")]
+    )
+    edited = str(result.sequence)
+    assert result.shifts.shift == 3 - 2 + 1
+
+    for position, base in enumerate(STARTING):
+        target = result.shifts.to_edited(position)
+        if position in (4, 5, 8):
+            assert target is None
+        else:
+            assert edited[target] == base
+            assert result.shifts.to_starting(target) == position
+    assert [result.shifts.to_starting(p) for p in (2, 3, 4)] == [None] * 3
+
+
+def test_insertions_at_same_position_follow_edit_order():
+    result = apply_edits(
+        STARTING, [Edit(4, 4, "GG", order=2), Edit(4, 4, "C", order=1)]
+    )
+    assert result.sequence == "ACGT" + "C" + "GG" + "ACGTACGT"
+
+
+def test_edit_errors():
+    with pytest.raises(OverlappingEdits):
+        apply_edits(STARTING, [Edit(2, 6, "A"), Edit(5, 7, "C")])
+    with pytest.raises(ReplacedSequenceMismatch):
+        Materializer(MOLECULES).sequence(
+            relative_moldef(edit(0, 1, "#snv", replaced="#snv"))
+        )
@@ -0,0 +1,67 @@
+import pytest
+
+from exceptions.fhir import InvalidCopyCount
+from representations.materialize import Materializer
+from representations.repeated import PeriodicSequence, primitive_root
+from resources.moleculardefinition import MolecularDefinition
+
+
+def repeated_moldef(motif, copies):
+    return MolecularDefinition(
+        id="str-allele",
+        moleculeType={"coding": [{"code": "dna"}]},
+        representation=[
+            {
+                "repeated": {
+                    "sequenceMotif": {"reference": motif},
+                    "copyCount": copies,
+                }
+            }
+        ],
+    )
+
+
+def test_primitive_root():
+    assert primitive_root("CACACA") == "CA"
+    assert primitive_root("CAG") == "CAG"
+    assert primitive_root("AAAA") == "A"
+
+
+def test_repeated_representation():
+    motifs = {"#cag": "CAG"}
+    bases = Materializer(motifs).sequence(repeated_moldef("#cag", 2500))
+    assert isinstance(bases, PeriodicSequence)
+    assert len(bases) == 7500
+    assert bases[7499] == "G"
+    assert bases[1:7] == "AGCAGC"
+    assert bases[1001:1007] == PeriodicSequence("GCA", 6)
+
+    with pytest.raises(InvalidCopyCount):
+        Materializer(motifs).sequence(repeated_moldef("#cag", -1))
+
+
+def test_slices_match_expansion():
+    sequence = PeriodicSequence.repeat("GATA", 5)
+    expanded = "GATA" * 5
+    assert list(sequence) == list(expanded)
+    for start in range(len(expanded) + 1):
+        for stop in range(start, len(expanded) + 1):
+            assert sequence[start:stop] == expanded[start:stop]
+    assert sequence[3:17][5:9] == expanded[8:12]
+
+
+@pytest.mark.parametrize(
+    ("first", "second", "equal"),
+    [
+        (PeriodicSequence.repeat("CA", 6), PeriodicSequence.repeat("CACA", 3), True),
+        (PeriodicSequence.repeat("CA", 6), PeriodicSequence("AC", 12, phase=1), True),
+        (PeriodicSequence.repeat("CA", 6), PeriodicSequence.repeat("AC", 6), False),
+        (PeriodicSequence.repeat("CAG", 4), PeriodicSequence.repeat("CAG", 5), False),
+        (PeriodicSequence.repeat("A", 6), PeriodicSequence.repeat("AA", 3), True),
+    ],
+)
+def test_equality_is_arithmetic(first, second, equal):
+    assert (first == second) is equal
+    assert (first == str(second)) is equal
+    if equal:
+        assert hash(first) == hash(second)
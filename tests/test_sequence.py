@@ -60,7 +60,7 @@ def test_present_of_molecularType(valid_sequence, molType):
     data["moleculeType"] = molType
     assert_raises_message(
         InvalidMoleculeTypeError,
-        "The `moleculeType` field must contain exactly one item. `moleculeType` has a 1..1 cardinality for Allele.",
+        "The `moleculeType` field must contain exactly one item. `moleculeType` has a 1..1 cardinality for Sequence.",
         FhirSequence,
         **data,
     )
@@ -0,0 +1,100 @@
+import pickle
+
+import pytest
+
+from profiles.sequence import Sequence as FhirSequence
+from resources.sequenceview import (
+    IUPAC,
+    NUCLEOTIDE,
+    PackedSequence,
+    pack_literal,
+    pack_literals,
+    select_alphabet,
+)
+
+
+@pytest.fixture
+def valid_sequence():
+    return {
+        "resourceType": "MolecularDefinition",
+        "id": "example-sequence-c",
+        "meta": {"profile": ["http://hl7.org/fhir/StructureDefinition/sequence"]},
+        "moleculeType": {
+            "coding": [
+                {
+                    "system": "http://hl7.org/fhir/sequence-type",
+                    "code": "dna",
+                    "display": "DNA Sequence",
+                }
+            ]
+        },
+        "representation": [{"literal": {"value": "GATTACA" * 100}}],
+    }
+
+
+@pytest.mark.parametrize(
+    "alphabet, value",
+    [
+        (NUCLEOTIDE, "ACGTTGCAG"),
+        (IUPAC, "ACGTURYSWKMBDHVNA"),
+        (NUCLEOTIDE, ""),
+    ],
+)
+def test_pack_round_trip(alphabet, value):
+    packed = PackedSequence.pack(value, alphabet)
+    assert len(packed) == len(value)
+    assert str(packed) == value
+    assert packed == value
+    assert hash(packed) == hash(value)
+    assert pickle.loads(pickle.dumps(packed)) == value  # noqa: S301
+
+
+def test_packed_storage_size():
+    assert PackedSequence.pack("ACGT" * 1000, NUCLEOTIDE).nbytes == 1000
+    assert PackedSequence.pack("ACGN" * 1000, IUPAC).nbytes == 2000
+
+
+def test_slicing_shares_buffer():
+    value = "ACGTTGCAGGATTACA"
+    packed = PackedSequence.pack(value, NUCLEOTIDE)
+    for start in range(len(value)):
+        for stop in range(start, len(value) + 1):
+            assert packed[start:stop] == value[start:stop]
+
+    sub = packed[3:11]
+    assert isinstance(sub, PackedSequence)
+    assert sub.data is packed.data
+    assert sub[1:4] == value[4:7]
+    assert packed[-1] == "A"
+    assert packed[::2] == value[::2]
+    with pytest.raises(IndexError):
+        packed[len(value)]
+
+
+def test_pack_rejects_unknown_characters():
+    with pytest.raises(ValueError):
+        PackedSequence.pack("ACGTN", NUCLEOTIDE)
+
+
+def test_select_alphabet():
+    assert select_alphabet(None, "ACGT") is NUCLEOTIDE
+    assert select_alphabet(None, "ACGTN") is IUPAC
+    assert select_alphabet(None, "acgt") is None
+
+
+def test_pack_literals_keeps_model_behaviour(valid_sequence):
+    sequence = FhirSequence(**valid_sequence)
+    unpacked = FhirSequence(**valid_sequence)
+
+    assert pack_literals(sequence) == 1
+    assert isinstance(sequence.representation[0].literal.value, PackedSequence)
+    assert sequence == unpacked
+    assert sequence.model_dump() == unpacked.model_dump()
+    assert sequence.model_dump_json() == unpacked.model_dump_json()
+
+
+def test_pack_literal_skips_short_values(valid_sequence):
+    valid_sequence["representation"][0]["literal"]["value"] = "C"
+    literal = FhirSequence(**valid_sequence).representation[0].literal
+    assert not pack_literal(literal)
+    assert literal.value == "C"
@@ -0,0 +1,42 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from profiles.allele import Allele as FhirAllele
+from resources.moleculardefinition import build_schemas
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+def _run(code: str) -> str:
+    return subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        cwd=SRC,
+        text=True,
+    ).stdout.strip()
+
+
+def test_schemas_are_built_on_first_use():
+    output = _run(
+        "import profiles.allele as allele\n"
+        "print(allele.Allele.__pydantic_complete__)\n"
+        "allele.Allele.model_construct()\n"
+        "allele.Allele.model_json_schema()\n"
+        "print(allele.Allele.__pydantic_complete__)"
+    )
+    assert output.split() == ["False", "True"]
+
+
+def test_build_schemas():
+    output = _run(
+        "import profiles.allele as allele\n"
+        "from resources.moleculardefinition import MolecularDefinition, build_schemas\n"
+        "build_schemas(allele.Allele)\n"
+        "print(allele.Allele.__pydantic_complete__, MolecularDefinition.__pydantic_complete__)"
+    )
+    assert output.split() == ["True", "False"]
+
+    build_schemas(FhirAllele)
+    assert FhirAllele.__pydantic_complete__
@@ -312,3 +312,23 @@ def test_multiple_context_state_globally(valid_fhir_variation):
         FhirVariation,
         **data,
     )
+
+
+def test_representation_slices(valid_fhir_variation):
+    variation = FhirVariation(**valid_fhir_variation)
+    assert variation.slices["alternative-state"].literal.value == "T"
+    assert variation.slices.index("reference-state") == 0
+    assert "context-state" not in variation.slices
+    assert variation.slices.codes == ("reference-state", "alternative-state")
+
+
+def test_slices_follow_copies_and_assignments(valid_fhir_variation):
+    variation = FhirVariation(**valid_fhir_variation)
+    swapped = variation.model_copy(
+        update={"representation": variation.representation[::-1]}
+    )
+    assert swapped.slices.index("reference-state") == 1
+    copy = variation.model_copy(deep=True)
+    assert copy.slices["reference-state"] is copy.representation[0]
+    variation.representation = variation.representation[::-1]
+    assert variation.slices.index("reference-state") == 1